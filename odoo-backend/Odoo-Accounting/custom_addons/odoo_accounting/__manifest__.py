@@ -10,6 +10,8 @@
     'depends': ['base'],
     'data': [
         'security/ir.model.access.csv',
+        'data/ir_sequence_data.xml',
+        'data/ir_cron_data.xml',
         'views/account_tax_views.xml',  # 세금 뷰를 먼저 로드
         'views/menu_views.xml',  # 그 다음 메뉴 뷰
         'views/account_account_views.xml',
@@ -4,6 +4,16 @@ import json
 import logging
 from odoo import fields
 
+from .serializers import (
+    AccountDetailSerializer, AccountSerializer, AssetSerializer, BudgetSerializer, CurrencySerializer,
+    DepreciationLineSerializer, JournalEntrySerializer, MoveLineExportSerializer, PartnerSerializer, TaxReportSerializer, TaxSerializer,
+)
+from .utils import (
+    MAX_BATCH_SIZE, SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT, CacheValidator, decode_cursor, encode_cursor, journal_entry_domain, parse_limit,
+    job_accepted_response, parse_job_params, stream_ndjson, stream_rows_ndjson, wants_ndjson, _parse_date, _parse_ids,
+    _split_values,
+)
+
 _logger = logging.getLogger(__name__)
 
 class AccountingAPI(http.Controller):
@@ -419,26 +429,53 @@ class AccountingAPI(http.Controller):
     
     @http.route('/api/accounting/accounts', type='http', auth='user', methods=['GET'], csrf=False)
     def get_accounts(self, **kwargs):
-        """계정과목 목록 조회"""
+        """계정과목 목록 조회 (fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = AccountSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.account'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.account', [], serializer))
             accounts = request.env['custom.account.account'].sudo().search([])
-            result = []
-            for account in accounts:
-                result.append({
-                    'id': account.id,
-                    'name': account.name,
-                    'code': account.code,
-                    'type': account.type,
-                    'parent_id': account.parent_id.id if account.parent_id else None,
-                    'parent_name': account.parent_id.name if account.parent_id else None,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(accounts.env).serialize(accounts)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting accounts: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
                           content_type='application/json', status=500)
     
+    @http.route('/api/accounting/accounts/tree', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_account_tree(self, **kwargs):
+        """계정과목 계층 구조 조회 (root_id 지정 시 해당 계정 하위 트리)"""
+        try:
+            root_id = None
+            if kwargs.get('root_id'):
+                try:
+                    root_id = int(kwargs['root_id'])
+                except ValueError:
+                    return Response(json.dumps({'success': False, 'error': 'root_id must be an integer'}),
+                                  content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.account'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            Account = request.env['custom.account.account'].sudo()
+            if root_id and not Account.browse(root_id).exists():
+                return Response(json.dumps({'success': False, 'error': 'Account not found'}),
+                              content_type='application/json', status=404)
+            response = Response(json.dumps({'success': True, 'data': Account.get_tree(root_id)}),
+                                content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting account tree: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}),
+                          content_type='application/json', status=500)
+    
     @http.route('/api/accounting/accounts', type='http', auth='user', methods=['POST'], csrf=False)
     def create_account(self, **kwargs):
         """계정과목 생성"""
@@ -449,6 +486,7 @@ class AccountingAPI(http.Controller):
                 'code': data.get('code'),
                 'type': data.get('type'),
                 'parent_id': data.get('parent_id'),
+                'tax_ids': [(6, 0, data.get('tax_ids') or [])],
             })
             return Response(json.dumps({
                 'success': True, 
@@ -468,21 +506,23 @@ class AccountingAPI(http.Controller):
     def get_account(self, account_id, **kwargs):
         """특정 계정과목 조회"""
         try:
+            try:
+                serializer = AccountDetailSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}),
+                              content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.account'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
             account = request.env['custom.account.account'].sudo().browse(account_id)
             if not account.exists():
                 return Response(json.dumps({'success': False, 'error': 'Account not found'}), 
                               content_type='application/json', status=404)
             
-            result = {
-                'id': account.id,
-                'name': account.name,
-                'code': account.code,
-                'type': account.type,
-                'parent_id': account.parent_id.id if account.parent_id else None,
-                'child_ids': [child.id for child in account.child_ids],
-            }
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(account.env).serialize(account)[0]
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting account {account_id}: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -498,12 +538,15 @@ class AccountingAPI(http.Controller):
                 return Response(json.dumps({'success': False, 'error': 'Account not found'}), 
                               content_type='application/json', status=404)
             
-            account.write({
+            vals = {
                 'name': data.get('name', account.name),
                 'code': data.get('code', account.code),
                 'type': data.get('type', account.type),
                 'parent_id': data.get('parent_id', account.parent_id.id),
-            })
+            }
+            if 'tax_ids' in data:
+                vals['tax_ids'] = [(6, 0, data['tax_ids'] or [])]
+            account.write(vals)
             
             return Response(json.dumps({'success': True, 'message': 'Account updated successfully'}), 
                           content_type='application/json')
@@ -533,35 +576,39 @@ class AccountingAPI(http.Controller):
     
     @http.route('/api/accounting/journal-entries', type='http', auth='user', methods=['GET'], csrf=False)
     def get_journal_entries(self, **kwargs):
-        """분개장 목록 조회"""
+        """분개장 목록 조회 (서버측 필터 + date, id 기준 키셋 페이지네이션)
+
+        fields= 로 컬럼을 지정하면 분개 라인은 include=lines 일 때만 포함된다.
+        """
         try:
-            entries = request.env['custom.account.move'].sudo().search([])
-            result = []
-            for entry in entries:
-                lines = []
-                for line in entry.line_ids:
-                    lines.append({
-                        'id': line.id,
-                        'account_id': line.account_id.id if line.account_id else None,
-                        'account_code': line.account_id.code if line.account_id else '',
-                        'account_name': line.account_id.name if line.account_id else '',
-                        'partner_id': line.partner_id.id if line.partner_id else None,
-                        'partner_code': line.partner_id.code if hasattr(line.partner_id, 'code') and line.partner_id else '',
-                        'partner_name': line.partner_id.name if line.partner_id else '',
-                        'debit': line.debit,
-                        'credit': line.credit,
-                        'name': line.name,
-                    })
-                result.append({
-                    'id': entry.id,
-                    'name': entry.name,
-                    'date': entry.date.strftime('%Y-%m-%d') if entry.date else None,
-                    'ref': entry.ref,
-                    'state': entry.state,
-                    'amount_total': entry.amount_total,
-                    'lines': lines,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+            try:
+                serializer = JournalEntrySerializer.from_params(kwargs)
+                limit = parse_limit(kwargs.get('limit'))
+                domain = journal_entry_domain(kwargs)
+                if kwargs.get('cursor'):
+                    cursor_date, cursor_id = decode_cursor(kwargs['cursor'], fields.Date.to_date, int)
+                    domain += ['|', ('date', '<', cursor_date),
+                               '&', ('date', '=', cursor_date), ('id', '<', cursor_id)]
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account', 'custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                # 전체 내보내기: 커서/limit 없이 id 순으로 스트리밍
+                return validator.apply(stream_ndjson('custom.account.move', journal_entry_domain(kwargs), serializer))
+
+            # 다음 페이지 존재 여부 확인을 위해 limit + 1건 조회
+            entries = request.env['custom.account.move'].sudo().search(domain, order='date desc, id desc', limit=limit + 1)
+            next_cursor = None
+            if len(entries) > limit:
+                entries = entries[:limit]
+                last = entries[-1]
+                next_cursor = encode_cursor(fields.Date.to_string(last.date), last.id)
+            result = serializer(entries.env).serialize(entries)
+            response = Response(json.dumps({'success': True, 'data': result, 'next_cursor': next_cursor}), content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting journal entries: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
@@ -570,13 +617,7 @@ class AccountingAPI(http.Controller):
     def create_journal_entry(self, **kwargs):
         try:
             data = json.loads(request.httprequest.data.decode('utf-8'))
-            journal = request.env['custom.account.journal'].sudo().search([], limit=1)
-            if not journal:
-                journal = request.env['custom.account.journal'].sudo().create({
-                    'name': 'General Journal',
-                    'code': 'GEN',
-                    'type': 'general',
-                })
+            journal = request.env['custom.account.move'].sudo()._get_default_journal()
             lines = []
             # lines 또는 line_ids 둘 다 지원
             input_lines = data.get('lines', data.get('line_ids', []))
@@ -601,6 +642,35 @@ class AccountingAPI(http.Controller):
             _logger.error(f"Error creating journal entry: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
     
+    @http.route('/api/accounting/journal-entries/batch', type='http', auth='user', methods=['POST'], csrf=False)
+    def create_journal_entries_batch(self, **kwargs):
+        """분개장 일괄 생성 (배열 또는 {"entries": [...]}, 항목별 id/오류 반환)"""
+        try:
+            data = json.loads(request.httprequest.data.decode('utf-8'))
+            entries = data.get('entries') if isinstance(data, dict) else data
+            if not isinstance(entries, list):
+                return Response(json.dumps({'success': False, 'error': 'entries must be an array'}),
+                              content_type='application/json', status=400)
+            if len(entries) > MAX_BATCH_SIZE:
+                return Response(json.dumps({'success': False, 'error': f'at most {MAX_BATCH_SIZE} entries per request'}),
+                              content_type='application/json', status=400)
+            results = request.env['custom.account.move'].sudo().create_batch(entries)
+            failed = sum(1 for result in results if 'error' in result)
+            return Response(json.dumps({
+                'success': failed == 0,
+                'data': {
+                    'created': len(results) - failed,
+                    'failed': failed,
+                    'results': results,
+                }
+            }), content_type='application/json')
+        except ValueError as e:
+            return Response(json.dumps({'success': False, 'error': f'Invalid JSON: {str(e)}'}),
+                          content_type='application/json', status=400)
+        except Exception as e:
+            _logger.error(f"Error creating journal entries batch: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
     @http.route('/api/accounting/journal-entries/<int:entry_id>', type='http', auth='user', methods=['DELETE'], csrf=False)
     def delete_journal_entry(self, entry_id, **kwargs):
         try:
@@ -613,32 +683,194 @@ class AccountingAPI(http.Controller):
         except Exception as e:
             return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
     
+    @http.route('/api/accounting/move-lines', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_move_lines(self, **kwargs):
+        """분개 라인 목록 조회 (id 기준 키셋 페이지네이션, format=ndjson 스트리밍 지원)"""
+        try:
+            try:
+                # 분개장 필터를 라인 기준(move_id.*)으로 변환
+                domain = []
+                for leaf in journal_entry_domain(kwargs):
+                    if isinstance(leaf, tuple):
+                        name = leaf[0][len('line_ids.'):] if leaf[0].startswith('line_ids.') else f'move_id.{leaf[0]}'
+                        leaf = (name, leaf[1], leaf[2])
+                    domain.append(leaf)
+                serializer = MoveLineExportSerializer.from_params(kwargs)
+                limit = parse_limit(kwargs.get('limit'))
+                cursor_id = decode_cursor(kwargs['cursor'], int)[0] if kwargs.get('cursor') else 0
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account', 'custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.move.line', domain, serializer))
+
+            lines = request.env['custom.account.move.line'].sudo().search(
+                domain + [('id', '>', cursor_id)], order='id', limit=limit + 1)
+            next_cursor = None
+            if len(lines) > limit:
+                lines = lines[:limit]
+                next_cursor = encode_cursor(lines[-1].id)
+            result = serializer(lines.env).serialize(lines)
+            response = Response(json.dumps({'success': True, 'data': result, 'next_cursor': next_cursor}), content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting move lines: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    # ==================== Account Balance API ====================
+    
+    @http.route('/api/accounting/balances', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_balances(self, **kwargs):
+        """계정별 잔액 조회 (date_to 시점, 월별 사전 집계 테이블 사용)"""
+        try:
+            try:
+                date_to = _parse_date(kwargs['date_to'], 'date_to') if kwargs.get('date_to') else fields.Date.to_string(fields.Date.today())
+                states = _split_values(kwargs['state']) if kwargs.get('state') else ['posted']
+                account_ids = _parse_ids(kwargs['account_id'], 'account_id') if kwargs.get('account_id') else None
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            balances = request.env['custom.account.balance'].sudo().get_balances(date_to, states, account_ids)
+            accounts = request.env['custom.account.account'].sudo().browse(list(balances)).read(['code', 'name'])
+            result = [{
+                'account_id': account['id'],
+                'account_code': account['code'],
+                'account_name': account['name'],
+                **balances[account['id']],
+            } for account in accounts]
+            response = Response(json.dumps({'success': True, 'data': result, 'date_to': date_to}), content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting balances: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/balances/rebuild', type='http', auth='user', methods=['POST'], csrf=False)
+    def rebuild_balances(self, **kwargs):
+        """잔액 테이블 전체 재집계 (백그라운드 작업)"""
+        try:
+            return job_accepted_response(request.env['custom.account.job'].sudo().enqueue('balance_rebuild'))
+        except Exception as e:
+            _logger.error(f"Error rebuilding balances: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    # ==================== Import API ====================
+    
+    @http.route('/api/accounting/imports', type='http', auth='user', methods=['POST'], csrf=False)
+    def create_import(self, **kwargs):
+        """CSV/XLSX 파일 분개 가져오기 (multipart: file, delimiter, column_mapping; 백그라운드 작업)"""
+        try:
+            upload = request.httprequest.files.get('file')
+            if not upload or not upload.filename:
+                return Response(json.dumps({'success': False, 'error': 'file is required'}),
+                              content_type='application/json', status=400)
+            extension = upload.filename.rsplit('.', 1)[-1].lower()
+            if extension not in ('csv', 'xlsx'):
+                return Response(json.dumps({'success': False, 'error': 'Only .csv and .xlsx files are supported'}),
+                              content_type='application/json', status=400)
+            if kwargs.get('column_mapping'):
+                try:
+                    json.loads(kwargs['column_mapping'])
+                except ValueError:
+                    return Response(json.dumps({'success': False, 'error': 'column_mapping must be valid JSON'}),
+                                  content_type='application/json', status=400)
+
+            job = request.env['custom.account.import'].sudo().create({
+                'name': kwargs.get('name') or upload.filename,
+                'file_name': upload.filename,
+                'file_type': extension,
+                'delimiter': kwargs.get('delimiter') or ',',
+                'column_mapping': kwargs.get('column_mapping'),
+            })
+            job.save_file(upload.stream)
+            return job_accepted_response(request.env['custom.account.job'].sudo().enqueue(
+                'import', {'import_id': job.id}, name=f'Import {upload.filename}'))
+        except Exception as e:
+            _logger.error(f"Error importing file: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/imports/<int:import_id>', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_import(self, import_id, **kwargs):
+        """가져오기 진행 상황/오류 조회"""
+        try:
+            job = request.env['custom.account.import'].sudo().browse(import_id)
+            if not job.exists():
+                return Response(json.dumps({'success': False, 'error': 'Import not found'}),
+                              content_type='application/json', status=404)
+            return Response(json.dumps({'success': True, 'data': job.get_status()}), content_type='application/json')
+        except Exception as e:
+            _logger.error(f"Error getting import {import_id}: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/imports/<int:import_id>/resume', type='http', auth='user', methods=['POST'], csrf=False)
+    def resume_import(self, import_id, **kwargs):
+        """실패한 가져오기를 마지막 처리 행 다음부터 재개"""
+        try:
+            job = request.env['custom.account.import'].sudo().browse(import_id)
+            if not job.exists():
+                return Response(json.dumps({'success': False, 'error': 'Import not found'}),
+                              content_type='application/json', status=404)
+            if job.state != 'failed':
+                return Response(json.dumps({'success': False, 'error': 'Only failed imports can be resumed'}),
+                              content_type='application/json', status=400)
+            return job_accepted_response(request.env['custom.account.job'].sudo().enqueue(
+                'import', {'import_id': job.id}, name=f'Import {job.file_name}'))
+        except Exception as e:
+            _logger.error(f"Error resuming import {import_id}: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
     # ==================== Partners API ====================
     
     @http.route('/api/accounting/partners', type='http', auth='user', methods=['GET'], csrf=False)
     def get_partners(self, **kwargs):
-        """거래처 목록 조회 (활성/비활성 모두 포함)"""
+        """거래처 목록 조회 (활성/비활성 모두 포함, fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = PartnerSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.partner', [], serializer,
+                                                     context={'active_test': False}))
             # active=False인 거래처들도 포함하여 모든 거래처 조회
             partners = request.env['custom.account.partner'].sudo().with_context(active_test=False).search([])
-            result = []
-            for partner in partners:
-                result.append({
-                    'id': partner.id,
-                    'name': partner.name,
-                    'code': partner.code,
-                    'type': partner.type,
-                    'email': partner.email,
-                    'phone': partner.phone,
-                    'active': partner.active,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(partners.env).serialize(partners)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting partners: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
                           content_type='application/json', status=500)
     
+    @http.route('/api/accounting/partners/search', type='http', auth='user', methods=['GET'], csrf=False)
+    def search_partners(self, **kwargs):
+        """거래처 자동완성 검색 (q: 이름/코드/사업자번호/이메일, type, include_inactive, limit)"""
+        try:
+            try:
+                limit = parse_limit(kwargs.get('limit'), default=SEARCH_DEFAULT_LIMIT, maximum=SEARCH_MAX_LIMIT)
+                partner_types = _split_values(kwargs['type']) if kwargs.get('type') else None
+                if partner_types and not set(partner_types) <= {'customer', 'supplier', 'both'}:
+                    raise ValueError('type must be customer, supplier or both')
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            include_inactive = kwargs.get('include_inactive') in ('1', 'true', 'True')
+            result = request.env['custom.account.partner'].sudo().search_autocomplete(
+                kwargs.get('q'), limit, partner_types, include_inactive)
+            return Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+        except Exception as e:
+            _logger.error(f"Error searching partners: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}),
+                          content_type='application/json', status=500)
+    
     @http.route('/api/accounting/partners', type='http', auth='user', methods=['POST'], csrf=False)
     def create_partner(self, **kwargs):
         """거래처 생성"""
@@ -670,23 +902,24 @@ class AccountingAPI(http.Controller):
     def get_partner(self, partner_id, **kwargs):
         """특정 거래처 조회 (활성/비활성 모두 조회 가능)"""
         try:
+            try:
+                serializer = PartnerSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}),
+                              content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
             # active=False인 거래처도 조회할 수 있도록 with_context 사용
             partner = request.env['custom.account.partner'].sudo().with_context(active_test=False).browse(partner_id)
             if not partner.exists():
                 return Response(json.dumps({'success': False, 'error': '거래처를 찾을 수 없습니다.'}), 
                               content_type='application/json', status=404)
             
-            result = {
-                'id': partner.id,
-                'name': partner.name,
-                'code': partner.code,
-                'type': partner.type,
-                'email': partner.email,
-                'phone': partner.phone,
-                'active': partner.active,
-            }
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(partner.env).serialize(partner)[0]
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting partner {partner_id}: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -759,29 +992,23 @@ class AccountingAPI(http.Controller):
     
     @http.route('/api/accounting/assets', type='http', auth='user', methods=['GET'], csrf=False)
     def get_assets(self, **kwargs):
-        """고정자산 목록 조회"""
+        """고정자산 목록 조회 (fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = AssetSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            # 장부가액/감가상각누계액은 감가상각 내역에서 계산되므로 함께 검증
+            validator = CacheValidator(request.env, ['custom.account.asset', 'custom.account.asset.depreciation.line'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.asset', [], serializer))
             assets = request.env['custom.account.asset'].sudo().search([])
-            result = []
-            for asset in assets:
-                # 감가상각방법 한글 변환
-                if asset.depreciation_method == 'linear':
-                    depreciation_method_kr = '정액법'
-                elif asset.depreciation_method == 'degressive':
-                    depreciation_method_kr = '정률법'
-                else:
-                    depreciation_method_kr = asset.depreciation_method
-                result.append({
-                    'id': asset.id,
-                    'name': asset.name,
-                    'code': asset.code,
-                    'purchase_date': asset.purchase_date.strftime('%Y-%m-%d') if asset.purchase_date else None,
-                    'purchase_value': asset.value,
-                    'current_value': asset.value,
-                    'depreciation_method': depreciation_method_kr,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(assets.env).serialize(assets)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting assets: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -816,17 +1043,9 @@ class AccountingAPI(http.Controller):
             if not depreciation_method:
                 return Response(json.dumps({'success': False, 'error': '필수 필드 누락: depreciation_method'}), content_type='application/json', status=400)
 
-            # 코드 자동증가(시퀀스) 처리
-            last_asset = request.env['custom.account.asset'].sudo().search([], order='id desc', limit=1)
-            if last_asset and last_asset.code and last_asset.code.isdigit():
-                next_code = str(int(last_asset.code) + 1).zfill(5)
-            else:
-                next_code = '00001'
-
             # Odoo 모델 필드명 매핑
             asset_vals = {
                 'name': name,
-                'code': next_code,
                 'purchase_date': purchase_date,
                 'value': purchase_value,  # value 필드에만 저장
                 'depreciation_method': 'linear' if depreciation_method == '정액법' else 'degressive',
@@ -891,10 +1110,9 @@ class AccountingAPI(http.Controller):
     
     @http.route('/api/accounting/assets/depreciate', type='json', auth='user', methods=['POST'], csrf=False)
     def depreciate_assets(self, **kwargs):
-        """감가상각 자동 계산 및 회계 반영 API (정액법/정률법, 취득일/내용연수/실행일/월단위 감가상각)"""
+        """감가상각 스케줄 계산 API (정액법/정률법, mode=full|compact|current, date=기준일)"""
         try:
             import json
-            from dateutil.relativedelta import relativedelta
             # POST body 파싱 보완
             if kwargs:
                 data = kwargs
@@ -907,79 +1125,14 @@ class AccountingAPI(http.Controller):
                     data = {}
             else:
                 data = {}
-            asset_ids = data.get('asset_ids', [])
-            results = []
-            Asset = request.env['custom.account.asset'].sudo()
-            today = fields.Date.today()
-            for idx, asset_id in enumerate(asset_ids):
-                asset = Asset.browse(asset_id)
-                if not asset.exists():
-                    continue
-                purchase_value = asset.value or 0
-                useful_life = asset.useful_life or 1
-                residual_value = asset.residual_value or 0
-                depreciation_method = asset.depreciation_method
-                purchase_date = asset.purchase_date
-                accumulated_depr = 0  # 실제 누적감가상각은 별도 관리 필요, 여기선 0으로 가정
-
-                if not purchase_date or purchase_date > today:
-                    results.append({
-                        'asset_id': asset_id,
-                        'depreciation_amount': 0,
-                        'date': today.strftime('%Y-%m-%d'),
-                        'journal_entry': None,
-                        'reason': "취득일이 미래이거나 없음",
-                        'useful_life': useful_life
-                    })
-                    continue
-
-                # 감가상각 종료일 계산
-                end_date = purchase_date + relativedelta(years=useful_life)
-                if today < purchase_date or today > end_date:
-                    results.append({
-                        'asset_id': asset_id,
-                        'depreciation_amount': 0,
-                        'date': today.strftime('%Y-%m-%d'),
-                        'journal_entry': None,
-                        'reason': "감가상각 기간 아님",
-                        'useful_life': useful_life
-                    })
-                    continue
-
-                # 월 단위 감가상각: 취득일~오늘까지 경과한 월수 계산
-                months_passed = (today.year - purchase_date.year) * 12 + (today.month - purchase_date.month)
-                total_months = useful_life * 12
-                months_to_depreciate = min(months_passed + 1, total_months)  # +1: 이번달 포함
-
-                # 감가상각금액(월)
-                if depreciation_method == 'linear':
-                    monthly_amount = (purchase_value - residual_value) / total_months
-                elif depreciation_method == 'degressive':
-                    rate = 1.0 / useful_life
-                    monthly_amount = ((purchase_value - accumulated_depr) * rate) / 12
-                else:
-                    monthly_amount = 0
-
-                monthly_amount = max(0, round(monthly_amount, 2))
-
-                # 각 월별 감가상각 결과 반환
-                for m in range(months_to_depreciate):
-                    dep_date = (purchase_date + relativedelta(months=m)).strftime('%Y-%m-%d')
-                    journal_ref = f"JV{dep_date.replace('-', '')}-{str(idx+1).zfill(3)}"
-                    results.append({
-                        'asset_id': asset_id,
-                        'depreciation_amount': monthly_amount,
-                        'date': dep_date,
-                        'journal_entry': {
-                            'ref': journal_ref,
-                            'lines': [
-                                { 'account_name': '감가상각비', 'debit': monthly_amount, 'credit': 0 },
-                                { 'account_name': '감가상각누계액', 'debit': 0, 'credit': monthly_amount }
-                            ]
-                        },
-                        'reason': f"{m+1}회차 감가상각",
-                        'useful_life': useful_life
-                    })
+            mode = data.get('mode') or 'full'
+            if mode not in ('full', 'compact', 'current'):
+                return {'success': False, 'error': 'mode must be one of full, compact, current'}
+            asset_ids = data.get('asset_ids')
+            if not asset_ids:
+                return {'success': False, 'error': 'asset_ids is required'}
+            results = request.env['custom.account.asset'].sudo().compute_depreciation(
+                asset_ids, mode=mode, as_of=data.get('date'))
             return {
                 'success': True,
                 'data': results
@@ -991,26 +1144,60 @@ class AccountingAPI(http.Controller):
                 'error': str(e)
             }
     
+    @http.route('/api/accounting/assets/depreciation/run', type='http', auth='user', methods=['POST'], csrf=False)
+    def run_depreciation(self, **kwargs):
+        """월말 감가상각 결산 (백그라운드 작업, 202 + job_id 반환)"""
+        try:
+            data = json.loads(request.httprequest.data.decode('utf-8')) if request.httprequest.data else {}
+            try:
+                params = parse_job_params('depreciation_run', {
+                    'period_date': data.get('date') or None,
+                    'asset_ids': data.get('asset_ids'),
+                    'post_moves': bool(data.get('post_moves')),
+                })
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            job = request.env['custom.account.job'].sudo().enqueue('depreciation_run', params)
+            return job_accepted_response(job)
+        except Exception as e:
+            _logger.error(f"Error running depreciation: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/assets/<int:asset_id>/depreciation-lines', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_depreciation_lines(self, asset_id, **kwargs):
+        """자산별 감가상각 내역 조회"""
+        try:
+            asset = request.env['custom.account.asset'].sudo().browse(asset_id)
+            if not asset.exists():
+                return Response(json.dumps({'success': False, 'error': 'Asset not found'}),
+                              content_type='application/json', status=404)
+            lines = asset.depreciation_line_ids
+            result = DepreciationLineSerializer(lines.env).serialize(lines)
+            return Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+        except Exception as e:
+            _logger.error(f"Error getting depreciation lines for asset {asset_id}: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
     # ==================== Budget API ====================
     
     @http.route('/api/accounting/budgets', type='http', auth='user', methods=['GET'], csrf=False)
     def get_budgets(self, **kwargs):
-        """예산 목록 조회"""
+        """예산 목록 조회 (fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = BudgetSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.budget', 'custom.account.account', 'custom.account.move', 'custom.account.move.line'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.budget', [], serializer))
             budgets = request.env['custom.account.budget'].sudo().search([])
-            result = []
-            for budget in budgets:
-                result.append({
-                    'id': budget.id,
-                    'name': budget.name,
-                    'fiscal_year': budget.fiscal_year,
-                    'amount': budget.amount,
-                    'spent_amount': budget.spent_amount,
-                    'remaining_amount': budget.remaining_amount,
-                    'state': budget.state,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(budgets.env).serialize(budgets)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting budgets: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -1020,21 +1207,22 @@ class AccountingAPI(http.Controller):
     
     @http.route('/api/accounting/currencies', type='http', auth='user', methods=['GET'], csrf=False)
     def get_currencies(self, **kwargs):
-        """통화 목록 조회"""
+        """통화 목록 조회 (fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = CurrencySerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.currency'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.currency', [], serializer))
             currencies = request.env['custom.account.currency'].sudo().search([])
-            result = []
-            for currency in currencies:
-                result.append({
-                    'id': currency.id,
-                    'name': currency.name,
-                    'code': currency.code,
-                    'symbol': currency.symbol,
-                    'rate': currency.rate,
-                    'active': currency.active,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(currencies.env).serialize(currencies)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting currencies: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -1044,39 +1232,22 @@ class AccountingAPI(http.Controller):
     
     @http.route('/api/accounting/taxes', type='http', auth='user', methods=['GET'], csrf=False)
     def get_taxes(self, **kwargs):
-        """세금 목록 조회"""
+        """세금 목록 조회 (fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = TaxSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.tax', 'custom.account.account', 'custom.account.tax.group'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.tax', [], serializer))
             taxes = request.env['custom.account.tax'].sudo().search([])
-            result = []
-            for tax in taxes:
-                result.append({
-                    'id': tax.id,
-                    'name': tax.name,
-                    'code': tax.code,
-                    'rate': tax.amount,
-                    'type': tax.type_tax_use,
-                    'active': tax.active,
-                    'description': tax.description,
-                    'effective_date': tax.effective_date.strftime('%Y-%m-%d') if tax.effective_date else None,
-                    'expiry_date': tax.expiry_date.strftime('%Y-%m-%d') if tax.expiry_date else None,
-                    'created_at': tax.created_at.strftime('%Y-%m-%d %H:%M:%S') if tax.created_at else None,
-                    'updated_at': tax.updated_at.strftime('%Y-%m-%d %H:%M:%S') if tax.updated_at else None,
-                    # 추가 정보 (필요시 사용)
-                    'amount_type': tax.amount_type,
-                    'tax_category': tax.tax_category,
-                    'calculation_method': tax.calculation_method,
-                    'is_exempt': tax.is_exempt,
-                    'exempt_reason': tax.exempt_reason,
-                    'account_id': tax.account_id.id if tax.account_id else None,
-                    'account_name': tax.account_id.name if tax.account_id else '',
-                    'refund_account_id': tax.refund_account_id.id if tax.refund_account_id else None,
-                    'refund_account_name': tax.refund_account_id.name if tax.refund_account_id else '',
-                    'tax_group_id': tax.tax_group_id.id if tax.tax_group_id else None,
-                    'tax_group_name': tax.tax_group_id.name if tax.tax_group_id else '',
-                    'report_frequency': tax.report_frequency,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(taxes.env).serialize(taxes)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting taxes: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -1144,39 +1315,23 @@ class AccountingAPI(http.Controller):
     def get_tax(self, tax_id, **kwargs):
         """특정 세금 조회"""
         try:
+            try:
+                serializer = TaxSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}),
+                              content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.tax', 'custom.account.account', 'custom.account.tax.group'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
             tax = request.env['custom.account.tax'].sudo().browse(tax_id)
             if not tax.exists():
                 return Response(json.dumps({'success': False, 'error': 'Tax not found'}), 
                               content_type='application/json', status=404)
             
-            result = {
-                'id': tax.id,
-                'name': tax.name,
-                'code': tax.code,
-                'rate': tax.amount,
-                'type': tax.type_tax_use,
-                'active': tax.active,
-                'description': tax.description,
-                'effective_date': tax.effective_date.strftime('%Y-%m-%d') if tax.effective_date else None,
-                'expiry_date': tax.expiry_date.strftime('%Y-%m-%d') if tax.expiry_date else None,
-                'created_at': tax.created_at.strftime('%Y-%m-%d %H:%M:%S') if tax.created_at else None,
-                'updated_at': tax.updated_at.strftime('%Y-%m-%d %H:%M:%S') if tax.updated_at else None,
-                # 추가 정보 (필요시 사용)
-                'amount_type': tax.amount_type,
-                'tax_category': tax.tax_category,
-                'calculation_method': tax.calculation_method,
-                'is_exempt': tax.is_exempt,
-                'exempt_reason': tax.exempt_reason,
-                'account_id': tax.account_id.id if tax.account_id else None,
-                'account_name': tax.account_id.name if tax.account_id else '',
-                'refund_account_id': tax.refund_account_id.id if tax.refund_account_id else None,
-                'refund_account_name': tax.refund_account_id.name if tax.refund_account_id else '',
-                'tax_group_id': tax.tax_group_id.id if tax.tax_group_id else None,
-                'tax_group_name': tax.tax_group_id.name if tax.tax_group_id else '',
-                'report_frequency': tax.report_frequency,
-            }
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(tax.env).serialize(tax)[0]
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting tax {tax_id}: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -1269,14 +1424,15 @@ class AccountingAPI(http.Controller):
             tax_id = data.get('tax_id')
             base_amount = data.get('base_amount', 0.0)
             price_unit = data.get('price_unit', 0.0)
-            quantity = data.get('quantity', 1.0)
+            quantity = 1.0 if data.get('quantity') is None else data['quantity']
             
             if not tax_id:
                 return Response(json.dumps({'success': False, 'error': 'Tax ID is required'}), 
                               content_type='application/json', status=400)
             
-            tax = request.env['custom.account.tax'].sudo().browse(tax_id)
-            if not tax.exists():
+            tax = request.env['custom.account.tax'].sudo().browse(int(tax_id))
+            params = tax._get_cached_tax_params(tax.id)
+            if params is None:
                 return Response(json.dumps({'success': False, 'error': 'Tax not found'}), 
                               content_type='application/json', status=404)
             
@@ -1289,8 +1445,8 @@ class AccountingAPI(http.Controller):
                     'base_amount': base_amount,
                     'tax_amount': result['tax'],
                     'total_amount': result['total'],
-                    'calculation_method': tax.calculation_method,
-                    'tax_rate': tax.amount,
+                    'calculation_method': 'inclusive' if params.inclusive else 'exclusive',
+                    'tax_rate': params.rate,
                 }
             }), content_type='application/json')
         except Exception as e:
@@ -1298,45 +1454,101 @@ class AccountingAPI(http.Controller):
             return Response(json.dumps({'success': False, 'error': str(e)}), 
                                                      content_type='application/json', status=500)
     
+    @http.route('/api/accounting/taxes/compute-batch', type='http', auth='user', methods=['POST'], csrf=False)
+    def compute_tax_batch(self, **kwargs):
+        """세금 일괄 계산 (라인별 base_amount/quantity/tax_ids, 세금별 소계 포함)"""
+        try:
+            data = json.loads(request.httprequest.data.decode('utf-8'))
+            lines = data.get('lines') if isinstance(data, dict) else data
+            if not isinstance(lines, list):
+                return Response(json.dumps({'success': False, 'error': 'lines must be an array'}),
+                              content_type='application/json', status=400)
+            if len(lines) > MAX_BATCH_SIZE:
+                return Response(json.dumps({'success': False, 'error': f'at most {MAX_BATCH_SIZE} lines per request'}),
+                              content_type='application/json', status=400)
+            tax_ids = set()
+            for line in lines:
+                if not isinstance(line, dict) or not isinstance(line.get('tax_ids') or [], list):
+                    return Response(json.dumps({'success': False, 'error': 'each line must be an object with a tax_ids array'}),
+                                  content_type='application/json', status=400)
+                tax_ids.update(int(tax_id) for tax_id in line.get('tax_ids') or [])
+            
+            taxes = request.env['custom.account.tax'].sudo()
+            missing = tax_ids - set(taxes._get_tax_params(tax_ids))
+            if missing:
+                return Response(json.dumps({'success': False, 'error': f'Tax not found: {sorted(missing)}'}),
+                              content_type='application/json', status=404)
+            
+            return Response(json.dumps({
+                'success': True,
+                'data': taxes.compute_all_batch(lines),
+            }), content_type='application/json')
+        except (TypeError, ValueError) as e:
+            return Response(json.dumps({'success': False, 'error': f'Invalid request: {str(e)}'}),
+                          content_type='application/json', status=400)
+        except Exception as e:
+            _logger.error(f"Error computing tax batch: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}),
+                          content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/tax-balances', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_tax_balances(self, **kwargs):
+        """기간 부가세 누계 조회 (기본: 이번 분기 시작 ~ 오늘, 세금별/월별 누계 테이블 사용)"""
+        try:
+            try:
+                date_to = _parse_date(kwargs['date_to'], 'date_to') if kwargs.get('date_to') else None
+                date_from = _parse_date(kwargs['date_from'], 'date_from') if kwargs.get('date_from') else None
+                tax_ids = _parse_ids(kwargs['tax_id'], 'tax_id') if kwargs.get('tax_id') else None
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line',
+                                                     'custom.account.account', 'custom.account.tax'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            TaxBalance = request.env['custom.account.tax.balance'].sudo()
+            if date_from:
+                date_to = date_to or fields.Date.to_string(fields.Date.today())
+                result = {'date_from': date_from, 'date_to': date_to,
+                          **TaxBalance.get_totals(date_from, date_to, tax_ids)}
+            else:
+                result = TaxBalance.get_quarter_to_date(date_to, tax_ids)
+            result['vat_payable'] = result['sale_vat_amount'] - result['purchase_vat_amount'] - result['withholding_amount']
+            response = Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting tax balances: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/tax-balances/rebuild', type='http', auth='user', methods=['POST'], csrf=False)
+    def rebuild_tax_balances(self, **kwargs):
+        """세금별/월별 누계 전체 재집계 (백그라운드 작업)"""
+        try:
+            return job_accepted_response(request.env['custom.account.job'].sudo().enqueue('tax_balance_rebuild'))
+        except Exception as e:
+            _logger.error(f"Error rebuilding tax balances: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
     # ==================== Tax Reports API ====================
     
     @http.route('/api/accounting/tax-reports', type='http', auth='user', methods=['GET'], csrf=False)
     def get_tax_reports(self, **kwargs):
-        """세금 신고서 목록 조회"""
+        """세금 신고서 목록 조회 (fields= 컬럼 선택, format=ndjson 스트리밍 지원)"""
         try:
+            try:
+                serializer = TaxReportSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.tax.report', 'custom.account.tax.period', 'custom.account.tax'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_ndjson('custom.account.tax.report', [], serializer))
             reports = request.env['custom.account.tax.report'].sudo().search([])
-            result = []
-            for report in reports:
-                # 선택된 세금들의 이름 목록
-                selected_taxes = []
-                if report.tax_ids:
-                    selected_taxes = [tax.name for tax in report.tax_ids]
-                
-                result.append({
-                    'id': report.id,
-                    'name': report.name,
-                    'date': report.date.strftime('%Y-%m-%d') if report.date else None,
-                    'period_start': report.period_start.strftime('%Y-%m-%d') if report.period_start else None,
-                    'period_end': report.period_end.strftime('%Y-%m-%d') if report.period_end else None,
-                    'tax_period_name': report.tax_period_id.name if report.tax_period_id else '',
-                    'report_type': report.report_type,
-                    'additional_period': report.additional_period,
-                    'tax_ids': [tax.id for tax in report.tax_ids] if report.tax_ids else [],
-                    'state': report.state,
-                    'sale_vat_amount': report.sale_vat_amount,
-                    'purchase_vat_amount': report.purchase_vat_amount,
-                    'vat_payable': report.vat_payable,
-                    'exempt_amount': report.exempt_amount,
-                    'zero_rated_amount': report.zero_rated_amount,
-                    'withholding_amount': report.withholding_amount,
-                    'notes': report.notes or False,
-                    'tax_period_id': report.tax_period_id.id if report.tax_period_id else None,
-                    'selected_taxes': selected_taxes,
-                    'created_at': report.create_date.strftime('%Y-%m-%dT%H:%M:%SZ') if report.create_date else None,
-                    'submitted_at': report.submitted_at.strftime('%Y-%m-%dT%H:%M:%SZ') if report.submitted_at else None,
-                })
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(reports.env).serialize(reports)
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting tax reports: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -1429,36 +1641,23 @@ class AccountingAPI(http.Controller):
     def get_tax_report(self, report_id, **kwargs):
         """특정 세금 신고서 조회"""
         try:
+            try:
+                serializer = TaxReportSerializer.from_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}),
+                              content_type='application/json', status=400)
+            validator = CacheValidator(request.env, ['custom.account.tax.report', 'custom.account.tax.period', 'custom.account.tax'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
             report = request.env['custom.account.tax.report'].sudo().browse(report_id)
             if not report.exists():
                 return Response(json.dumps({'success': False, 'error': 'Tax report not found'}), 
                               content_type='application/json', status=404)
             
-            result = {
-                'id': report.id,
-                'name': report.name,
-                'date': report.date.strftime('%Y-%m-%d') if report.date else None,
-                'period_start': report.period_start.strftime('%Y-%m-%d') if report.period_start else None,
-                'period_end': report.period_end.strftime('%Y-%m-%d') if report.period_end else None,
-                'tax_period_name': report.tax_period_id.name if report.tax_period_id else '',
-                'report_type': report.report_type,
-                'additional_period': report.additional_period,
-                'tax_ids': [tax.id for tax in report.tax_ids] if report.tax_ids else [],
-                'state': report.state,
-                'sale_vat_amount': report.sale_vat_amount,
-                'purchase_vat_amount': report.purchase_vat_amount,
-                'vat_payable': report.vat_payable,
-                'exempt_amount': report.exempt_amount,
-                'zero_rated_amount': report.zero_rated_amount,
-                'withholding_amount': report.withholding_amount,
-                'notes': report.notes or False,
-                'tax_period_id': report.tax_period_id.id if report.tax_period_id else None,
-                'selected_taxes': [tax.name for tax in report.tax_ids] if report.tax_ids else [],
-                'created_at': report.create_date.strftime('%Y-%m-%dT%H:%M:%SZ') if report.create_date else None,
-                'submitted_at': report.submitted_at.strftime('%Y-%m-%dT%H:%M:%SZ') if report.submitted_at else None,
-            }
-            return Response(json.dumps({'success': True, 'data': result}), 
-                          content_type='application/json')
+            result = serializer(report.env).serialize(report)[0]
+            response = Response(json.dumps({'success': True, 'data': result}),
+                                content_type='application/json')
+            return validator.apply(response)
         except Exception as e:
             _logger.error(f"Error getting tax report {report_id}: {str(e)}")
             return Response(json.dumps({'success': False, 'error': str(e)}), 
@@ -1544,6 +1743,21 @@ class AccountingAPI(http.Controller):
             return Response(json.dumps({'success': False, 'error': str(e)}), 
                           content_type='application/json', status=500)
     
+    @http.route('/api/accounting/tax-reports/<int:report_id>/generate', type='http', auth='user', methods=['POST'], csrf=False)
+    def generate_tax_report(self, report_id, **kwargs):
+        """세금 신고서 데이터 생성 (백그라운드 작업)"""
+        try:
+            report = request.env['custom.account.tax.report'].sudo().browse(report_id)
+            if not report.exists():
+                return Response(json.dumps({'success': False, 'error': 'Tax report not found'}), 
+                              content_type='application/json', status=404)
+            return job_accepted_response(request.env['custom.account.job'].sudo().enqueue(
+                'tax_report_generate', {'report_id': report.id}, name=f'Generate {report.name}'))
+        except Exception as e:
+            _logger.error(f"Error generating tax report {report_id}: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), 
+                          content_type='application/json', status=500)
+    
     @http.route('/api/accounting/tax-reports/<int:report_id>/confirm', type='http', auth='user', methods=['POST'], csrf=False)
     def confirm_tax_report(self, report_id, **kwargs):
         """세금 신고서 확정"""
@@ -1592,6 +1806,199 @@ class AccountingAPI(http.Controller):
             return Response(json.dumps({'success': False, 'error': str(e)}), 
                           content_type='application/json', status=500)
     
+    # ==================== Reports API ====================
+    
+    @http.route('/api/accounting/reports/trial-balance', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_trial_balance(self, **kwargs):
+        """시산표 조회 (계정별 기초잔액, 기간 차변/대변, 기말잔액)"""
+        try:
+            try:
+                date_from = _parse_date(kwargs['date_from'], 'date_from') if kwargs.get('date_from') else None
+                date_to = _parse_date(kwargs['date_to'], 'date_to') if kwargs.get('date_to') else None
+                states = _split_values(kwargs['state']) if kwargs.get('state') else ['posted']
+                if date_from and date_to and date_from > date_to:
+                    raise ValueError('date_from must be on or before date_to')
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            result = request.env['custom.account.report'].sudo().get_trial_balance(date_from, date_to, states)
+            response = Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting trial balance: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/reports/account-rollups', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_account_rollups(self, **kwargs):
+        """계정 계층별 합산 잔액 (상위 계정 = 자기 라인 + 모든 하위 계정, root_id 지정 시 하위 트리)"""
+        try:
+            try:
+                date_from = _parse_date(kwargs['date_from'], 'date_from') if kwargs.get('date_from') else None
+                date_to = _parse_date(kwargs['date_to'], 'date_to') if kwargs.get('date_to') else None
+                states = _split_values(kwargs['state']) if kwargs.get('state') else ['posted']
+                root_id = int(kwargs['root_id']) if kwargs.get('root_id') else None
+                if date_from and date_to and date_from > date_to:
+                    raise ValueError('date_from must be on or before date_to')
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            result = request.env['custom.account.report'].sudo().get_account_rollups(date_from, date_to, states, root_id)
+            response = Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting account rollups: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/reports/general-ledger', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_general_ledger(self, **kwargs):
+        """총계정원장 (계정별 기초잔액 + 라인별 누적잔액, NDJSON 스트리밍)"""
+        try:
+            try:
+                if not kwargs.get('account_id'):
+                    raise ValueError('account_id is required')
+                account_ids = _parse_ids(kwargs['account_id'], 'account_id')
+                date_from = _parse_date(kwargs['date_from'], 'date_from') if kwargs.get('date_from') else None
+                date_to = _parse_date(kwargs['date_to'], 'date_to') if kwargs.get('date_to') else None
+                states = _split_values(kwargs['state']) if kwargs.get('state') else ['posted']
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account', 'custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            return validator.apply(stream_rows_ndjson(
+                lambda env: env['custom.account.report'].sudo()._iter_general_ledger(account_ids, date_from, date_to, states)))
+        except Exception as e:
+            _logger.error(f"Error getting general ledger: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    def _parse_partner_report_params(self, kwargs):
+        partner_types = _split_values(kwargs['type']) if kwargs.get('type') else None
+        if partner_types and not set(partner_types) <= {'customer', 'supplier', 'both'}:
+            raise ValueError('type must be customer, supplier or both')
+        partner_ids = _parse_ids(kwargs['partner_id'], 'partner_id') if kwargs.get('partner_id') else None
+        return partner_types, partner_ids
+    
+    @http.route('/api/accounting/reports/partner-ledger', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_partner_ledger(self, **kwargs):
+        """거래처 원장 (거래처별 기초잔액, 기간 차변/대변, 기말잔액; format=ndjson 스트리밍 지원)"""
+        try:
+            try:
+                date_from = _parse_date(kwargs['date_from'], 'date_from') if kwargs.get('date_from') else None
+                date_to = _parse_date(kwargs['date_to'], 'date_to') if kwargs.get('date_to') else None
+                states = _split_values(kwargs['state']) if kwargs.get('state') else ['posted']
+                partner_types, partner_ids = self._parse_partner_report_params(kwargs)
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account', 'custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+            producer = lambda env: env['custom.account.report'].sudo()._iter_partner_ledger(
+                date_from, date_to, states, partner_types, partner_ids)
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_rows_ndjson(producer))
+            result = [row for rows in producer(request.env) for row in rows]
+            response = Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting partner ledger: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/reports/partner-aging', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_partner_aging(self, **kwargs):
+        """거래처별 채권/채무 연령 분석 (0-30/31-60/61-90/90+ 일, as_of 기준; format=ndjson 스트리밍 지원)"""
+        try:
+            try:
+                as_of = _parse_date(kwargs['as_of'], 'as_of') if kwargs.get('as_of') else None
+                partner_types, partner_ids = self._parse_partner_report_params(kwargs)
+                kinds = _split_values(kwargs['kind']) if kwargs.get('kind') else None
+                if kinds and not set(kinds) <= {'receivable', 'payable'}:
+                    raise ValueError('kind must be receivable or payable')
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+
+            validator = CacheValidator(request.env, ['custom.account.move', 'custom.account.move.line', 'custom.account.account', 'custom.account.partner'])
+            if validator.is_not_modified():
+                return validator.not_modified_response()
+
+            def producer(env):
+                for rows in env['custom.account.report'].sudo()._iter_partner_aging(as_of, partner_types, partner_ids):
+                    yield [row for row in rows if not kinds or row['kind'] in kinds]
+
+            if wants_ndjson(kwargs):
+                return validator.apply(stream_rows_ndjson(producer))
+            result = [row for rows in producer(request.env) for row in rows]
+            totals = {}
+            for row in result:
+                kind_totals = totals.setdefault(row['kind'], {})
+                for key, value in row.items():
+                    if key == 'balance' or key.startswith('bucket_'):
+                        kind_totals[key] = kind_totals.get(key, 0.0) + value
+            response = Response(json.dumps({'success': True, 'data': result, 'totals': totals}),
+                                content_type='application/json')
+            return validator.apply(response)
+        except Exception as e:
+            _logger.error(f"Error getting partner aging: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    # ==================== Jobs API ====================
+    
+    @http.route('/api/accounting/jobs', type='http', auth='user', methods=['POST'], csrf=False)
+    def create_job(self, **kwargs):
+        """백그라운드 작업 등록 ({"job_type": ..., "params": {...}})"""
+        try:
+            data = json.loads(request.httprequest.data.decode('utf-8')) if request.httprequest.data else {}
+            Job = request.env['custom.account.job'].sudo()
+            job_types = dict(Job._fields['job_type'].selection)
+            if data.get('job_type') not in job_types:
+                return Response(json.dumps({'success': False, 'error': f"job_type must be one of {', '.join(job_types)}"}),
+                              content_type='application/json', status=400)
+            try:
+                params = parse_job_params(data['job_type'], data.get('params') or {})
+            except ValueError as e:
+                return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=400)
+            return job_accepted_response(Job.enqueue(data['job_type'], params, name=data.get('name')))
+        except ValueError as e:
+            return Response(json.dumps({'success': False, 'error': f'Invalid JSON: {str(e)}'}),
+                          content_type='application/json', status=400)
+        except Exception as e:
+            _logger.error(f"Error creating job: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    @http.route('/api/accounting/jobs/<int:job_id>', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_job(self, job_id, **kwargs):
+        """백그라운드 작업 상태/진행률/결과 조회"""
+        try:
+            job = request.env['custom.account.job'].sudo().browse(job_id)
+            if not job.exists():
+                return Response(json.dumps({'success': False, 'error': 'Job not found'}),
+                              content_type='application/json', status=404)
+            return Response(json.dumps({'success': True, 'data': job.get_status()}), content_type='application/json')
+        except Exception as e:
+            _logger.error(f"Error getting job {job_id}: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
+    # ==================== Dashboard API ====================
+    
+    @http.route('/api/accounting/dashboard/summary', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_dashboard_summary(self, **kwargs):
+        """대시보드 요약 KPI (건수, 전기/미전기 합계, 이번 달 차변/대변, 자산 장부가액, 예산 집행률)"""
+        try:
+            result = request.env['custom.account.dashboard'].sudo().get_summary()
+            response = Response(json.dumps({'success': True, 'data': result}), content_type='application/json')
+            response.headers['Cache-Control'] = 'private, max-age=30'
+            return response
+        except Exception as e:
+            _logger.error(f"Error getting dashboard summary: {str(e)}")
+            return Response(json.dumps({'success': False, 'error': str(e)}), content_type='application/json', status=500)
+    
     # ==================== Health Check API ====================
     
     @http.route('/api/accounting/health', type='http', auth='none', methods=['GET'], csrf=False)
@@ -0,0 +1,388 @@
+from collections import defaultdict
+from datetime import date
+from functools import partial
+
+from odoo import fields
+
+
+class Column:
+    """출력 컬럼 정의
+
+    kind:
+        raw      - 필드 값을 그대로 사용
+        date     - Date 필드를 'YYYY-MM-DD' 문자열로 변환
+        datetime - Datetime 필드를 fmt 형식 문자열로 변환
+        m2o      - Many2one 의 id (없으면 None)
+        related  - Many2one 대상 레코드의 attr 값 (일괄 조회)
+        x2m      - x2many 의 id 목록
+        x2m_attr - x2many 대상 레코드들의 attr 값 목록 (일괄 조회)
+        map      - mapping 으로 값 변환 (없는 값은 그대로)
+        compute  - compute(row, extra) 함수 결과
+    """
+
+    def __init__(self, source=None, kind='raw', attr=None, default=None, fmt=None, mapping=None, compute=None):
+        self.source = source
+        self.kind = kind
+        self.attr = attr
+        self.default = default
+        self.fmt = fmt
+        self.mapping = mapping
+        self.compute = compute
+
+
+class ModelSerializer:
+    """모델별 출력 컬럼을 선언하고 레코드셋을 일괄 조회로 직렬화
+
+    저장 필드는 read() 한 번으로, Many2one/x2many 대상의 이름 등은
+    대상 모델별로 한 번의 read() 로 가져오므로 레코드 수와 무관하게
+    쿼리 수가 일정하다.
+
+    includes 에 선언된 컬럼(예: 분개 라인)은 fields= 로 컬럼을 지정한 경우
+    include= 로 요청해야만 포함된다.
+    """
+    model = None
+    columns = {}
+    includes = ()
+
+    def __init__(self, env, keys=None):
+        self.env = env
+        if keys is not None:
+            self.columns = {key: self.columns[key] for key in keys}
+        model_fields = env[self.model]._fields
+        self._comodels = {
+            column.source: model_fields[column.source].comodel_name
+            for column in self.columns.values()
+            if column.kind in ('related', 'x2m_attr')
+        }
+
+    @classmethod
+    def from_params(cls, params):
+        """fields=, include= 쿼리 파라미터로 출력 컬럼을 선택한 serializer 생성 함수 반환
+
+        잘못된 필드명은 ValueError. 두 파라미터가 모두 없으면 전체 컬럼.
+        """
+        fields_param = params.get('fields')
+        include_param = params.get('include')
+        if not fields_param and include_param is None:
+            return cls
+        include = [key.strip() for key in (include_param or '').split(',') if key.strip()]
+        unknown = [key for key in include if key not in cls.includes]
+        if unknown:
+            raise ValueError(f"Unknown include: {', '.join(unknown)}")
+        if fields_param:
+            requested = [key.strip() for key in fields_param.split(',') if key.strip()]
+            unknown = [key for key in requested if key not in cls.columns or key in cls.includes]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+            keys = ['id'] + [key for key in requested if key != 'id']
+        else:
+            keys = [key for key in cls.columns if key not in cls.includes]
+        keys += [key for key in include if key not in keys]
+        # 선언 순서를 유지
+        keys = [key for key in cls.columns if key in keys]
+        return partial(cls, keys=keys)
+
+    def serialize(self, records):
+        if not records:
+            return []
+        columns = self.columns
+        sources = {column.source for column in columns.values() if column.source}
+        rows = records.read(sorted(sources), load=None)
+        related = self._fetch_related(columns, rows)
+        extra = self._fetch_extra(rows)
+        return [
+            {key: self._format(column, row, related, extra) for key, column in columns.items()}
+            for row in rows
+        ]
+
+    def _fetch_related(self, columns, rows):
+        """관계 필드 대상 레코드를 모델별로 한 번에 조회 → {(comodel, id): {attr: value}}"""
+        attrs = defaultdict(set)
+        sources = defaultdict(set)
+        for column in columns.values():
+            if column.kind in ('related', 'x2m_attr'):
+                comodel = self._comodels[column.source]
+                attrs[comodel].add(column.attr)
+                sources[comodel].add(column.source)
+        related = {}
+        for comodel, comodel_attrs in attrs.items():
+            ids = set()
+            for row in rows:
+                for source in sources[comodel]:
+                    value = row[source]
+                    if isinstance(value, (list, tuple)):
+                        ids.update(value)
+                    elif value:
+                        ids.add(value)
+            if not ids:
+                continue
+            for values in self.env[comodel].browse(sorted(ids)).read(sorted(comodel_attrs), load=None):
+                related[(comodel, values['id'])] = values
+        return related
+
+    def _fetch_extra(self, rows):
+        """하위 클래스에서 계산 컬럼용 데이터를 일괄 조회할 때 재정의"""
+        return {}
+
+    def _format(self, column, row, related, extra):
+        kind = column.kind
+        if kind == 'compute':
+            return column.compute(row, extra)
+        value = row[column.source]
+        if kind == 'raw':
+            return value
+        if kind == 'date':
+            return fields.Date.to_string(value) if value else None
+        if kind == 'datetime':
+            return value.strftime(column.fmt) if value else None
+        if kind == 'm2o':
+            return value or None
+        if kind == 'map':
+            return column.mapping.get(value, value)
+        if kind == 'x2m':
+            return list(value)
+        comodel = self._comodels[column.source]
+        if kind == 'related':
+            if not value:
+                return column.default
+            value = related[(comodel, value)][column.attr]
+            return fields.Date.to_string(value) if isinstance(value, date) else value
+        if kind == 'x2m_attr':
+            return [related[(comodel, rid)][column.attr] for rid in value]
+        raise ValueError(f'Unknown column kind: {kind}')
+
+
+class AccountSerializer(ModelSerializer):
+    model = 'custom.account.account'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'code': Column('code'),
+        'type': Column('type'),
+        'parent_id': Column('parent_id', 'm2o'),
+        'parent_name': Column('parent_id', 'related', attr='name'),
+        'tax_ids': Column('tax_ids', 'x2m'),
+    }
+
+
+class AccountDetailSerializer(ModelSerializer):
+    """계정과목 단건 조회용 (하위 계정 id 포함)"""
+    model = 'custom.account.account'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'code': Column('code'),
+        'type': Column('type'),
+        'parent_id': Column('parent_id', 'm2o'),
+        'child_ids': Column('child_ids', 'x2m'),
+        'tax_ids': Column('tax_ids', 'x2m'),
+    }
+
+
+class MoveLineSerializer(ModelSerializer):
+    model = 'custom.account.move.line'
+    columns = {
+        'id': Column('id'),
+        'account_id': Column('account_id', 'm2o'),
+        'account_code': Column('account_id', 'related', attr='code', default=''),
+        'account_name': Column('account_id', 'related', attr='name', default=''),
+        'partner_id': Column('partner_id', 'm2o'),
+        'partner_code': Column('partner_id', 'related', attr='code', default=''),
+        'partner_name': Column('partner_id', 'related', attr='name', default=''),
+        'debit': Column('debit'),
+        'credit': Column('credit'),
+        'name': Column('name'),
+        'tax_ids': Column('tax_ids', 'x2m'),
+    }
+
+
+class MoveLineExportSerializer(MoveLineSerializer):
+    """분개 라인 단독 조회용 (소속 분개 정보 포함)"""
+    columns = dict({
+        'id': Column('id'),
+        'move_id': Column('move_id', 'm2o'),
+        'move_name': Column('move_id', 'related', attr='name'),
+        'date': Column('move_id', 'related', attr='date'),
+        'state': Column('move_id', 'related', attr='state'),
+    }, **{key: column for key, column in MoveLineSerializer.columns.items() if key != 'id'})
+
+
+class JournalEntrySerializer(ModelSerializer):
+    model = 'custom.account.move'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'date': Column('date', 'date'),
+        'ref': Column('ref'),
+        'state': Column('state'),
+        'amount_total': Column('amount_total'),
+        'lines': Column(kind='compute', compute=lambda row, extra: extra['lines'].get(row['id'], [])),
+    }
+    includes = ('lines',)
+
+    def _fetch_extra(self, rows):
+        """분개 라인을 분개 전체에 대해 한 번에 조회하여 분개별로 묶는다"""
+        if 'lines' not in self.columns:
+            return {}
+        env = self.env
+        move_ids = [row['id'] for row in rows]
+        lines = env['custom.account.move.line'].search([('move_id', 'in', move_ids)], order='id')
+        move_of_line = {line['id']: line['move_id'] for line in lines.read(['move_id'], load=None)}
+        grouped = defaultdict(list)
+        for line in MoveLineSerializer(env).serialize(lines):
+            grouped[move_of_line[line['id']]].append(line)
+        return {'lines': grouped}
+
+
+class PartnerSerializer(ModelSerializer):
+    model = 'custom.account.partner'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'code': Column('code'),
+        'type': Column('type'),
+        'email': Column('email'),
+        'phone': Column('phone'),
+        'active': Column('active'),
+    }
+
+
+DEPRECIATION_METHOD_KR = {
+    'linear': '정액법',
+    'degressive': '정률법',
+}
+
+
+class AssetSerializer(ModelSerializer):
+    model = 'custom.account.asset'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'code': Column('code'),
+        'purchase_date': Column('purchase_date', 'date'),
+        'purchase_value': Column('value'),
+        'current_value': Column('book_value'),
+        'accumulated_depreciation': Column('accumulated_depreciation'),
+        'last_depreciation_date': Column('last_depreciation_date', 'date'),
+        'depreciation_method': Column('depreciation_method', 'map', mapping=DEPRECIATION_METHOD_KR),
+    }
+
+
+class DepreciationLineSerializer(ModelSerializer):
+    model = 'custom.account.asset.depreciation.line'
+    columns = {
+        'id': Column('id'),
+        'sequence': Column('sequence'),
+        'date': Column('date', 'date'),
+        'amount': Column('amount'),
+        'accumulated_depreciation': Column('accumulated_depreciation'),
+        'move_id': Column('move_id', 'm2o'),
+    }
+
+
+class BudgetSerializer(ModelSerializer):
+    model = 'custom.account.budget'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'fiscal_year': Column('start_date', 'compute',
+                              compute=lambda row, extra: str(row['start_date'].year) if row['start_date'] else None),
+        'start_date': Column('start_date', 'date'),
+        'end_date': Column('end_date', 'date'),
+        'account_id': Column('account_id', 'm2o'),
+        'account_name': Column('account_id', 'related', attr='name', default=''),
+        'amount': Column('amount'),
+        'spent_amount': Column('amount', 'compute', compute=lambda row, extra: extra['spent'].get(row['id'], 0.0)),
+        'remaining_amount': Column('amount', 'compute',
+                                   compute=lambda row, extra: row['amount'] - extra['spent'].get(row['id'], 0.0)),
+        'state': Column('state'),
+    }
+
+    def _fetch_extra(self, rows):
+        """예산별 집행액(기간 내 전기된 분개의 계정 차변-대변)을 한 번의 쿼리로 집계"""
+        if 'spent_amount' not in self.columns and 'remaining_amount' not in self.columns:
+            return {}
+        env = self.env
+        budget_ids = [row['id'] for row in rows]
+        env['custom.account.move.line'].flush_model(['move_id', 'account_id', 'debit', 'credit'])
+        env['custom.account.move'].flush_model(['date', 'state'])
+        env.cr.execute("""
+            SELECT b.id, COALESCE(SUM(l.debit - l.credit), 0)
+              FROM custom_account_budget b
+              JOIN custom_account_move_line l ON l.account_id = b.account_id
+              JOIN custom_account_move m ON m.id = l.move_id
+             WHERE b.id IN %s
+               AND m.state = 'posted'
+               AND m.date BETWEEN b.start_date AND b.end_date
+          GROUP BY b.id
+        """, (tuple(budget_ids),))
+        return {'spent': dict(env.cr.fetchall())}
+
+
+class CurrencySerializer(ModelSerializer):
+    model = 'custom.account.currency'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'code': Column('code'),
+        'symbol': Column('symbol'),
+        'rate': Column('rate'),
+        'active': Column('active'),
+    }
+
+
+class TaxSerializer(ModelSerializer):
+    model = 'custom.account.tax'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'code': Column('code'),
+        'rate': Column('amount'),
+        'type': Column('type_tax_use'),
+        'active': Column('active'),
+        'description': Column('description'),
+        'effective_date': Column('effective_date', 'date'),
+        'expiry_date': Column('expiry_date', 'date'),
+        'created_at': Column('created_at', 'datetime', fmt='%Y-%m-%d %H:%M:%S'),
+        'updated_at': Column('updated_at', 'datetime', fmt='%Y-%m-%d %H:%M:%S'),
+        # 추가 정보 (필요시 사용)
+        'amount_type': Column('amount_type'),
+        'tax_category': Column('tax_category'),
+        'calculation_method': Column('calculation_method'),
+        'is_exempt': Column('is_exempt'),
+        'exempt_reason': Column('exempt_reason'),
+        'account_id': Column('account_id', 'm2o'),
+        'account_name': Column('account_id', 'related', attr='name', default=''),
+        'refund_account_id': Column('refund_account_id', 'm2o'),
+        'refund_account_name': Column('refund_account_id', 'related', attr='name', default=''),
+        'tax_group_id': Column('tax_group_id', 'm2o'),
+        'tax_group_name': Column('tax_group_id', 'related', attr='name', default=''),
+        'report_frequency': Column('report_frequency'),
+    }
+
+
+class TaxReportSerializer(ModelSerializer):
+    model = 'custom.account.tax.report'
+    columns = {
+        'id': Column('id'),
+        'name': Column('name'),
+        'date': Column('date', 'date'),
+        'period_start': Column('period_start', 'date'),
+        'period_end': Column('period_end', 'date'),
+        'tax_period_name': Column('tax_period_id', 'related', attr='name', default=''),
+        'report_type': Column('report_type'),
+        'additional_period': Column('additional_period'),
+        'tax_ids': Column('tax_ids', 'x2m'),
+        'state': Column('state'),
+        'sale_vat_amount': Column('sale_vat_amount'),
+        'purchase_vat_amount': Column('purchase_vat_amount'),
+        'vat_payable': Column('vat_payable'),
+        'exempt_amount': Column('exempt_amount'),
+        'zero_rated_amount': Column('zero_rated_amount'),
+        'withholding_amount': Column('withholding_amount'),
+        'notes': Column('notes', 'compute', compute=lambda row, extra: row['notes'] or False),
+        'tax_period_id': Column('tax_period_id', 'm2o'),
+        'selected_taxes': Column('tax_ids', 'x2m_attr', attr='name'),
+        'created_at': Column('create_date', 'datetime', fmt='%Y-%m-%dT%H:%M:%SZ'),
+        'submitted_at': Column('submitted_at', 'datetime', fmt='%Y-%m-%dT%H:%M:%SZ'),
+    }
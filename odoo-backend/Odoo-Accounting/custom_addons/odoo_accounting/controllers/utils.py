@@ -0,0 +1,262 @@
+import base64
+import hashlib
+import json
+
+from odoo import api, fields
+from odoo.http import request, Response
+
+# 목록 조회 기본/최대 페이지 크기
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+# NDJSON 스트리밍 시 한 번에 읽어오는 레코드 수
+STREAM_CHUNK_SIZE = 1000
+
+# 일괄 생성 요청 1건당 최대 항목 수
+MAX_BATCH_SIZE = 10000
+
+# 자동완성 검색 결과 기본/최대 건수
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+
+
+def parse_limit(value, default=DEFAULT_PAGE_LIMIT, maximum=MAX_PAGE_LIMIT):
+    """limit 쿼리 파라미터 파싱 (1 ~ maximum 범위로 보정)"""
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('limit must be an integer')
+    return max(1, min(limit, maximum))
+
+
+def encode_cursor(*values):
+    """키셋 페이지네이션 커서 인코딩 (정렬 키 값들을 URL-safe 문자열로 변환)"""
+    payload = json.dumps([str(value) if value is not None else None for value in values])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, *parsers):
+    """키셋 페이지네이션 커서 디코딩
+
+    parsers 는 정렬 키별 변환 함수 (예: fields.Date.to_date, int) 이며,
+    개수나 값이 맞지 않으면 ValueError 를 낸다 (400 응답용).
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != len(parsers) or None in values:
+        raise ValueError('Invalid cursor')
+    try:
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (TypeError, ValueError):
+        raise ValueError('Invalid cursor')
+
+
+def _split_values(value):
+    """콤마로 구분된 쿼리 파라미터를 리스트로 변환"""
+    return [item.strip() for item in str(value).split(',') if item.strip()]
+
+
+def _parse_ids(value, name):
+    try:
+        return [int(item) for item in _split_values(value)]
+    except ValueError:
+        raise ValueError(f'{name} must be a comma-separated list of integers')
+
+
+def _parse_amount(value, name):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a number')
+
+
+def _parse_date(value, name):
+    try:
+        return fields.Date.to_string(fields.Date.to_date(value))
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a date (YYYY-MM-DD)')
+
+
+def _parse_id_list(value, name):
+    if not isinstance(value, list) or not all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        raise ValueError(f'{name} must be a list of integers')
+    return value
+
+
+def _parse_id(value, name):
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f'{name} must be an integer')
+    return value
+
+
+def _parse_bool(value, name):
+    if not isinstance(value, bool):
+        raise ValueError(f'{name} must be a boolean')
+    return value
+
+
+# 작업 유형별 params 키 -> (변환 함수, 필수 여부)
+JOB_PARAM_SPECS = {
+    'depreciation_run': {
+        'period_date': (_parse_date, False),
+        'asset_ids': (_parse_id_list, False),
+        'post_moves': (_parse_bool, False),
+    },
+    'tax_report_generate': {'report_id': (_parse_id, True)},
+    'import': {'import_id': (_parse_id, True)},
+    'balance_rebuild': {},
+    'tax_balance_rebuild': {},
+}
+
+
+def parse_job_params(job_type, params):
+    """백그라운드 작업 params 검증 (모르는 키, 누락된 필수 키, 잘못된 값이면 ValueError)"""
+    if not isinstance(params, dict):
+        raise ValueError('params must be an object')
+    specs = JOB_PARAM_SPECS[job_type]
+    unknown = sorted(set(params) - set(specs))
+    if unknown:
+        raise ValueError(f"Unknown params for {job_type}: {', '.join(unknown)}")
+    parsed = {}
+    for name, (parse, required) in specs.items():
+        value = params.get(name)
+        if value is None:
+            if required:
+                raise ValueError(f'{name} is required')
+            continue
+        parsed[name] = parse(value, name)
+    return parsed
+
+
+def journal_entry_domain(params):
+    """분개장 조회 쿼리 파라미터를 ORM 도메인으로 변환
+
+    지원 파라미터: date_from, date_to, state, journal_id, account_id,
+    partner_id, ref(접두어 검색), amount_min, amount_max
+    (state/journal_id/account_id/partner_id 는 콤마 구분 다중값 허용)
+    """
+    domain = []
+    if params.get('date_from'):
+        domain.append(('date', '>=', _parse_date(params['date_from'], 'date_from')))
+    if params.get('date_to'):
+        domain.append(('date', '<=', _parse_date(params['date_to'], 'date_to')))
+    if params.get('state'):
+        domain.append(('state', 'in', _split_values(params['state'])))
+    if params.get('journal_id'):
+        domain.append(('journal_id', 'in', _parse_ids(params['journal_id'], 'journal_id')))
+    if params.get('account_id'):
+        domain.append(('line_ids.account_id', 'in', _parse_ids(params['account_id'], 'account_id')))
+    if params.get('partner_id'):
+        domain.append(('line_ids.partner_id', 'in', _parse_ids(params['partner_id'], 'partner_id')))
+    if params.get('ref'):
+        # 접두어 검색: 와일드카드 문자는 이스케이프
+        prefix = params['ref'].replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        domain.append(('ref', '=like', f'{prefix}%'))
+    if params.get('amount_min') not in (None, ''):
+        domain.append(('total_debit', '>=', _parse_amount(params['amount_min'], 'amount_min')))
+    if params.get('amount_max') not in (None, ''):
+        domain.append(('total_debit', '<=', _parse_amount(params['amount_max'], 'amount_max')))
+    return domain
+
+
+def wants_ndjson(params):
+    """format=ndjson 스트리밍 응답 요청 여부"""
+    return (params.get('format') or '').lower() == 'ndjson'
+
+
+def stream_ndjson(model_name, domain, serializer, chunk_size=STREAM_CHUNK_SIZE, context=None):
+    """도메인에 해당하는 레코드를 id 순으로 chunk_size 건씩 읽어 NDJSON 으로 스트리밍
+
+    serializer 는 env 를 받아 serialize(records) 메서드를 가진 객체를 만드는
+    callable (serializers 모듈의 Serializer 클래스).
+    응답 본문은 요청 처리가 끝난 뒤에 소비되므로 별도 커서를 열어 읽고,
+    chunk 마다 ORM 캐시를 비워 메모리 사용량을 일정하게 유지한다.
+    """
+    registry = request.env.registry
+    uid = request.env.uid
+    ctx = dict(request.env.context, **(context or {}))
+    domain = list(domain)
+
+    def generate():
+        with registry.cursor() as cr:
+            env = api.Environment(cr, uid, ctx)
+            model = env[model_name].sudo()
+            serialize = serializer(model.env).serialize
+            last_id = 0
+            while True:
+                records = model.search(domain + [('id', '>', last_id)], order='id', limit=chunk_size)
+                if not records:
+                    break
+                yield ''.join(json.dumps(row) + '\n' for row in serialize(records))
+                last_id = records[-1].id
+                env.invalidate_all()
+                if len(records) < chunk_size:
+                    break
+
+    return Response(generate(), content_type='application/x-ndjson', direct_passthrough=True)
+
+
+def stream_rows_ndjson(producer, context=None):
+    """producer(env) 가 내놓는 행(dict) 리스트 chunk 들을 NDJSON 으로 스트리밍
+
+    SQL 보고서처럼 ORM 레코드가 아닌 행을 내보낼 때 사용한다.
+    stream_ndjson 과 마찬가지로 별도 커서에서 실행된다.
+    """
+    registry = request.env.registry
+    uid = request.env.uid
+    ctx = dict(request.env.context, **(context or {}))
+
+    def generate():
+        with registry.cursor() as cr:
+            env = api.Environment(cr, uid, ctx)
+            for rows in producer(env):
+                yield ''.join(json.dumps(row) + '\n' for row in rows)
+
+    return Response(generate(), content_type='application/x-ndjson', direct_passthrough=True)
+
+
+class CacheValidator:
+    """목록/단건 조회용 HTTP 조건부 GET 검증자 (ETag)
+
+    관련 모델들의 변경 표시자를 한 번의 쿼리로 읽어 ETag 를 만든다.
+    응답은 쿼리 문자열(필터, fields= 등)에 따라 달라지므로
+    ETag 에 경로와 쿼리 문자열, 사용자도 포함한다.
+    max(write_date) 는 삭제를 반영하지 못하므로 Last-Modified /
+    If-Modified-Since 는 사용하지 않는다.
+    """
+
+    def __init__(self, env, model_names):
+        versions = env['custom.account.change.mixin']._get_change_markers(model_names)
+        httprequest = request.httprequest
+        key = repr((versions, env.uid, httprequest.path, httprequest.query_string))
+        self.etag = hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    def is_not_modified(self):
+        if_none_match = request.httprequest.if_none_match
+        return bool(if_none_match) and if_none_match.contains_weak(self.etag)
+
+    def not_modified_response(self):
+        return self.apply(Response(status=304))
+
+    def apply(self, response):
+        """응답에 검증자 헤더를 설정"""
+        if response.status_code in (200, 304):
+            response.set_etag(self.etag, weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+
+def job_accepted_response(job):
+    """백그라운드 작업 접수 응답 (202 Accepted, Location: 작업 상태 URL)"""
+    status_url = f'/api/accounting/jobs/{job.id}'
+    response = Response(json.dumps({
+        'success': True,
+        'data': {'job_id': job.id, 'state': job.state, 'status_url': status_url},
+    }), content_type='application/json', status=202)
+    response.headers['Location'] = status_url
+    return response
@@ -1,3 +1,4 @@
+from . import account_change
 from . import account_account
 from . import account_asset
 from . import account_budget
@@ -5,5 +6,11 @@ from . import account_currency
 from . import account_journal
 from . import account_move
 from . import account_move_line
+from . import account_balance
+from . import account_report
+from . import account_import
+from . import account_job
 from . import account_partner
-from . import account_tax
\ No newline at end of file
+from . import account_tax
+from . import account_tax_balance
+from . import account_dashboard
\ No newline at end of file
@@ -1,8 +1,12 @@
-from odoo import models, fields
+from odoo import models, fields, api
+from odoo.exceptions import ValidationError
 
 class CustomAccountAccount(models.Model):
     _name = 'custom.account.account'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Chart of Accounts'
+    _parent_store = True
+    _parent_name = 'parent_id'
 
     name = fields.Char('Account Name', required=True)
     code = fields.Char('Account Code', required=True)
@@ -13,6 +17,91 @@ class CustomAccountAccount(models.Model):
         ('income', 'Income'),
         ('expense', 'Expense'),
     ], string='Type', required=True)
-    parent_id = fields.Many2one('custom.account.account', 'Parent Account')
+    # 하위 계정이 있는 계정은 삭제할 수 없음 (parent_path 일관성 유지)
+    parent_id = fields.Many2one('custom.account.account', 'Parent Account', index=True, ondelete='restrict')
     child_ids = fields.One2many('custom.account.account', 'parent_id', 'Child Accounts')
+    # 구체화 경로 ('1/5/12/'), 하위 계정 조회는 접두어 검색으로 처리
+    parent_path = fields.Char(index=True, unaccent=False)
+    # 계정 기본 세금 (분개 라인에 세금이 지정되지 않은 경우 적용)
+    tax_ids = fields.Many2many('custom.account.tax', 'custom_account_account_tax_rel', 'account_id', 'tax_id',
+                               string='Default Taxes')
+
+    def init(self):
+        super().init()
+        # 이전 버전의 varchar_pattern_ops 인덱스 정리 (접두어 조인의 패턴이 상수가 아니라 사용되지 않음)
+        self.env.cr.execute('DROP INDEX IF EXISTS custom_account_account_parent_path_index')
+
+    @api.constrains('parent_id')
+    def _check_parent_id(self):
+        if not self._check_recursion():
+            raise ValidationError('계정과목의 상위 계정을 순환 구조로 지정할 수 없습니다.')
+
+    @api.model
+    def _get_descendant_ids(self, account_ids):
+        """계정들과 모든 하위 계정 id (parent_path 접두어 검색)"""
+        if not account_ids:
+            return []
+        self.flush_model(['parent_path'])
+        self.env.cr.execute("""
+            SELECT child.id
+              FROM custom_account_account root
+              JOIN custom_account_account child ON child.parent_path LIKE root.parent_path || '%%'
+             WHERE root.id = ANY(%s)
+        """, (list(account_ids),))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def get_tree(self, root_id=None):
+        """계정과목 계층 구조 (한 번의 조회로 전체 또는 root_id 하위 트리)
+
+        parent_path 순으로 읽어 상위 계정이 항상 먼저 나오므로 한 번의 순회로
+        트리를 만든다. 같은 상위의 하위 계정은 코드 순으로 정렬한다.
+        반환: [{'id', 'code', 'name', 'type', 'parent_id', 'children': [...]}]
+        """
+        self.flush_model(['parent_path', 'parent_id', 'code', 'name', 'type'])
+        if root_id:
+            self.env.cr.execute("""
+                SELECT child.id, child.parent_id, child.code, child.name, child.type
+                  FROM custom_account_account root
+                  JOIN custom_account_account child ON child.parent_path LIKE root.parent_path || '%%'
+                 WHERE root.id = %s
+              ORDER BY child.parent_path
+            """, (root_id,))
+        else:
+            self.env.cr.execute("""
+                SELECT id, parent_id, code, name, type
+                  FROM custom_account_account
+              ORDER BY parent_path
+            """)
+        nodes = {}
+        roots = []
+        for account_id, parent_id, code, name, account_type in self.env.cr.fetchall():
+            node = {
+                'id': account_id,
+                'code': code,
+                'name': name,
+                'type': account_type,
+                'parent_id': parent_id,
+                'children': [],
+            }
+            nodes[account_id] = node
+            parent = nodes.get(parent_id)
+            if parent is not None and account_id != root_id:
+                parent['children'].append(node)
+            else:
+                roots.append(node)
+        for node in nodes.values():
+            node['children'].sort(key=lambda child: (child['code'] or '', child['id']))
+        roots.sort(key=lambda node: (node['code'] or '', node['id']))
+        return roots
+
+    def write(self, vals):
+        """기본 세금 변경 시 세금별 누계에서 기존 기여분을 빼고 새 값을 더함"""
+        if 'tax_ids' not in vals:
+            return super().write(vals)
+        TaxBalance = self.env['custom.account.tax.balance']
+        TaxBalance._apply(-1, account_ids=self.ids)
+        result = super().write(vals)
+        TaxBalance._apply(1, account_ids=self.ids)
+        return result
     
@@ -1,11 +1,18 @@
-from odoo import models, fields
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+import logging
+
+from .depreciation import compute_schedules, month_end, month_index
+
+_logger = logging.getLogger(__name__)
 
 class CustomAccountAsset(models.Model):
     _name = 'custom.account.asset'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Asset'
 
     name = fields.Char('Asset Name', required=True)
-    code = fields.Char('Asset Code')
+    code = fields.Char('Asset Code', copy=False)
     purchase_date = fields.Date('Purchase Date')
     value = fields.Float('Asset Value')
     depreciation_method = fields.Selection([
@@ -14,4 +21,235 @@ class CustomAccountAsset(models.Model):
     ], string='Depreciation Method', default='linear')
     useful_life = fields.Integer('Useful Life (years)')
     residual_value = fields.Float('Residual Value')
-    active = fields.Boolean('Active', default=True)
\ No newline at end of file
+    active = fields.Boolean('Active', default=True)
+
+    # 감가상각 회계처리 계정
+    expense_account_id = fields.Many2one('custom.account.account', string='Depreciation Expense Account')
+    accumulated_account_id = fields.Many2one('custom.account.account', string='Accumulated Depreciation Account')
+
+    # 감가상각 내역 (월말 결산으로 확정된 회차)
+    depreciation_line_ids = fields.One2many('custom.account.asset.depreciation.line', 'asset_id',
+                                            string='Depreciation Lines')
+    accumulated_depreciation = fields.Float('Accumulated Depreciation', compute='_compute_depreciation_totals',
+                                            store=True)
+    book_value = fields.Float('Book Value', compute='_compute_depreciation_totals', store=True)
+    last_depreciation_date = fields.Date('Last Depreciation Date', compute='_compute_depreciation_totals',
+                                         store=True)
+
+    @api.depends('value', 'depreciation_line_ids.amount', 'depreciation_line_ids.date')
+    def _compute_depreciation_totals(self):
+        """감가상각 누계/장부가액 (저장된 자산은 한 번의 GROUP BY 로 일괄 집계)"""
+        stored = self.filtered('id')
+        totals = {}
+        if stored:
+            groups = self.env['custom.account.asset.depreciation.line']._read_group(
+                [('asset_id', 'in', stored.ids)], ['asset_id'], ['amount:sum', 'date:max'])
+            totals = {asset.id: (amount, last_date) for asset, amount, last_date in groups}
+        for asset in self:
+            if asset.id:
+                accumulated, last_date = totals.get(asset.id, (0.0, False))
+            else:
+                accumulated = sum(asset.depreciation_line_ids.mapped('amount'))
+                last_date = max(asset.depreciation_line_ids.mapped('date'), default=False)
+            asset.accumulated_depreciation = accumulated
+            asset.book_value = (asset.value or 0.0) - accumulated
+            asset.last_depreciation_date = last_date
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        """자산 코드가 없으면 시퀀스(ir.sequence)로 채번"""
+        Sequence = self.env['ir.sequence'].sudo()
+        for vals in vals_list:
+            if not vals.get('code'):
+                vals['code'] = Sequence.next_by_code('custom.account.asset', sequence_date=vals.get('purchase_date'))
+        return super().create(vals_list)
+
+    @api.model
+    def compute_depreciation(self, asset_ids, mode='full', as_of=None):
+        """감가상각 스케줄 계산 (asset_ids 의 자산만 대상)
+
+        mode
+        - full: as_of 월까지의 회차별 행 (기존 응답 형식, 상각이 끝난 자산은
+          "감가상각 기간 아님" 한 행)
+        - compact: 자산별 전체 스케줄을 일자/금액 배열로
+        - current: 자산별 as_of 월 회차 한 건 (누계, 장부가액 포함)
+        """
+        as_of = fields.Date.to_date(as_of) if as_of else fields.Date.context_today(self)
+        if not asset_ids:
+            return []
+        assets = self.with_context(active_test=False).browse(list(asset_ids)).exists().read(
+            ['value', 'residual_value', 'useful_life', 'depreciation_method', 'purchase_date'], load=None)
+        schedules = compute_schedules(assets)
+        result = []
+        if mode == 'full':
+            useful_lives = {asset['id']: asset['useful_life'] or 1 for asset in assets}
+            scheduled = {schedule.asset_id for schedule in schedules if schedule.index_of(as_of) >= 0}
+            for asset in assets:
+                if asset['id'] not in scheduled:
+                    result.append({
+                        'asset_id': asset['id'],
+                        'depreciation_amount': 0,
+                        'date': fields.Date.to_string(as_of),
+                        'journal_entry': None,
+                        'reason': "취득일이 미래이거나 없음",
+                        'useful_life': useful_lives[asset['id']],
+                    })
+        for schedule in schedules:
+            position = schedule.index_of(as_of)
+            amounts = schedule.amounts
+            if mode == 'compact':
+                result.append({
+                    'asset_id': schedule.asset_id,
+                    'dates': [fields.Date.to_string(d) for d in schedule.dates()],
+                    'amounts': amounts,
+                })
+            elif mode == 'current':
+                in_period = 0 <= position < len(amounts)
+                accumulated = round(sum(amounts[:position + 1]), 2) if position >= 0 else 0.0
+                result.append({
+                    'asset_id': schedule.asset_id,
+                    'date': fields.Date.to_string(schedule.dates(position, position + 1)[0]) if in_period else None,
+                    'depreciation_amount': amounts[position] if in_period else 0.0,
+                    'accumulated_depreciation': accumulated,
+                    'remaining_periods': max(len(amounts) - position - 1, 0) if position >= 0 else len(amounts),
+                })
+            elif position >= len(amounts):
+                result.append({
+                    'asset_id': schedule.asset_id,
+                    'depreciation_amount': 0,
+                    'date': fields.Date.to_string(as_of),
+                    'journal_entry': None,
+                    'reason': "감가상각 기간 아님",
+                    'useful_life': useful_lives[schedule.asset_id],
+                })
+            else:
+                stop = position + 1
+                for offset, period_date in enumerate(schedule.dates(0, stop)):
+                    date_string = fields.Date.to_string(period_date)
+                    result.append({
+                        'asset_id': schedule.asset_id,
+                        'depreciation_amount': amounts[offset],
+                        'date': date_string,
+                        'journal_entry': {
+                            'ref': f"JV{date_string.replace('-', '')}-{schedule.asset_id}",
+                            'lines': [
+                                {'account_name': '감가상각비', 'debit': amounts[offset], 'credit': 0},
+                                {'account_name': '감가상각누계액', 'debit': 0, 'credit': amounts[offset]},
+                            ]
+                        },
+                        'reason': f"{offset + 1}회차 감가상각",
+                        'useful_life': useful_lives[schedule.asset_id],
+                    })
+        if mode == 'current':
+            values = {asset['id']: asset['value'] or 0.0 for asset in assets}
+            for row in result:
+                row['book_value'] = round(values[row['asset_id']] - row['accumulated_depreciation'], 2)
+        return result
+
+    @api.model
+    def run_month_end(self, period_date=None, asset_ids=None, post_moves=False):
+        """월말 감가상각 결산
+
+        period_date 가 속한 월까지 아직 확정되지 않은 회차만 계산해서
+        감가상각 내역을 한 번의 create() 로 기록한다. 자산별 마지막 확정 회차는
+        한 번의 GROUP BY 로 조회하고 상각이 끝난 자산은 스케줄 계산에서 제외하므로,
+        매월 실행하면 해당 월 데이터만 쓰게 된다. 누계액은 저장된 마지막 내역의
+        누계에서 이어간다 (자산 조건이 바뀌어 스케줄이 달라져도 기존 내역 기준).
+        post_moves=True 이면 회차별 분개(감가상각비 / 감가상각누계액)를
+        한 번의 create() 로 생성해 전기한다.
+        반환: {'period': 기준월 말일, 'lines': 생성된 내역 수, 'moves': 생성된 분개 수}
+        """
+        period_end = month_end(month_index(fields.Date.to_date(period_date) if period_date
+                                           else fields.Date.context_today(self)))
+        domain = [('purchase_date', '<=', period_end)]
+        if asset_ids is not None:
+            domain.append(('id', 'in', list(asset_ids)))
+        assets = self.search(domain)
+        if not assets:
+            return {'period': fields.Date.to_string(period_end), 'lines': 0, 'moves': 0}
+
+        Line = self.env['custom.account.asset.depreciation.line']
+        # 자산별 (마지막 회차, 마지막 누계액) - 상각액이 음수가 아니므로 누계 최대값이 마지막 누계
+        last_lines = {
+            asset.id: (sequence, accumulated or 0.0)
+            for asset, sequence, accumulated in Line._read_group(
+                [('asset_id', 'in', assets.ids)], ['asset_id'], ['sequence:max', 'accumulated_depreciation:max'])
+        }
+
+        rows = assets.read(['code', 'value', 'residual_value', 'useful_life', 'depreciation_method', 'purchase_date',
+                            'expense_account_id', 'accumulated_account_id'], load=None)
+        # 내용연수 회차를 모두 기록한 자산은 스케줄을 계산하지 않음
+        rows = [row for row in rows
+                if last_lines.get(row['id'], (0, 0.0))[0] < max(row['useful_life'] or 1, 1) * 12]
+        codes = {row['id']: row['code'] or str(row['id']) for row in rows}
+        accounts = {row['id']: (row['expense_account_id'], row['accumulated_account_id']) for row in rows}
+
+        line_vals = []
+        for schedule in compute_schedules(rows):
+            done, accumulated = last_lines.get(schedule.asset_id, (0, 0.0))
+            stop = min(schedule.index_of(period_end) + 1, len(schedule.amounts))
+            if stop <= done:
+                continue
+            for offset, line_date in zip(range(done, stop), schedule.dates(done, stop)):
+                accumulated = round(accumulated + schedule.amounts[offset], 2)
+                line_vals.append({
+                    'asset_id': schedule.asset_id,
+                    'sequence': offset + 1,
+                    'date': line_date,
+                    'amount': schedule.amounts[offset],
+                    'accumulated_depreciation': accumulated,
+                })
+        moves = self.env['custom.account.move']
+        if post_moves and line_vals:
+            missing = sorted({vals['asset_id'] for vals in line_vals if not all(accounts[vals['asset_id']])})
+            if missing:
+                raise UserError(f'Depreciation accounts are not set on assets: {missing}')
+            journal = moves._get_default_journal()
+            move_vals = []
+            for vals in line_vals:
+                expense_account_id, accumulated_account_id = accounts[vals['asset_id']]
+                code = codes[vals['asset_id']]
+                label = f"감가상각 {code} {vals['sequence']}회차"
+                move_vals.append({
+                    'date': vals['date'],
+                    'ref': f"DEPR/{code}/{vals['sequence']}",
+                    'journal_id': journal.id,
+                    'state': 'posted',
+                    'line_ids': [
+                        (0, 0, {'account_id': expense_account_id, 'name': label,
+                                'debit': vals['amount'], 'credit': 0.0}),
+                        (0, 0, {'account_id': accumulated_account_id, 'name': label,
+                                'debit': 0.0, 'credit': vals['amount']}),
+                    ],
+                })
+            moves = moves.create(move_vals)
+            for vals, move in zip(line_vals, moves):
+                vals['move_id'] = move.id
+        lines = Line.create(line_vals)
+        _logger.info("Month-end depreciation %s: %s lines, %s moves", period_end, len(lines), len(moves))
+        return {'period': fields.Date.to_string(period_end), 'lines': len(lines), 'moves': len(moves)}
+
+    @api.model
+    def _cron_month_end_depreciation(self):
+        """전월 말 기준 감가상각 결산 (월 1회 예약 작업)"""
+        today = fields.Date.context_today(self)
+        self.run_month_end(month_end(month_index(today) - 1))
+
+
+class CustomAccountAssetDepreciationLine(models.Model):
+    _name = 'custom.account.asset.depreciation.line'
+    _inherit = ['custom.account.change.mixin']
+    _description = 'Asset Depreciation Line'
+    _order = 'asset_id, sequence'
+
+    asset_id = fields.Many2one('custom.account.asset', string='Asset', required=True,
+                               ondelete='cascade', index=True)
+    sequence = fields.Integer('Period', required=True, help='취득월을 1회차로 하는 회차 번호')
+    date = fields.Date('Date', required=True, index=True)
+    amount = fields.Float('Depreciation Amount')
+    accumulated_depreciation = fields.Float('Accumulated Depreciation')
+    move_id = fields.Many2one('custom.account.move', string='Journal Entry', ondelete='set null')
+
+    _sql_constraints = [
+        ('asset_sequence_uniq', 'unique(asset_id, sequence)', '자산별 감가상각 회차는 중복될 수 없습니다.'),
+    ]
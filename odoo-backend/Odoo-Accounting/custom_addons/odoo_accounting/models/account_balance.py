@@ -0,0 +1,175 @@
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools.sql import create_index
+import logging
+
+_logger = logging.getLogger(__name__)
+
+class CustomAccountBalance(models.Model):
+    """계정별/월별/상태별 차변·대변 누계 (분개 라인 사전 집계 테이블)
+
+    분개 라인 생성/수정/삭제, 분개 일자·상태 변경, 분개 삭제 시
+    해당 라인의 기여분을 증감 행으로 추가한다 (_apply_lines).
+    같은 (계정, 월, 상태) 행을 갱신하지 않고 추가만 하므로 같은 계정에
+    동시에 전기해도 행 잠금 경합이나 직렬화 실패가 없다. 조회는 항상 합계로
+    읽고, 주기 작업(_compact)이 키별 한 행으로 합치면서 0 건 행을 지운다.
+    데이터가 어긋났을 때는 rebuild() 로 전체를 다시 집계한다.
+    """
+    _name = 'custom.account.balance'
+    _description = 'Account Balance by Period'
+    _order = 'period desc, account_id'
+
+    account_id = fields.Many2one('custom.account.account', string='Account', required=True,
+                                 ondelete='cascade', index=True)
+    period = fields.Date('Period', required=True, index=True, help='해당 월의 1일')
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('posted', 'Posted'),
+        ('cancelled', 'Cancelled'),
+    ], required=True)
+    debit = fields.Float('Debit', default=0.0)
+    credit = fields.Float('Credit', default=0.0)
+    line_count = fields.Integer('Line Count', default=0)
+
+    def init(self):
+        super().init()
+        # 증감 행 방식으로 바뀌면서 키별 유일 제약 대신 일반 인덱스 사용
+        self.env.cr.execute(f'ALTER TABLE "{self._table}" DROP CONSTRAINT IF EXISTS "{self._table}_account_period_state_uniq"')
+        create_index(self.env.cr, f'{self._table}_account_period_state_index', self._table,
+                     ['account_id', 'period', 'state'])
+        # 최초 설치(또는 테이블이 비어 있는 상태로 업그레이드) 시 기존 분개로 채움
+        self.env.cr.execute(f'SELECT 1 FROM "{self._table}" LIMIT 1')
+        if not self.env.cr.fetchone():
+            self.rebuild()
+
+    def _flush_sources(self):
+        self.env['custom.account.move'].flush_model(['date', 'state'])
+        self.env['custom.account.move.line'].flush_model(['move_id', 'account_id', 'debit', 'credit'])
+
+    @api.model
+    def _apply_lines(self, line_ids, sign):
+        """분개 라인들의 현재 DB 값을 잔액 테이블에 sign(+1/-1) 만큼 증감 행으로 추가"""
+        if not line_ids:
+            return
+        self._flush_sources()
+        self.env.cr.execute("""
+            INSERT INTO custom_account_balance
+                   (account_id, period, state, debit, credit, line_count,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT l.account_id,
+                   date_trunc('month', m.date)::date,
+                   COALESCE(m.state, 'draft'),
+                   %(sign)s * COALESCE(SUM(l.debit), 0),
+                   %(sign)s * COALESCE(SUM(l.credit), 0),
+                   %(sign)s * COUNT(*),
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM custom_account_move_line l
+              JOIN custom_account_move m ON m.id = l.move_id
+             WHERE l.id = ANY(%(line_ids)s)
+          GROUP BY l.account_id, date_trunc('month', m.date), COALESCE(m.state, 'draft')
+        """, {'sign': sign, 'uid': self.env.uid, 'line_ids': list(line_ids)})
+        self.invalidate_model()
+
+    @api.model
+    def _compact(self):
+        """증감 행을 (계정, 월, 상태) 별 한 행으로 합치고 0 건 행 제거 (주기 작업)"""
+        self.flush_model()
+        self.env.cr.execute("""
+            WITH removed AS (
+                DELETE FROM custom_account_balance
+                RETURNING account_id, period, state, debit, credit, line_count
+            )
+            INSERT INTO custom_account_balance
+                   (account_id, period, state, debit, credit, line_count,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT account_id, period, state, SUM(debit), SUM(credit), SUM(line_count),
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM removed
+          GROUP BY account_id, period, state
+            HAVING SUM(line_count) > 0
+        """, {'uid': self.env.uid})
+        self.invalidate_model()
+
+    @api.model
+    def rebuild(self):
+        """잔액 테이블 전체 재집계"""
+        self._flush_sources()
+        self.env.cr.execute("DELETE FROM custom_account_balance")
+        self.env.cr.execute("""
+            INSERT INTO custom_account_balance
+                   (account_id, period, state, debit, credit, line_count,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT l.account_id,
+                   date_trunc('month', m.date)::date,
+                   COALESCE(m.state, 'draft'),
+                   COALESCE(SUM(l.debit), 0),
+                   COALESCE(SUM(l.credit), 0),
+                   COUNT(*),
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM custom_account_move_line l
+              JOIN custom_account_move m ON m.id = l.move_id
+          GROUP BY l.account_id, date_trunc('month', m.date), COALESCE(m.state, 'draft')
+        """, {'uid': self.env.uid})
+        _logger.info("Rebuilt account balance table: %s rows", self.env.cr.rowcount)
+        self.invalidate_model()
+        return True
+
+    @api.model
+    def get_balances(self, date_to, states=('posted',), account_ids=None):
+        """date_to 시점까지의 계정별 (차변, 대변, 잔액) 조회
+
+        date_to 가 속한 달 이전은 월별 집계 행만 읽고, 월 중간 날짜이면
+        해당 월 1일 ~ date_to 구간만 분개 라인에서 보충한다.
+        반환: {account_id: {'debit', 'credit', 'balance'}}
+        """
+        date_to = fields.Date.to_date(date_to)
+        month_start = date_to.replace(day=1)
+        if (date_to + timedelta(days=1)).day == 1:
+            # 월말이면 해당 월까지 전부 집계 행으로 처리
+            cutoff = date_to + timedelta(days=1)
+            partial_from = None
+        else:
+            cutoff = month_start
+            partial_from = month_start
+        params = {
+            'states': list(states),
+            'cutoff': cutoff,
+            'partial_from': partial_from,
+            'date_to': date_to,
+            'account_ids': list(account_ids) if account_ids else None,
+        }
+        balance_filter = line_filter = ''
+        if account_ids:
+            balance_filter = 'AND b.account_id = ANY(%(account_ids)s)'
+            line_filter = 'AND l.account_id = ANY(%(account_ids)s)'
+        self._flush_sources()
+        self.flush_model()
+        self.env.cr.execute(f"""
+            SELECT account_id, SUM(debit), SUM(credit)
+              FROM (
+                    SELECT b.account_id, b.debit, b.credit
+                      FROM custom_account_balance b
+                     WHERE b.state = ANY(%(states)s)
+                       AND b.period < %(cutoff)s
+                       {balance_filter}
+                 UNION ALL
+                    SELECT l.account_id, l.debit, l.credit
+                      FROM custom_account_move_line l
+                      JOIN custom_account_move m ON m.id = l.move_id
+                     WHERE %(partial_from)s IS NOT NULL
+                       AND m.state = ANY(%(states)s)
+                       AND m.date >= %(partial_from)s
+                       AND m.date <= %(date_to)s
+                       {line_filter}
+                   ) balances
+          GROUP BY account_id
+        """, params)
+        return {
+            account_id: {
+                'debit': debit or 0.0,
+                'credit': credit or 0.0,
+                'balance': (debit or 0.0) - (credit or 0.0),
+            }
+            for account_id, debit, credit in self.env.cr.fetchall()
+        }
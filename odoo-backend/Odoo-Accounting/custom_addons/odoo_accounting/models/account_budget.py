@@ -2,6 +2,7 @@ from odoo import models, fields
 
 class CustomAccountBudget(models.Model):
     _name = 'custom.account.budget'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Budget'
 
     name = fields.Char('Budget Name', required=True)
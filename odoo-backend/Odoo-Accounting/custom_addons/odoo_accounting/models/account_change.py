@@ -0,0 +1,78 @@
+from odoo import models, api
+
+# 변경 기록 테이블 (모델, 버전, 가중치) 과 버전 시퀀스
+CHANGE_LOG_TABLE = 'custom_account_change_log'
+CHANGE_LOG_SEQUENCE = 'custom_account_change_log_seq'
+
+class CustomAccountChangeMixin(models.AbstractModel):
+    """모델별 변경 표시자 (HTTP 조건부 GET 검증자, 보고서 캐시 키용)
+
+    생성/수정/삭제 시 변경 기록 테이블에 (모델, 시퀀스 값) 행을 하나 추가한다.
+    행은 쓰기 트랜잭션 안에서 추가되므로 커밋 전에는 다른 트랜잭션에 보이지
+    않고, 롤백되면 함께 사라진다. 추가만 하므로 동시 쓰기끼리 잠금 충돌도 없다.
+
+    표시자는 모델별 (MAX(version), SUM(weight)) 이다. 커밋 순서가 시퀀스
+    순서와 달라도 커밋마다 가중치 합이 늘어나므로 표시자가 바뀐다.
+    _compact_change_log 는 행을 모델별 한 행으로 합치며 표시자는 그대로 둔다.
+    """
+    _name = 'custom.account.change.mixin'
+    _description = 'Change Counter Mixin'
+
+    def init(self):
+        super().init()
+        cr = self.env.cr
+        cr.execute(f'CREATE SEQUENCE IF NOT EXISTS "{CHANGE_LOG_SEQUENCE}"')
+        cr.execute(f"""
+            CREATE TABLE IF NOT EXISTS "{CHANGE_LOG_TABLE}" (
+                model varchar NOT NULL,
+                version bigint NOT NULL DEFAULT nextval('{CHANGE_LOG_SEQUENCE}'),
+                weight integer NOT NULL DEFAULT 1
+            )
+        """)
+        cr.execute(f'CREATE INDEX IF NOT EXISTS "{CHANGE_LOG_TABLE}_model_index" ON "{CHANGE_LOG_TABLE}" (model, version)')
+        if not self._abstract:
+            # 이전 버전의 테이블별 변경 시퀀스 정리
+            cr.execute(f'DROP SEQUENCE IF EXISTS "{self._table}_change_seq"')
+
+    def _bump_change_counter(self):
+        self.env.cr.execute(f'INSERT INTO "{CHANGE_LOG_TABLE}" (model) VALUES (%s)', (self._name,))
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self._bump_change_counter()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        self._bump_change_counter()
+        return result
+
+    def unlink(self):
+        self._bump_change_counter()
+        return super().unlink()
+
+    @api.model
+    def _get_change_markers(self, model_names):
+        """모델별 변경 표시자 (MAX(version), SUM(weight)) 튜플을 한 번의 쿼리로 조회"""
+        for model_name in model_names:
+            self.env[model_name].flush_model()
+        self.env.cr.execute(f"""
+            SELECT model, MAX(version), SUM(weight)
+              FROM "{CHANGE_LOG_TABLE}"
+             WHERE model = ANY(%s)
+          GROUP BY model
+        """, (list(model_names),))
+        markers = {model: (version, int(weight)) for model, version, weight in self.env.cr.fetchall()}
+        return tuple(markers.get(model_name, (0, 0)) for model_name in model_names)
+
+    @api.model
+    def _compact_change_log(self):
+        """변경 기록을 모델별 한 행으로 합침 (표시자 값은 유지, 주기 작업)"""
+        self.env.cr.execute(f"""
+            WITH removed AS (
+                DELETE FROM "{CHANGE_LOG_TABLE}" RETURNING model, version, weight
+            )
+            INSERT INTO "{CHANGE_LOG_TABLE}" (model, version, weight)
+            SELECT model, MAX(version), SUM(weight) FROM removed GROUP BY model
+        """)
@@ -2,6 +2,7 @@ from odoo import models, fields
 
 class CustomAccountCurrency(models.Model):
     _name = 'custom.account.currency'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Currency'
 
     name = fields.Char('Currency Name', required=True)
@@ -0,0 +1,136 @@
+import threading
+import time
+
+from odoo import models, fields, api
+
+# 대시보드 요약 캐시 유지 시간 (초)
+DASHBOARD_CACHE_TTL = 30
+
+# 데이터베이스별 (만료 시각, 요약) 프로세스 캐시
+_summary_cache = {}
+_summary_cache_lock = threading.Lock()
+
+class CustomAccountDashboard(models.AbstractModel):
+    """대시보드 KPI (집계 쿼리 몇 개로 계산, 짧은 TTL 로 프로세스 내 캐시)"""
+    _name = 'custom.account.dashboard'
+    _description = 'Accounting Dashboard'
+
+    @api.model
+    def get_summary(self):
+        """대시보드 요약 (DASHBOARD_CACHE_TTL 초 동안 캐시)"""
+        dbname = self.env.cr.dbname
+        now = time.monotonic()
+        with _summary_cache_lock:
+            cached = _summary_cache.get(dbname)
+            if cached and cached[0] > now:
+                return cached[1]
+        summary = self._compute_summary()
+        with _summary_cache_lock:
+            _summary_cache[dbname] = (now + DASHBOARD_CACHE_TTL, summary)
+        return summary
+
+    def _compute_summary(self):
+        today = fields.Date.today()
+        month_start = today.replace(day=1)
+        for model_name in ('custom.account.account', 'custom.account.move', 'custom.account.partner',
+                           'custom.account.asset', 'custom.account.budget', 'custom.account.balance'):
+            self.env[model_name].flush_model()
+        cr = self.env.cr
+
+        cr.execute("""
+            SELECT (SELECT COUNT(*) FROM custom_account_account),
+                   (SELECT COUNT(*) FROM custom_account_partner WHERE active),
+                   (SELECT COUNT(*) FROM custom_account_budget),
+                   COUNT(*), COALESCE(SUM(value), 0), COALESCE(SUM(book_value), 0)
+              FROM custom_account_asset
+             WHERE active
+        """)
+        accounts, partners, budgets, assets, asset_value, asset_book_value = cr.fetchone()
+
+        # 분개 규모는 차변 합계(total_debit) 기준 (amount_total 은 차변 - 대변이라 균형 분개면 0)
+        cr.execute("""
+            SELECT COALESCE(state, 'draft'), COUNT(*), COALESCE(SUM(total_debit), 0)
+              FROM custom_account_move
+          GROUP BY COALESCE(state, 'draft')
+        """)
+        entries = {state: {'count': count, 'amount': amount} for state, count, amount in cr.fetchall()}
+
+        # 월별 잔액 테이블에서 이번 달 발생액과 계정 유형별 누적 잔액
+        cr.execute("""
+            SELECT COALESCE(SUM(b.debit) FILTER (WHERE b.period = %(month_start)s), 0),
+                   COALESCE(SUM(b.credit) FILTER (WHERE b.period = %(month_start)s), 0),
+                   COALESCE(SUM(b.debit - b.credit) FILTER (WHERE a.type = 'asset'), 0),
+                   COALESCE(SUM(b.credit - b.debit) FILTER (WHERE a.type = 'liability'), 0)
+              FROM custom_account_balance b
+              JOIN custom_account_account a ON a.id = b.account_id
+             WHERE b.state = 'posted'
+               AND b.period <= %(month_start)s
+        """, {'month_start': month_start})
+        month_debit, month_credit, total_assets, total_liabilities = cr.fetchone()
+
+        # 오늘이 기간에 포함된 확정 예산의 집행액 (예산 계정의 전기된 차변 - 대변)
+        self.env['custom.account.move'].flush_model(['date', 'state'])
+        self.env['custom.account.move.line'].flush_model(['move_id', 'account_id', 'debit', 'credit'])
+        cr.execute("""
+            SELECT COUNT(*), COALESCE(SUM(bu.amount), 0), COALESCE(SUM(spent.amount), 0)
+              FROM custom_account_budget bu
+         LEFT JOIN LATERAL (
+                    SELECT SUM(l.debit - l.credit) AS amount
+                      FROM custom_account_move_line l
+                      JOIN custom_account_move m ON m.id = l.move_id
+                     WHERE l.account_id = bu.account_id
+                       AND m.state = 'posted'
+                       AND m.date >= bu.start_date
+                       AND m.date <= bu.end_date
+                   ) spent ON TRUE
+             WHERE bu.state = 'confirmed'
+               AND bu.start_date <= %(today)s
+               AND bu.end_date >= %(today)s
+        """, {'today': today})
+        active_budgets, budget_amount, budget_spent = cr.fetchone()
+
+        vat = self.env['custom.account.tax.balance'].get_quarter_to_date(today)
+
+        posted = entries.get('posted', {'count': 0, 'amount': 0.0})
+        draft = entries.get('draft', {'count': 0, 'amount': 0.0})
+        return {
+            'as_of': fields.Date.to_string(today),
+            'counts': {
+                'accounts': accounts,
+                'journal_entries': sum(entry['count'] for entry in entries.values()),
+                'partners': partners,
+                'assets': assets,
+                'budgets': budgets,
+            },
+            'journal_entries': {
+                'posted_count': posted['count'],
+                'posted_amount': posted['amount'],
+                'draft_count': draft['count'],
+                'draft_amount': draft['amount'],
+            },
+            'this_month': {
+                'period': fields.Date.to_string(month_start),
+                'debit': month_debit,
+                'credit': month_credit,
+            },
+            'balances': {
+                'total_assets': total_assets,
+                'total_liabilities': total_liabilities,
+            },
+            'assets': {
+                'value': asset_value,
+                'book_value': asset_book_value,
+            },
+            'budget': {
+                'active_count': active_budgets,
+                'amount': budget_amount,
+                'spent': budget_spent,
+                'utilisation': round(budget_spent / budget_amount * 100.0, 2) if budget_amount else 0.0,
+            },
+            'vat_quarter_to_date': {
+                'date_from': vat['date_from'],
+                'sale_vat_amount': vat['sale_vat_amount'],
+                'purchase_vat_amount': vat['purchase_vat_amount'],
+                'vat_payable': vat['sale_vat_amount'] - vat['purchase_vat_amount'] - vat['withholding_amount'],
+            },
+        }
@@ -0,0 +1,332 @@
+import csv
+import json
+import os
+import shutil
+
+from odoo import models, fields, api, tools
+from odoo.exceptions import UserError
+import logging
+
+_logger = logging.getLogger(__name__)
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# 한 번에 검증/생성하는 분개 수
+IMPORT_BATCH_SIZE = 1000
+# error_log 에 보관하는 최대 오류 수 (error_count 는 전체 건수)
+MAX_STORED_ERRORS = 1000
+
+# 가져오기 대상 컬럼 (매핑 기본값은 같은 이름의 헤더)
+IMPORT_COLUMNS = [
+    'entry', 'date', 'name', 'ref', 'journal_code', 'state',
+    'account_code', 'partner_code', 'line_name', 'debit', 'credit',
+]
+
+class CustomAccountImport(models.Model):
+    """은행 거래내역/원장 파일(CSV, XLSX) 분개 가져오기
+
+    파일은 filestore 아래에 그대로 저장하고 행 단위로 스트리밍해서 읽는다.
+    같은 entry 값(없으면 date + ref)을 가진 연속된 행이 하나의 분개가 되며,
+    IMPORT_BATCH_SIZE 개 분개마다 계정/거래처/분개장 코드를 일괄 조회한 뒤
+    custom.account.move.create_batch() 로 생성하고 커밋한다.
+    처리된 행 수(processed_rows)를 기록하므로 실패 후 다시 실행하면
+    이어서 가져온다.
+    """
+    _name = 'custom.account.import'
+    _description = 'Journal Entry Import'
+    _order = 'id desc'
+
+    name = fields.Char('Import Name', required=True)
+    file_name = fields.Char('File Name')
+    file_type = fields.Selection([
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel (XLSX)'),
+    ], required=True, default='csv')
+    file_path = fields.Char('Stored File', readonly=True, copy=False)
+    delimiter = fields.Char('CSV Delimiter', default=',')
+    column_mapping = fields.Text('Column Mapping', help='JSON: {"대상 컬럼": "파일 헤더"}')
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], default='draft', readonly=True)
+    total_rows = fields.Integer('Total Rows', readonly=True)
+    processed_rows = fields.Integer('Processed Rows', readonly=True)
+    created_moves = fields.Integer('Created Entries', readonly=True)
+    error_count = fields.Integer('Errors', readonly=True)
+    error_log = fields.Text('Error Log', readonly=True, help='JSON: [{"row": 행 번호, "error": 메시지}]')
+    progress = fields.Float('Progress (%)', compute='_compute_progress')
+
+    @api.depends('total_rows', 'processed_rows')
+    def _compute_progress(self):
+        for record in self:
+            record.progress = round(record.processed_rows * 100.0 / record.total_rows, 2) if record.total_rows else 0.0
+
+    def unlink(self):
+        for record in self:
+            record._remove_file()
+        return super().unlink()
+
+    # ---------------------------------------------------------------- 파일
+
+    def _storage_dir(self):
+        path = os.path.join(tools.config.filestore(self.env.cr.dbname), 'custom_account_import')
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def save_file(self, stream):
+        """업로드 스트림을 파일로 복사 (메모리에 전체를 올리지 않음)"""
+        self.ensure_one()
+        path = os.path.join(self._storage_dir(), f'{self.id}.{self.file_type}')
+        with open(path, 'wb') as target:
+            shutil.copyfileobj(stream, target)
+        self.file_path = path
+
+    def _remove_file(self):
+        if self.file_path and os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+    def _get_mapping(self):
+        mapping = {column: column for column in IMPORT_COLUMNS}
+        if self.column_mapping:
+            try:
+                mapping.update(json.loads(self.column_mapping))
+            except ValueError:
+                raise UserError('column_mapping must be valid JSON')
+        return mapping
+
+    def _iter_raw_rows(self):
+        """파일의 행을 (헤더 포함) 리스트로 하나씩 yield"""
+        if self.file_type == 'xlsx':
+            if openpyxl is None:
+                raise UserError('XLSX import requires the openpyxl library')
+            workbook = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+            try:
+                for row in workbook.active.iter_rows(values_only=True):
+                    yield list(row)
+            finally:
+                workbook.close()
+        else:
+            with open(self.file_path, newline='', encoding='utf-8-sig') as f:
+                yield from csv.reader(f, delimiter=self.delimiter or ',')
+
+    def _count_rows(self):
+        """진행률 계산용 데이터 행 수 (헤더 제외)"""
+        if self.file_type == 'xlsx':
+            if openpyxl is None:
+                raise UserError('XLSX import requires the openpyxl library')
+            workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+            try:
+                return max((workbook.active.max_row or 1) - 1, 0)
+            finally:
+                workbook.close()
+        with open(self.file_path, newline='', encoding='utf-8-sig') as f:
+            return max(sum(1 for _row in csv.reader(f, delimiter=self.delimiter or ',')) - 1, 0)
+
+    def _iter_rows(self):
+        """(행 번호, {대상 컬럼: 값}) 을 yield (행 번호는 헤더 다음 행이 1)"""
+        mapping = self._get_mapping()
+        rows = self._iter_raw_rows()
+        header = next(rows, None)
+        if not header:
+            return
+        positions = {str(name).strip(): index for index, name in enumerate(header) if name is not None}
+        if mapping['account_code'] not in positions:
+            raise UserError(f"Missing required column: {mapping['account_code']}")
+        columns = {target: positions[source] for target, source in mapping.items() if source in positions}
+        for row_number, row in enumerate(rows, start=1):
+            if not any(value not in (None, '') for value in row):
+                continue
+            yield row_number, {
+                target: row[index] if index < len(row) else None
+                for target, index in columns.items()
+            }
+
+    def _iter_entries(self, skip_rows=0):
+        """연속된 같은 분개 키의 행들을 묶어 (마지막 행 번호, 첫 행 번호, 행 리스트) 로 yield"""
+        current_key, first_row, last_row, group = None, None, None, []
+        for row_number, row in self._iter_rows():
+            if row_number <= skip_rows:
+                continue
+            key = row.get('entry') or (row.get('date'), row.get('ref'))
+            if group and key != current_key:
+                yield last_row, first_row, group
+                group = []
+            if not group:
+                current_key, first_row = key, row_number
+            group.append(row)
+            last_row = row_number
+        if group:
+            yield last_row, first_row, group
+
+    # ---------------------------------------------------------------- 가져오기
+
+    def _lookup_codes(self, model_name, codes, cache):
+        """cache 에 없는 코드만 한 번에 조회해서 {코드: id} 캐시에 추가"""
+        missing = [code for code in codes if code and code not in cache]
+        if missing:
+            model = self.env[model_name].with_context(active_test=False)
+            for record in model.search_read([('code', 'in', missing)], ['code']):
+                cache.setdefault(record['code'], record['id'])
+            for code in missing:
+                cache.setdefault(code, None)
+
+    @staticmethod
+    def _cell_str(value):
+        if value is None:
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip()
+
+    @staticmethod
+    def _cell_amount(value):
+        """금액 셀 변환 (천 단위 구분 쉼표 허용)"""
+        if value in (None, ''):
+            return 0.0
+        if isinstance(value, (int, float)):
+            return float(value)
+        try:
+            return float(str(value).replace(',', '').strip())
+        except ValueError:
+            raise ValueError(f'invalid amount: {value}')
+
+    def _import_batch(self, batch, caches, errors):
+        """분개 묶음 하나를 코드 조회 -> 생성. 반환: 생성된 분개 수"""
+        cell = self._cell_str
+        self._lookup_codes('custom.account.account',
+                           {cell(row.get('account_code')) for _first, rows in batch for row in rows},
+                           caches['account'])
+        self._lookup_codes('custom.account.partner',
+                           {cell(row.get('partner_code')) for _first, rows in batch for row in rows},
+                           caches['partner'])
+        self._lookup_codes('custom.account.journal',
+                           {cell(rows[0].get('journal_code')) for _first, rows in batch},
+                           caches['journal'])
+
+        entries, first_rows = [], []
+        for first_row, rows in batch:
+            head = rows[0]
+            try:
+                journal_code = cell(head.get('journal_code'))
+                if journal_code and not caches['journal'][journal_code]:
+                    raise ValueError(f'journal code {journal_code} not found')
+                lines = []
+                for row in rows:
+                    account_code = cell(row.get('account_code'))
+                    if not caches['account'].get(account_code):
+                        raise ValueError(f'account code {account_code or "(empty)"} not found')
+                    partner_code = cell(row.get('partner_code'))
+                    if partner_code and not caches['partner'][partner_code]:
+                        raise ValueError(f'partner code {partner_code} not found')
+                    lines.append({
+                        'account_id': caches['account'][account_code],
+                        'partner_id': caches['partner'].get(partner_code) if partner_code else False,
+                        'name': cell(row.get('line_name')) or cell(head.get('name')),
+                        'debit': self._cell_amount(row.get('debit')),
+                        'credit': self._cell_amount(row.get('credit')),
+                    })
+                entry_date = head.get('date')
+                entries.append({
+                    'name': cell(head.get('name')) or cell(head.get('entry')) or '/',
+                    'date': entry_date.date() if hasattr(entry_date, 'date') else cell(entry_date) or None,
+                    'ref': cell(head.get('ref')) or None,
+                    'journal_id': caches['journal'][journal_code] if journal_code else None,
+                    'state': cell(head.get('state')) or 'draft',
+                    'lines': lines,
+                })
+                first_rows.append(first_row)
+            except ValueError as e:
+                errors.append({'row': first_row, 'error': str(e)})
+
+        created = 0
+        for first_row, result in zip(first_rows, self.env['custom.account.move'].create_batch(entries)):
+            if 'error' in result:
+                errors.append({'row': first_row, 'error': result['error']})
+            else:
+                created += 1
+        return created
+
+    def action_import(self, batch_size=IMPORT_BATCH_SIZE):
+        """파일을 스트리밍으로 읽어 분개 생성 (batch 마다 진행상황 기록 후 커밋)"""
+        self.ensure_one()
+        if not self.file_path or not os.path.exists(self.file_path):
+            raise UserError('Import file is missing')
+        self.write({'state': 'running', 'total_rows': self._count_rows()})
+        self.env.cr.commit()
+
+        caches = {'account': {}, 'partner': {}, 'journal': {}}
+        stored_errors = json.loads(self.error_log or '[]')
+        batch, last_row = [], self.processed_rows
+        try:
+            entries = self._iter_entries(skip_rows=self.processed_rows)
+            while True:
+                item = next(entries, None)
+                if item:
+                    last_row, first_row, rows = item
+                    batch.append((first_row, rows))
+                if batch and (len(batch) >= batch_size or item is None):
+                    errors = []
+                    created = self._import_batch(batch, caches, errors)
+                    stored_errors.extend(errors[:max(MAX_STORED_ERRORS - len(stored_errors), 0)])
+                    self.write({
+                        'processed_rows': last_row,
+                        'created_moves': self.created_moves + created,
+                        'error_count': self.error_count + len(errors),
+                        'error_log': json.dumps(stored_errors, ensure_ascii=False),
+                    })
+                    self.env.cr.commit()
+                    self.env.invalidate_all()
+                    self.env['custom.account.job'].report_progress(self.progress)
+                    batch = []
+                if item is None:
+                    break
+        except Exception as e:
+            self.env.cr.rollback()
+            _logger.error(f"Error importing file {self.file_name}: {str(e)}")
+            stored_errors.append({'row': None, 'error': str(e)})
+            self.write({
+                'state': 'failed',
+                'error_count': self.error_count + 1,
+                'error_log': json.dumps(stored_errors[-MAX_STORED_ERRORS:], ensure_ascii=False),
+            })
+            self.env.cr.commit()
+            return False
+
+        self.write({'state': 'done', 'processed_rows': self.total_rows})
+        self._remove_file()
+        return True
+
+    @api.model
+    def _job_import(self, import_id):
+        """백그라운드 작업(custom.account.job) 실행 진입점
+
+        가져오기가 실패하면 (실패 상태는 action_import 가 이미 커밋함)
+        예외를 올려 작업도 failed 로 기록되게 한다.
+        """
+        job = self.browse(import_id)
+        if not job.action_import():
+            errors = json.loads(job.error_log or '[]')
+            raise UserError(errors[-1]['error'] if errors else f'Import {import_id} failed')
+        return job.get_status()
+
+    def get_status(self):
+        """API 응답용 진행 상황"""
+        self.ensure_one()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'file_name': self.file_name,
+            'file_type': self.file_type,
+            'state': self.state,
+            'total_rows': self.total_rows,
+            'processed_rows': self.processed_rows,
+            'progress': self.progress,
+            'created_moves': self.created_moves,
+            'error_count': self.error_count,
+            'errors': json.loads(self.error_log or '[]'),
+        }
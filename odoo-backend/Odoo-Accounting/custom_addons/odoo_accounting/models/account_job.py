@@ -0,0 +1,195 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo import models, fields, api
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# 작업 유형별 실행 메서드 (모델, 메서드). params 는 키워드 인자로 전달되며
+# 반환값은 JSON 으로 result 에 저장된다.
+JOB_HANDLERS = {
+    'depreciation_run': ('custom.account.asset', 'run_month_end'),
+    'tax_report_generate': ('custom.account.tax.report', '_job_generate'),
+    'import': ('custom.account.import', '_job_import'),
+    'balance_rebuild': ('custom.account.balance', 'rebuild'),
+    'tax_balance_rebuild': ('custom.account.tax.balance', 'rebuild'),
+}
+
+# 예약 작업 한 번에 병렬로 실행하는 작업 수
+# 작업마다 registry.cursor() 로 DB 연결을 하나씩 쓰므로 크론 워커 하나가
+# 최대 JOB_WORKERS + 1 개 연결을 사용한다 (db_maxconn 은 이보다 커야 함)
+JOB_WORKERS = 4
+# 실행 중인 작업의 세션 어드바이저리 잠금 키 (pg_advisory_lock(JOB_LOCK_CLASS, 작업 id))
+JOB_LOCK_CLASS = 7010
+
+class CustomAccountJob(models.Model):
+    """장시간 회계 작업 대기열
+
+    enqueue() 로 등록하면 예약 작업(ir.cron)을 즉시 트리거하고, 크론 워커가
+    대기 중인 작업을 FOR UPDATE SKIP LOCKED 로 선점한 뒤 스레드 풀에서
+    작업별 별도 커서로 실행한다. 여러 크론 워커가 동시에 돌아도 같은 작업을
+    두 번 실행하지 않는다. 스레드는 Odoo 워커 한도 밖에서 돌므로 크론 워커당
+    DB 연결 예산은 JOB_WORKERS + 1 개다.
+
+    선점한 워커는 작업이 끝날 때까지 작업별 세션 어드바이저리 잠금을 쥔다.
+    워커 프로세스가 죽으면 연결과 함께 잠금이 풀리므로, running 인데 잠금을
+    쥔 세션이 없는 작업만 다시 대기열에 넣는다 (오래 걸리는 작업은 그대로 둠).
+    """
+    _name = 'custom.account.job'
+    _description = 'Accounting Background Job'
+    _order = 'id desc'
+
+    name = fields.Char('Job Name', required=True)
+    job_type = fields.Selection([
+        ('depreciation_run', '월말 감가상각'),
+        ('tax_report_generate', '세금 신고서 데이터 생성'),
+        ('import', '분개 가져오기'),
+        ('balance_rebuild', '잔액 재집계'),
+        ('tax_balance_rebuild', '세금 누계 재집계'),
+    ], required=True)
+    params = fields.Text('Parameters', help='JSON')
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], default='queued', required=True, index=True)
+    progress = fields.Float('Progress (%)', default=0.0)
+    result = fields.Text('Result', help='JSON')
+    error = fields.Text('Error')
+    started_at = fields.Datetime('Started At')
+    finished_at = fields.Datetime('Finished At')
+
+    @api.model
+    def enqueue(self, job_type, params=None, name=None):
+        """작업 등록 후 워커 트리거"""
+        job = self.create({
+            'name': name or dict(self._fields['job_type'].selection)[job_type],
+            'job_type': job_type,
+            'params': json.dumps(params or {}),
+        })
+        cron = self.env.ref('odoo_accounting.ir_cron_run_account_jobs', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return job
+
+    @api.model
+    def report_progress(self, progress):
+        """실행 중인 작업의 진행률 기록 (별도 커서로 즉시 커밋)"""
+        job_id = self.env.context.get('account_job_id')
+        if not job_id:
+            return
+        with self.env.registry.cursor() as cr:
+            cr.execute("UPDATE custom_account_job SET progress = %s WHERE id = %s",
+                       (min(max(progress, 0.0), 100.0), job_id))
+
+    def get_status(self):
+        """API 응답용 작업 상태"""
+        self.ensure_one()
+        return {
+            'id': self.id,
+            'name': self.name,
+            'job_type': self.job_type,
+            'state': self.state,
+            'progress': self.progress,
+            'result': json.loads(self.result) if self.result else None,
+            'error': self.error,
+            'created_at': fields.Datetime.to_string(self.create_date) if self.create_date else None,
+            'started_at': fields.Datetime.to_string(self.started_at) if self.started_at else None,
+            'finished_at': fields.Datetime.to_string(self.finished_at) if self.finished_at else None,
+        }
+
+    # ---------------------------------------------------------------- 워커
+
+    @api.model
+    def _claim_jobs(self, limit):
+        """대기 중인 작업을 선점해 running 으로 바꾸고 커밋
+
+        선점한 작업마다 이 커서의 세션에서 어드바이저리 잠금을 잡는다
+        (커밋 전에 잡으므로 다른 워커에는 잠금 없는 running 상태가 보이지 않음).
+        """
+        # 잠금을 쥔 세션이 없는 running 작업 = 워커가 죽은 작업
+        self.env.cr.execute("""
+            UPDATE custom_account_job j
+               SET state = 'queued'
+             WHERE j.state = 'running'
+               AND NOT EXISTS (
+                    SELECT 1
+                      FROM pg_locks l
+                     WHERE l.locktype = 'advisory'
+                       AND l.database = (SELECT oid FROM pg_database WHERE datname = current_database())
+                       AND l.classid = %s
+                       AND l.objid = j.id
+                       AND l.objsubid = 2
+                   )
+        """, (JOB_LOCK_CLASS,))
+        self.env.cr.execute("""
+            UPDATE custom_account_job
+               SET state = 'running', started_at = now() at time zone 'UTC'
+             WHERE id IN (
+                    SELECT id
+                      FROM custom_account_job
+                     WHERE state = 'queued'
+                  ORDER BY id
+                     LIMIT %s
+                       FOR UPDATE SKIP LOCKED
+                   )
+         RETURNING id
+        """, (limit,))
+        job_ids = [row[0] for row in self.env.cr.fetchall()]
+        for job_id in job_ids:
+            self.env.cr.execute("SELECT pg_advisory_lock(%s, %s)", (JOB_LOCK_CLASS, job_id))
+        self.env.cr.commit()
+        return job_ids
+
+    @api.model
+    def _cron_run_jobs(self):
+        """대기 중인 작업 실행 (예약 작업)"""
+        job_ids = self._claim_jobs(JOB_WORKERS)
+        if not job_ids:
+            return
+        registry = self.env.registry
+        uid = self.env.uid
+
+        def run(job_id):
+            threading.current_thread().dbname = registry.db_name
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, {})
+                env['custom.account.job'].browse(job_id)._execute()
+
+        try:
+            with ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='account_job') as pool:
+                for _result in pool.map(run, job_ids):
+                    pass
+        finally:
+            # 세션 잠금은 커밋/커서 반환과 무관하게 유지되므로 직접 해제
+            for job_id in job_ids:
+                self.env.cr.execute("SELECT pg_advisory_unlock(%s, %s)", (JOB_LOCK_CLASS, job_id))
+
+        # 남은 작업이 있으면 다음 주기를 기다리지 않고 이어서 실행
+        if self.search_count([('state', '=', 'queued')], limit=1):
+            self.env.ref('odoo_accounting.ir_cron_run_account_jobs')._trigger()
+
+    def _execute(self):
+        self.ensure_one()
+        model_name, method_name = JOB_HANDLERS[self.job_type]
+        params = json.loads(self.params or '{}')
+        try:
+            model = self.env[model_name].with_user(self.create_uid).with_context(account_job_id=self.id).sudo()
+            result = getattr(model, method_name)(**params)
+            self.write({
+                'state': 'done',
+                'progress': 100.0,
+                'result': json.dumps(result, default=str),
+                'finished_at': fields.Datetime.now(),
+            })
+        except Exception as e:
+            self.env.cr.rollback()
+            _logger.error(f"Error running job {self.id} ({self.job_type}): {str(e)}")
+            self.write({
+                'state': 'failed',
+                'error': str(e),
+                'finished_at': fields.Datetime.now(),
+            })
@@ -1,29 +1,185 @@
-from odoo import models, fields
+from odoo import models, fields, api
+from odoo.tools.sql import create_index
+import logging
+
+_logger = logging.getLogger(__name__)
 
 class CustomAccountMove(models.Model):
     _name = 'custom.account.move'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Journal Entry'
+    _order = 'date desc, id desc'
 
-    name = fields.Char('Entry Name', required=True)
+    name = fields.Char('Entry Name', required=True, copy=False, default='/')
     date = fields.Date('Date', required=True, default=fields.Date.today)
-    ref = fields.Char('Reference')
-    journal_id = fields.Many2one('custom.account.journal', 'Journal', required=True)
+    ref = fields.Char('Reference', index='trigram')
+    journal_id = fields.Many2one('custom.account.journal', 'Journal', required=True, index=True)
     line_ids = fields.One2many('custom.account.move.line', 'move_id', 'Journal Items')
     state = fields.Selection([
         ('draft', 'Draft'),
         ('posted', 'Posted'),
         ('cancelled', 'Cancelled'),
-    ], default='draft')
-    total_debit = fields.Float('Total Debit', compute='_compute_totals')
-    total_credit = fields.Float('Total Credit', compute='_compute_totals')
-    amount_total = fields.Float('Total Amount', compute='_compute_totals')
+    ], default='draft', index=True)
+    total_debit = fields.Float('Total Debit', compute='_compute_totals', store=True, index=True)
+    total_credit = fields.Float('Total Credit', compute='_compute_totals', store=True)
+    amount_total = fields.Float('Total Amount', compute='_compute_totals', store=True, index=True)
     
+    # 잔액 테이블(custom.account.balance)에 영향을 주는 필드
+    _BALANCE_FIELDS = {'date', 'state', 'line_ids'}
 
+    def init(self):
+        """키셋 페이지네이션(date, id)용 복합 인덱스 생성"""
+        super().init()
+        create_index(self.env.cr, 'custom_account_move_date_id_index', self._table, ['date', 'id'])
     
+    @api.model_create_multi
+    def create(self, vals_list):
+        """분개명이 없으면 분개 일자 연도의 시퀀스(ir.sequence)로 채번"""
+        Sequence = self.env['ir.sequence'].sudo()
+        for vals in vals_list:
+            if not vals.get('name') or vals['name'] == '/':
+                vals['name'] = Sequence.next_by_code('custom.account.move', sequence_date=vals.get('date'))
+        return super().create(vals_list)
+
+    def write(self, vals):
+        """일자/상태/라인 변경 시 잔액/세금 누계 테이블에서 기존 기여분을 빼고 새 값을 더함
+
+        라인 명령(line_ids)으로 인한 라인 단위 갱신은 건너뛰고
+        분개 단위로 한 번에 처리한다.
+        """
+        if self.env.context.get('skip_balance_update') or not (self._BALANCE_FIELDS & vals.keys()):
+            return super().write(vals)
+        Line = self.env['custom.account.move.line']
+        Line._apply_balances(self.line_ids.ids, -1)
+        result = super(CustomAccountMove, self.with_context(skip_balance_update=True)).write(vals)
+        Line._apply_balances(self.line_ids.ids, 1)
+        return result
+
+    def unlink(self):
+        # 라인은 DB 의 ON DELETE CASCADE 로 삭제되므로 여기서 차감
+        if not self.env.context.get('skip_balance_update'):
+            self.env['custom.account.move.line']._apply_balances(self.line_ids.ids, -1)
+        return super().unlink()
+
+    @api.model
+    def _get_default_journal(self):
+        """기본 분개장 (없으면 일반 분개장 생성)"""
+        journal = self.env['custom.account.journal'].search([], limit=1)
+        if not journal:
+            journal = self.env['custom.account.journal'].create({
+                'name': 'General Journal',
+                'code': 'GEN',
+                'type': 'general',
+            })
+        return journal
+
+    @api.model
+    def create_batch(self, entries):
+        """여러 분개를 검증 후 한 번의 create() 로 일괄 생성
+
+        계정/거래처/분개장 존재 여부는 전체 항목에 대해 모델별 한 번씩 조회한다.
+        일괄 생성이 실패하면 항목별 savepoint 로 다시 생성해 실패 항목만 골라낸다.
+        반환: 입력 순서대로 {'index', 'id'} 또는 {'index', 'error'} 리스트
+        """
+        account_ids, partner_ids, journal_ids = set(), set(), set()
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get('journal_id'):
+                journal_ids.add(entry['journal_id'])
+            for line in entry.get('lines', entry.get('line_ids')) or []:
+                if isinstance(line, dict):
+                    account_ids.add(line.get('account_id'))
+                    partner_ids.add(line.get('partner_id'))
+        valid_accounts = set(self.env['custom.account.account'].search(
+            [('id', 'in', [i for i in account_ids if isinstance(i, int)])]).ids)
+        valid_partners = set(self.env['custom.account.partner'].with_context(active_test=False).search(
+            [('id', 'in', [i for i in partner_ids if isinstance(i, int)])]).ids)
+        valid_journals = set(self.env['custom.account.journal'].search(
+            [('id', 'in', [i for i in journal_ids if isinstance(i, int)])]).ids)
+        default_journal = None
+        states = dict(self._fields['state'].selection)
+
+        results = [None] * len(entries)
+        to_create = []  # (index, vals)
+        for index, entry in enumerate(entries):
+            try:
+                if not isinstance(entry, dict):
+                    raise ValueError('entry must be an object')
+                date = fields.Date.to_date(entry['date']) if entry.get('date') else fields.Date.context_today(self)
+                state = entry.get('state') or 'draft'
+                if state not in states:
+                    raise ValueError(f'invalid state: {state}')
+                if entry.get('journal_id'):
+                    if entry['journal_id'] not in valid_journals:
+                        raise ValueError(f"journal {entry['journal_id']} not found")
+                    journal_id = entry['journal_id']
+                else:
+                    default_journal = default_journal or self._get_default_journal()
+                    journal_id = default_journal.id
+                lines = []
+                for line in entry.get('lines', entry.get('line_ids')) or []:
+                    if not isinstance(line, dict):
+                        raise ValueError('line must be an object')
+                    if line.get('account_id') not in valid_accounts:
+                        raise ValueError(f"account {line.get('account_id')} not found")
+                    if line.get('partner_id') and line['partner_id'] not in valid_partners:
+                        raise ValueError(f"partner {line['partner_id']} not found")
+                    lines.append((0, 0, {
+                        'account_id': line['account_id'],
+                        'partner_id': line.get('partner_id') or False,
+                        'name': line.get('name'),
+                        'debit': float(line.get('debit') or 0),
+                        'credit': float(line.get('credit') or 0),
+                        'tax_ids': [(6, 0, line.get('tax_ids') or [])],
+                    }))
+            except (TypeError, ValueError) as e:
+                results[index] = {'index': index, 'error': str(e)}
+                continue
+            to_create.append((index, {
+                'name': entry.get('name') or '/',
+                'date': date,
+                'ref': entry.get('ref'),
+                'journal_id': journal_id,
+                'state': state,
+                'line_ids': lines,
+            }))
+
+        if to_create:
+            try:
+                with self.env.cr.savepoint():
+                    moves = self.create([vals for _index, vals in to_create])
+                    moves.flush_recordset()
+                for (index, _vals), move in zip(to_create, moves):
+                    results[index] = {'index': index, 'id': move.id}
+            except Exception as e:
+                _logger.warning("Batch journal entry creation failed, retrying per entry: %s", e)
+                for index, vals in to_create:
+                    try:
+                        with self.env.cr.savepoint():
+                            move = self.create(vals)
+                            move.flush_recordset()
+                        results[index] = {'index': index, 'id': move.id}
+                    except Exception as item_error:
+                        results[index] = {'index': index, 'error': str(item_error)}
+        return results
+
+    @api.depends('line_ids.debit', 'line_ids.credit')
     def _compute_totals(self):
+        """차변/대변 합계 계산 (저장된 분개는 한 번의 GROUP BY 로 일괄 집계)"""
+        stored = self.filtered('id')
+        totals = {}
+        if stored:
+            groups = self.env['custom.account.move.line']._read_group(
+                [('move_id', 'in', stored.ids)], ['move_id'], ['debit:sum', 'credit:sum'])
+            totals = {move.id: (debit, credit) for move, debit, credit in groups}
         for record in self:
-            total_debit = sum(line.debit for line in record.line_ids)
-            total_credit = sum(line.credit for line in record.line_ids)
+            if record.id:
+                total_debit, total_credit = totals.get(record.id, (0.0, 0.0))
+            else:
+                # 저장 전(onchange) 레코드는 캐시의 라인으로 계산
+                total_debit = sum(record.line_ids.mapped('debit'))
+                total_credit = sum(record.line_ids.mapped('credit'))
             record.total_debit = total_debit
             record.total_credit = total_credit
-            record.amount_total = total_debit - total_credit
\ No newline at end of file
+            record.amount_total = total_debit - total_credit
@@ -1,26 +1,67 @@
-from odoo import models, fields
+from odoo import models, fields, api
 
 class CustomAccountMoveLine(models.Model):
     _name = 'custom.account.move.line'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Journal Entry Line'
 
     move_id = fields.Many2one(
         'custom.account.move',
         string='Journal Entry',
         required=True,
-        ondelete='cascade'
+        ondelete='cascade',
+        index=True
     )
     account_id = fields.Many2one(
         'custom.account.account',
         string='Account',
         required=True,
-        ondelete='cascade'
+        ondelete='cascade',
+        index=True
     )
     partner_id = fields.Many2one(
         'custom.account.partner',
-        string='Partner'
+        string='Partner',
+        index=True
     )
     name = fields.Char('Description')
     debit = fields.Float('Debit')
     credit = fields.Float('Credit')
+    # 라인별 세금 (비어 있으면 계정의 기본 세금 적용)
+    tax_ids = fields.Many2many('custom.account.tax', 'custom_account_move_line_tax_rel', 'line_id', 'tax_id',
+                               string='Taxes')
     
+
+    # 잔액 테이블(custom.account.balance)에 영향을 주는 필드
+    _BALANCE_FIELDS = {'move_id', 'account_id', 'debit', 'credit'}
+    # 세금별 누계(custom.account.tax.balance)에만 영향을 주는 필드
+    _TAX_BALANCE_FIELDS = {'tax_ids'}
+
+    @api.model
+    def _apply_balances(self, line_ids, sign, tax_only=False):
+        """잔액 테이블과 세금별 누계에 라인 기여분을 sign(+1/-1) 만큼 반영"""
+        if not tax_only:
+            self.env['custom.account.balance']._apply_lines(line_ids, sign)
+        self.env['custom.account.tax.balance']._apply(sign, line_ids=line_ids)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        if not self.env.context.get('skip_balance_update'):
+            self._apply_balances(lines.ids, 1)
+        return lines
+
+    def write(self, vals):
+        if self.env.context.get('skip_balance_update') or not (
+                (self._BALANCE_FIELDS | self._TAX_BALANCE_FIELDS) & vals.keys()):
+            return super().write(vals)
+        tax_only = not (self._BALANCE_FIELDS & vals.keys())
+        self._apply_balances(self.ids, -1, tax_only)
+        result = super().write(vals)
+        self._apply_balances(self.ids, 1, tax_only)
+        return result
+
+    def unlink(self):
+        if not self.env.context.get('skip_balance_update'):
+            self._apply_balances(self.ids, -1)
+        return super().unlink()
@@ -1,18 +1,76 @@
-from odoo import models, fields
+from odoo import models, fields, api
+from odoo.tools.sql import escape_psql
 
 # models/account_partner.py
 class CustomAccountPartner(models.Model):
     _name = 'custom.account.partner'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Partner'
     
-    name = fields.Char('Partner Name', required=True)
-    code = fields.Char('Partner Code')
+    # 자동완성 검색(search_autocomplete) 대상 필드는 trigram(GIN) 인덱스 사용
+    name = fields.Char('Partner Name', required=True, index='trigram', unaccent=False)
+    code = fields.Char('Partner Code', index='trigram', unaccent=False)
     type = fields.Selection([
         ('customer', 'Customer'),
         ('supplier', 'Supplier'),
         ('both', 'Both'),
     ], default='both')
-    vat = fields.Char('VAT Number')
+    vat = fields.Char('VAT Number', index='trigram', unaccent=False)
     phone = fields.Char('Phone')
-    email = fields.Char('Email')
-    active = fields.Boolean('Active', default=True)
\ No newline at end of file
+    email = fields.Char('Email', index='trigram', unaccent=False)
+    active = fields.Boolean('Active', default=True)
+
+    @api.model
+    def search_autocomplete(self, term, limit=20, partner_types=None, include_inactive=False):
+        """이름/코드/사업자번호/이메일 부분 일치 검색 (자동완성용)
+
+        코드/사업자번호 완전 일치, 접두어 일치, 부분 일치 순으로 정렬하고
+        같은 순위 안에서는 이름 유사도(pg_trgm 사용 가능 시), 이름 순으로 정렬한다.
+        ILIKE 조건은 각 필드의 trigram 인덱스를 사용한다.
+        반환: [{'id', 'name', 'code', 'type', 'vat', 'email', 'active'}]
+        """
+        term = (term or '').strip()
+        if not term:
+            return []
+        escaped = escape_psql(term)
+        params = {
+            'term': term,
+            'prefix': f'{escaped}%',
+            'contains': f'%{escaped}%',
+            'limit': limit,
+            'types': list(partner_types or []),
+        }
+        filters = []
+        if not include_inactive:
+            filters.append('AND active')
+        if partner_types:
+            filters.append('AND type = ANY(%(types)s)')
+        similarity = 'similarity(name, %(term)s) DESC,' if self.env.registry.has_trigram else ''
+        self.flush_model(['name', 'code', 'type', 'vat', 'email', 'active'])
+        self.env.cr.execute(f"""
+            SELECT id, name, code, type, vat, email, active
+              FROM custom_account_partner
+             WHERE (name ILIKE %(contains)s
+                    OR code ILIKE %(contains)s
+                    OR vat ILIKE %(contains)s
+                    OR email ILIKE %(contains)s)
+                   {' '.join(filters)}
+          ORDER BY CASE
+                       WHEN lower(code) = lower(%(term)s) OR lower(vat) = lower(%(term)s) THEN 0
+                       WHEN name ILIKE %(prefix)s OR code ILIKE %(prefix)s
+                            OR vat ILIKE %(prefix)s OR email ILIKE %(prefix)s THEN 1
+                       ELSE 2
+                   END,
+                   {similarity}
+                   name, id
+             LIMIT %(limit)s
+        """, params)
+        return [{
+            'id': partner_id,
+            'name': name,
+            'code': code,
+            'type': partner_type,
+            'vat': vat,
+            'email': email,
+            'active': active,
+        } for partner_id, name, code, partner_type, vat, email, active in self.env.cr.fetchall()]
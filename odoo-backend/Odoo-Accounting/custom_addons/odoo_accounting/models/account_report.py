@@ -0,0 +1,390 @@
+from datetime import date
+
+from odoo import models, fields, api, tools
+
+# 총계정원장 스트리밍 시 서버 측 커서에서 한 번에 가져오는 행 수
+LEDGER_FETCH_SIZE = 2000
+
+# 보고서 결과가 의존하는 모델 (변경 카운터가 캐시 키에 포함됨)
+REPORT_SOURCE_MODELS = ['custom.account.move', 'custom.account.move.line', 'custom.account.account']
+
+# 거래처 원장/연령 분석 대상 계정 유형 (자산: 채권, 부채: 채무)
+PARTNER_ACCOUNT_KINDS = {'asset': 'receivable', 'liability': 'payable'}
+# 연령 구간 (경과일 상한, None 은 상한 없음)
+AGING_BUCKETS = [('0_30', 0, 30), ('31_60', 31, 60), ('61_90', 61, 90), ('90_plus', 91, None)]
+
+class CustomAccountReport(models.AbstractModel):
+    """회계 보고서 (분개 라인 SQL 집계)"""
+    _name = 'custom.account.report'
+    _description = 'Accounting Reports'
+
+    @api.model
+    def _get_cache_marker(self, model_names=None):
+        """보고서 캐시 키용 변경 표시자 (모델별 변경 표시자 튜플)"""
+        return self.env['custom.account.change.mixin']._get_change_markers(model_names or REPORT_SOURCE_MODELS)
+
+    @api.model
+    def get_trial_balance(self, date_from=None, date_to=None, states=('posted',)):
+        """시산표 조회
+
+        계정별 기초잔액(date_from 이전), 기간 차변/대변, 기말잔액을 반환한다.
+        결과는 (기간, 상태, 변경 표시자) 단위로 캐시되며,
+        분개/계정이 바뀌면 표시자가 달라져 다시 계산된다.
+        """
+        date_from = fields.Date.to_date(date_from) if date_from else None
+        date_to = fields.Date.to_date(date_to) if date_to else fields.Date.today()
+        return self._compute_trial_balance(date_from, date_to, tuple(sorted(states)), self._get_cache_marker())
+
+    @tools.ormcache('date_from', 'date_to', 'states', 'marker')
+    def _compute_trial_balance(self, date_from, date_to, states, marker):
+        # 계정 x 기간 집계를 한 번의 GROUP BY 로 계산 (라인은 date_to 이전만 스캔)
+        self.env.cr.execute("""
+            SELECT a.id, a.code, a.name, a.type,
+                   COALESCE(t.opening, 0), COALESCE(t.debit, 0), COALESCE(t.credit, 0)
+              FROM custom_account_account a
+         LEFT JOIN (
+                    SELECT l.account_id,
+                           SUM(l.debit - l.credit) FILTER (WHERE m.date < %(date_from)s) AS opening,
+                           SUM(l.debit) FILTER (WHERE m.date >= %(date_from)s) AS debit,
+                           SUM(l.credit) FILTER (WHERE m.date >= %(date_from)s) AS credit
+                      FROM custom_account_move_line l
+                      JOIN custom_account_move m ON m.id = l.move_id
+                     WHERE m.state = ANY(%(states)s)
+                       AND m.date <= %(date_to)s
+                  GROUP BY l.account_id
+                   ) t ON t.account_id = a.id
+          ORDER BY a.code, a.id
+        """, {
+            'date_from': date_from or date.min,
+            'date_to': date_to,
+            'states': list(states),
+        })
+        lines = []
+        totals = {'opening_balance': 0.0, 'debit': 0.0, 'credit': 0.0, 'closing_balance': 0.0}
+        for account_id, code, name, account_type, opening, debit, credit in self.env.cr.fetchall():
+            line = {
+                'account_id': account_id,
+                'account_code': code,
+                'account_name': name,
+                'account_type': account_type,
+                'opening_balance': opening,
+                'debit': debit,
+                'credit': credit,
+                'closing_balance': opening + debit - credit,
+            }
+            for key in totals:
+                totals[key] += line[key]
+            lines.append(line)
+        return {
+            'date_from': fields.Date.to_string(date_from) if date_from else None,
+            'date_to': fields.Date.to_string(date_to),
+            'states': list(states),
+            'lines': lines,
+            'totals': totals,
+        }
+
+    @api.model
+    def get_account_rollups(self, date_from=None, date_to=None, states=('posted',), root_id=None):
+        """계정 계층별 합산 잔액 조회
+
+        각 계정에 대해 자기 라인만의 금액(own_*)과 자신 + 모든 하위 계정의
+        합산 금액(기초잔액, 기간 차변/대변, 기말잔액)을 반환한다.
+        root_id 를 주면 해당 계정과 그 하위 계정만 반환한다.
+        시산표와 같이 (기간, 상태, 변경 표시자) 단위로 캐시된다.
+        """
+        date_from = fields.Date.to_date(date_from) if date_from else None
+        date_to = fields.Date.to_date(date_to) if date_to else fields.Date.today()
+        return self._compute_account_rollups(date_from, date_to, tuple(sorted(states)), root_id or None,
+                                             self._get_cache_marker())
+
+    @tools.ormcache('date_from', 'date_to', 'states', 'root_id', 'marker')
+    def _compute_account_rollups(self, date_from, date_to, states, root_id, marker):
+        # 계정별 집계를 한 번 계산한 뒤 parent_path 접두어 조인으로 상위 계정에 합산
+        self.env['custom.account.account'].flush_model(['parent_path'])
+        root_filter = ''
+        if root_id:
+            root_filter = """
+               AND a.parent_path LIKE (SELECT parent_path FROM custom_account_account WHERE id = %(root_id)s) || '%%'
+            """
+        self.env.cr.execute(f"""
+            WITH own AS (
+                SELECT l.account_id,
+                       COALESCE(SUM(l.debit - l.credit) FILTER (WHERE m.date < %(date_from)s), 0) AS opening,
+                       COALESCE(SUM(l.debit) FILTER (WHERE m.date >= %(date_from)s), 0) AS debit,
+                       COALESCE(SUM(l.credit) FILTER (WHERE m.date >= %(date_from)s), 0) AS credit
+                  FROM custom_account_move_line l
+                  JOIN custom_account_move m ON m.id = l.move_id
+                 WHERE m.state = ANY(%(states)s)
+                   AND m.date <= %(date_to)s
+              GROUP BY l.account_id
+            )
+            SELECT a.id, a.code, a.name, a.type, a.parent_id,
+                   array_length(string_to_array(a.parent_path, '/'), 1) - 2 AS level,
+                   COALESCE(MAX(o.opening) FILTER (WHERE d.id = a.id), 0),
+                   COALESCE(MAX(o.debit) FILTER (WHERE d.id = a.id), 0),
+                   COALESCE(MAX(o.credit) FILTER (WHERE d.id = a.id), 0),
+                   COALESCE(SUM(o.opening), 0),
+                   COALESCE(SUM(o.debit), 0),
+                   COALESCE(SUM(o.credit), 0)
+              FROM custom_account_account a
+              JOIN custom_account_account d ON d.parent_path LIKE a.parent_path || '%%'
+         LEFT JOIN own o ON o.account_id = d.id
+             WHERE TRUE {root_filter}
+          GROUP BY a.id
+          ORDER BY a.parent_path
+        """, {
+            'date_from': date_from or date.min,
+            'date_to': date_to,
+            'states': list(states),
+            'root_id': root_id,
+        })
+        lines = []
+        for (account_id, code, name, account_type, parent_id, level,
+             own_opening, own_debit, own_credit, opening, debit, credit) in self.env.cr.fetchall():
+            lines.append({
+                'account_id': account_id,
+                'account_code': code,
+                'account_name': name,
+                'account_type': account_type,
+                'parent_id': parent_id,
+                'level': level,
+                'own_opening_balance': own_opening,
+                'own_debit': own_debit,
+                'own_credit': own_credit,
+                'own_closing_balance': own_opening + own_debit - own_credit,
+                'opening_balance': opening,
+                'debit': debit,
+                'credit': credit,
+                'closing_balance': opening + debit - credit,
+            })
+        return {
+            'date_from': fields.Date.to_string(date_from) if date_from else None,
+            'date_to': fields.Date.to_string(date_to),
+            'states': list(states),
+            'root_id': root_id,
+            'lines': lines,
+        }
+
+    @api.model
+    def _iter_general_ledger(self, account_ids, date_from=None, date_to=None, states=('posted',),
+                             fetch_size=LEDGER_FETCH_SIZE):
+        """총계정원장 행을 fetch_size 건씩 리스트로 yield
+
+        계정별 첫 행으로 기초잔액(type='opening')을 내보내고, 이어서 기간 내
+        분개 라인을 (일자, id) 순으로 누적잔액과 함께 내보낸다. 누적잔액은
+        윈도 함수로 SQL 에서 계산하며, 결과는 서버 측 커서(DECLARE/FETCH)로
+        나눠 읽어 ORM 캐시를 거치지 않는다.
+        """
+        params = {
+            'account_ids': list(account_ids),
+            'date_from': fields.Date.to_date(date_from) if date_from else date.min,
+            'date_to': fields.Date.to_date(date_to) if date_to else fields.Date.today(),
+            'states': list(states),
+        }
+        self.env['custom.account.move'].flush_model(['date', 'state', 'name', 'ref'])
+        self.env['custom.account.move.line'].flush_model()
+        cr = self.env.cr
+        cr.execute("""
+            DECLARE general_ledger_cursor NO SCROLL CURSOR FOR
+            WITH opening AS (
+                SELECT l.account_id, SUM(l.debit - l.credit) AS balance
+                  FROM custom_account_move_line l
+                  JOIN custom_account_move m ON m.id = l.move_id
+                 WHERE l.account_id = ANY(%(account_ids)s)
+                   AND m.state = ANY(%(states)s)
+                   AND m.date < %(date_from)s
+              GROUP BY l.account_id
+            )
+            SELECT 'opening', a.id, NULL::integer, NULL::integer, NULL::varchar, NULL::date, NULL::varchar,
+                   NULL::varchar, NULL::integer, NULL::varchar, 0.0, 0.0, COALESCE(o.balance, 0)
+              FROM custom_account_account a
+         LEFT JOIN opening o ON o.account_id = a.id
+             WHERE a.id = ANY(%(account_ids)s)
+         UNION ALL
+            SELECT 'line', l.account_id, l.id, m.id, m.name, m.date, m.ref,
+                   l.name, l.partner_id, p.name, l.debit, l.credit,
+                   COALESCE(o.balance, 0) + SUM(l.debit - l.credit) OVER (
+                       PARTITION BY l.account_id ORDER BY m.date, l.id
+                       ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW)
+              FROM custom_account_move_line l
+              JOIN custom_account_move m ON m.id = l.move_id
+         LEFT JOIN custom_account_partner p ON p.id = l.partner_id
+         LEFT JOIN opening o ON o.account_id = l.account_id
+             WHERE l.account_id = ANY(%(account_ids)s)
+               AND m.state = ANY(%(states)s)
+               AND m.date >= %(date_from)s
+               AND m.date <= %(date_to)s
+          ORDER BY 2, 6 NULLS FIRST, 3 NULLS FIRST
+        """, params)
+        try:
+            while True:
+                cr.execute("FETCH FORWARD %s FROM general_ledger_cursor", (fetch_size,))
+                rows = cr.fetchall()
+                if not rows:
+                    break
+                yield [{
+                    'type': row_type,
+                    'account_id': account_id,
+                    'line_id': line_id,
+                    'move_id': move_id,
+                    'move_name': move_name,
+                    'date': fields.Date.to_string(line_date) if line_date else None,
+                    'ref': ref,
+                    'name': name,
+                    'partner_id': partner_id,
+                    'partner_name': partner_name,
+                    'debit': debit,
+                    'credit': credit,
+                    'balance': balance,
+                } for (row_type, account_id, line_id, move_id, move_name, line_date, ref,
+                       name, partner_id, partner_name, debit, credit, balance) in rows]
+                if len(rows) < fetch_size:
+                    break
+        finally:
+            cr.execute("CLOSE general_ledger_cursor")
+
+    def _iter_cursor(self, name, query, params, fetch_size):
+        """query 를 서버 측 커서로 열어 fetch_size 행씩 yield"""
+        cr = self.env.cr
+        cr.execute(f"DECLARE {name} NO SCROLL CURSOR FOR {query}", params)
+        try:
+            while True:
+                cr.execute(f"FETCH FORWARD %s FROM {name}", (fetch_size,))
+                rows = cr.fetchall()
+                if not rows:
+                    break
+                yield rows
+                if len(rows) < fetch_size:
+                    break
+        finally:
+            cr.execute(f"CLOSE {name}")
+
+    def _partner_line_filters(self, partner_types, partner_ids):
+        filters = ''
+        if partner_types:
+            filters += ' AND p.type = ANY(%(partner_types)s)'
+        if partner_ids:
+            filters += ' AND p.id = ANY(%(partner_ids)s)'
+        return filters
+
+    @api.model
+    def _iter_partner_ledger(self, date_from=None, date_to=None, states=('posted',), partner_types=None,
+                             partner_ids=None, fetch_size=LEDGER_FETCH_SIZE):
+        """거래처 원장 (거래처별 기초잔액, 기간 차변/대변, 기말잔액)을 fetch_size 건씩 yield
+
+        채권/채무 계정(자산/부채 유형)의 거래처 지정 라인을 거래처 단위로
+        한 번에 집계한다. partner_types 로 거래처 유형(customer/supplier/both)을 거른다.
+        """
+        params = {
+            'date_from': fields.Date.to_date(date_from) if date_from else date.min,
+            'date_to': fields.Date.to_date(date_to) if date_to else fields.Date.today(),
+            'states': list(states),
+            'account_types': list(PARTNER_ACCOUNT_KINDS),
+            'partner_types': list(partner_types or []),
+            'partner_ids': list(partner_ids or []),
+        }
+        self.env['custom.account.move'].flush_model(['date', 'state'])
+        self.env['custom.account.move.line'].flush_model(['move_id', 'account_id', 'partner_id', 'debit', 'credit'])
+        self.env['custom.account.partner'].flush_model(['name', 'code', 'type'])
+        query = f"""
+            SELECT p.id, p.code, p.name, p.type,
+                   COALESCE(SUM(l.debit - l.credit) FILTER (WHERE m.date < %(date_from)s), 0),
+                   COALESCE(SUM(l.debit) FILTER (WHERE m.date >= %(date_from)s), 0),
+                   COALESCE(SUM(l.credit) FILTER (WHERE m.date >= %(date_from)s), 0)
+              FROM custom_account_move_line l
+              JOIN custom_account_move m ON m.id = l.move_id
+              JOIN custom_account_account a ON a.id = l.account_id
+              JOIN custom_account_partner p ON p.id = l.partner_id
+             WHERE m.state = ANY(%(states)s)
+               AND m.date <= %(date_to)s
+               AND a.type = ANY(%(account_types)s)
+               {self._partner_line_filters(partner_types, partner_ids)}
+          GROUP BY p.id
+          ORDER BY p.name, p.id
+        """
+        for rows in self._iter_cursor('partner_ledger_cursor', query, params, fetch_size):
+            yield [{
+                'partner_id': partner_id,
+                'partner_code': code,
+                'partner_name': name,
+                'partner_type': partner_type,
+                'opening_balance': opening,
+                'debit': debit,
+                'credit': credit,
+                'closing_balance': opening + debit - credit,
+            } for partner_id, code, name, partner_type, opening, debit, credit in rows]
+
+    @api.model
+    def _iter_partner_aging(self, as_of=None, partner_types=None, partner_ids=None, fetch_size=LEDGER_FETCH_SIZE):
+        """거래처별 채권/채무 연령 분석 (0-30/31-60/61-90/90+ 일)을 fetch_size 건씩 yield
+
+        as_of 까지 전기된 채권(자산 계정, 차변 - 대변)/채무(부채 계정, 대변 - 차변)
+        라인에서 반제 금액(음수 라인 합계)을 오래된 미결 금액부터 차감(FIFO)한 뒤
+        남은 금액을 분개 일자 기준 경과일 구간으로 나눠 한 번의 쿼리로 집계한다.
+        balance 는 순잔액이며, 반제가 미결 금액보다 크면 구간 합계 0, balance 음수가 된다.
+        """
+        params = {
+            'as_of': fields.Date.to_date(as_of) if as_of else fields.Date.today(),
+            'account_types': list(PARTNER_ACCOUNT_KINDS),
+            'partner_types': list(partner_types or []),
+            'partner_ids': list(partner_ids or []),
+        }
+        self.env['custom.account.move'].flush_model(['date', 'state'])
+        self.env['custom.account.move.line'].flush_model(['move_id', 'account_id', 'partner_id', 'debit', 'credit'])
+        self.env['custom.account.partner'].flush_model(['name', 'code', 'type'])
+        kind_case = ' '.join(f"WHEN '{account_type}' THEN '{kind}'" for account_type, kind in PARTNER_ACCOUNT_KINDS.items())
+        bucket_columns = ',\n'.join(
+            f"COALESCE(SUM(o.open_amount) FILTER (WHERE %(as_of)s - o.date >= {low}"
+            + (f" AND %(as_of)s - o.date <= {high}" if high is not None else '') + "), 0)"
+            for _name, low, high in AGING_BUCKETS
+        )
+        query = f"""
+            WITH items AS (
+                SELECT l.id, l.partner_id, m.date,
+                       CASE a.type {kind_case} END AS kind,
+                       CASE WHEN a.type = 'asset' THEN l.debit - l.credit ELSE l.credit - l.debit END AS amount
+                  FROM custom_account_move_line l
+                  JOIN custom_account_move m ON m.id = l.move_id
+                  JOIN custom_account_account a ON a.id = l.account_id
+                  JOIN custom_account_partner p ON p.id = l.partner_id
+                 WHERE m.state = 'posted'
+                   AND m.date <= %(as_of)s
+                   AND a.type = ANY(%(account_types)s)
+                   {self._partner_line_filters(partner_types, partner_ids)}
+            ),
+            totals AS (
+                SELECT partner_id, kind,
+                       SUM(amount) AS balance,
+                       COALESCE(SUM(-amount) FILTER (WHERE amount < 0), 0) AS settled
+                  FROM items
+              GROUP BY partner_id, kind
+            ),
+            open_items AS (
+                SELECT i.partner_id, i.kind, i.date,
+                       GREATEST(0, LEAST(i.amount,
+                           SUM(i.amount) OVER (PARTITION BY i.partner_id, i.kind ORDER BY i.date, i.id
+                                               ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW) - t.settled
+                       )) AS open_amount
+                  FROM items i
+                  JOIN totals t ON t.partner_id = i.partner_id AND t.kind = i.kind
+                 WHERE i.amount > 0
+            )
+            SELECT t.partner_id, p.code, p.name, p.type, t.kind, t.balance,
+                   {bucket_columns}
+              FROM totals t
+              JOIN custom_account_partner p ON p.id = t.partner_id
+         LEFT JOIN open_items o ON o.partner_id = t.partner_id AND o.kind = t.kind
+          GROUP BY t.partner_id, t.kind, t.balance, p.id
+            HAVING t.balance <> 0
+          ORDER BY p.name, t.partner_id, t.kind
+        """
+        for rows in self._iter_cursor('partner_aging_cursor', query, params, fetch_size):
+            yield [{
+                'partner_id': row[0],
+                'partner_code': row[1],
+                'partner_name': row[2],
+                'partner_type': row[3],
+                'kind': row[4],
+                'balance': row[5],
+                **{f'bucket_{name}': amount for (name, _low, _high), amount in zip(AGING_BUCKETS, row[6:])},
+            } for row in rows]
@@ -1,11 +1,20 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
 import logging
 
+from .account_tax_balance import TAX_AMOUNT_FIELDS
+from .tax_compute import TaxParams, compute_lines
+
+# 값이 바뀌면 세금 파라미터 캐시를 비워야 하는 필드
+TAX_PARAM_FIELDS = ('amount', 'amount_type', 'calculation_method', 'is_exempt')
+# 값이 바뀌면 세금별 누계(custom.account.tax.balance)를 다시 반영해야 하는 필드
+TAX_BALANCE_FIELDS = TAX_PARAM_FIELDS + ('type_tax_use', 'tax_category')
+
 _logger = logging.getLogger(__name__)
 
 class CustomAccountTaxGroup(models.Model):
     _name = 'custom.account.tax.group'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Tax Group'
     
     name = fields.Char('Group Name', required=True)
@@ -33,6 +42,7 @@ class CustomAccountTaxGroup(models.Model):
 
 class CustomAccountTaxPeriod(models.Model):
     _name = 'custom.account.tax.period'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Tax Period'
     
     name = fields.Char('Period Name', required=True)
@@ -60,6 +70,22 @@ class CustomAccountTaxPeriod(models.Model):
     # 세금 신고서
     tax_report_ids = fields.One2many('custom.account.tax.report', 'tax_period_id', string='Tax Reports')
     
+    # 기간 부가세 누계 (세금별/월별 누계 테이블에서 집계)
+    sale_vat_amount = fields.Float('매출 부가세', compute='_compute_vat_totals')
+    purchase_vat_amount = fields.Float('매입 부가세', compute='_compute_vat_totals')
+    exempt_amount = fields.Float('면세 공급가액', compute='_compute_vat_totals')
+    zero_rated_amount = fields.Float('영세 공급가액', compute='_compute_vat_totals')
+    withholding_amount = fields.Float('원천징수세액', compute='_compute_vat_totals')
+    
+    @api.depends('date_start', 'date_end')
+    def _compute_vat_totals(self):
+        TaxBalance = self.env['custom.account.tax.balance']
+        for period in self:
+            if period.date_start and period.date_end:
+                period.update(TaxBalance.get_totals(period.date_start, period.date_end))
+            else:
+                period.update(dict.fromkeys(TAX_AMOUNT_FIELDS, 0.0))
+    
     def action_close(self):
         """세금 기간 마감"""
         self.ensure_one()
@@ -72,6 +98,7 @@ class CustomAccountTaxPeriod(models.Model):
 
 class CustomAccountTaxReport(models.Model):
     _name = 'custom.account.tax.report'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Tax Report'
     _order = 'date desc'
     
@@ -145,43 +172,38 @@ class CustomAccountTaxReport(models.Model):
         self.submitted_at = fields.Datetime.now()
     
     def generate_report_data(self):
-        """세금 신고 데이터 생성"""
+        """세금 신고 데이터 생성
+
+        기간 내 전기된 분개 라인의 세금(라인 세금, 없으면 계정 기본 세금)별
+        금액을 합산한다. 온전한 달은 세금별/월별 누계(custom.account.tax.balance)
+        에서 바로 읽고, 월 중간 구간만 분개 라인에서 집계한다.
+        신고서에 세금이 지정되어 있으면 해당 세금만 집계한다.
+        """
         self.ensure_one()
-        
-        # 해당 기간의 분개 데이터 조회
-        moves = self.env['custom.account.move'].search([
-            ('date', '>=', self.period_start),
-            ('date', '<=', self.period_end),
-            ('state', '=', 'posted')
-        ])
-        
-        sale_vat = 0.0
-        purchase_vat = 0.0
-        exempt_amount = 0.0
-        zero_rated_amount = 0.0
-        
-        for move in moves:
-            for line in move.line_ids:
-                if line.account_id and line.account_id.tax_ids:
-                    for tax in line.account_id.tax_ids:
-                        if tax.type_tax_use == 'sale':
-                            if tax.is_exempt:
-                                exempt_amount += abs(line.credit - line.debit)
-                            else:
-                                sale_vat += tax.compute_tax(abs(line.credit - line.debit))
-                        elif tax.type_tax_use == 'purchase':
-                            purchase_vat += tax.compute_tax(abs(line.credit - line.debit))
-        
-        self.write({
-            'sale_vat_amount': sale_vat,
-            'purchase_vat_amount': purchase_vat,
-            'exempt_amount': exempt_amount,
-        })
+        totals = self.env['custom.account.tax.balance'].get_totals(
+            self.period_start, self.period_end, self.tax_ids.ids)
+        self.write(totals)
         
         return True
+    
+    @api.model
+    def _job_generate(self, report_id):
+        """백그라운드 작업(custom.account.job) 실행 진입점"""
+        report = self.browse(report_id)
+        report.generate_report_data()
+        return {
+            'id': report.id,
+            'sale_vat_amount': report.sale_vat_amount,
+            'purchase_vat_amount': report.purchase_vat_amount,
+            'exempt_amount': report.exempt_amount,
+            'zero_rated_amount': report.zero_rated_amount,
+            'withholding_amount': report.withholding_amount,
+            'vat_payable': report.vat_payable,
+        }
 
 class CustomAccountTax(models.Model):
     _name = 'custom.account.tax'
+    _inherit = ['custom.account.change.mixin']
     _description = 'Tax Configuration'
     _order = 'sequence, id'
 
@@ -254,59 +276,82 @@ class CustomAccountTax(models.Model):
             if tax.amount < 0:
                 raise ValidationError('세율은 0 이상이어야 합니다.')
     
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """세금 생성 시 코드 자동 생성"""
-        if not vals.get('code'):
-            vals['code'] = self._generate_tax_code()
-        return super().create(vals)
+        for vals in vals_list:
+            if not vals.get('code'):
+                vals['code'] = self._generate_tax_code()
+        return super().create(vals_list)
     
     def write(self, vals):
-        """세금 수정 시 updated_at 자동 업데이트"""
+        """세금 수정 시 updated_at 자동 업데이트 (계산 파라미터 변경 시 캐시 무효화, 누계 재반영)"""
         vals['updated_at'] = fields.Datetime.now()
-        return super().write(vals)
+        if not any(field in vals for field in TAX_BALANCE_FIELDS):
+            return super().write(vals)
+        TaxBalance = self.env['custom.account.tax.balance']
+        TaxBalance._apply(-1, tax_ids=self.ids)
+        result = super().write(vals)
+        TaxBalance._apply(1, tax_ids=self.ids)
+        if any(field in vals for field in TAX_PARAM_FIELDS):
+            self.env.registry.clear_cache()
+        return result
+    
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache()
+        return result
     
+    @api.model
     def _generate_tax_code(self):
-        """세금 코드 자동 생성"""
-        # TAX + 현재 연도 + 6자리 시퀀스
-        current_year = fields.Date.today().year
-        last_tax = self.search([('code', 'like', f'TAX{current_year}%')], order='code desc', limit=1)
-        
-        if last_tax and last_tax.code:
-            # 기존 코드에서 시퀀스 추출
-            try:
-                last_sequence = int(last_tax.code[-6:])
-                new_sequence = last_sequence + 1
-            except ValueError:
-                new_sequence = 1
-        else:
-            new_sequence = 1
-        
-        return f'TAX{current_year}{new_sequence:06d}'
+        """세금 코드 자동 생성 (TAX + 연도 + 6자리, 연도별 시퀀스)"""
+        return self.env['ir.sequence'].sudo().next_by_code('custom.account.tax')
+    
+    @api.model
+    def _sync_code_sequence(self):
+        """올해 세금 코드 시퀀스를 기존 코드의 최대 번호 다음으로 맞춤"""
+        sequence = self.env['ir.sequence'].sudo().search([('code', '=', 'custom.account.tax')], limit=1)
+        if not sequence:
+            return
+        year = fields.Date.today().year
+        self.flush_model(['code'])
+        self.env.cr.execute("""
+            SELECT MAX(SUBSTRING(code FROM %s)::bigint)
+              FROM custom_account_tax
+             WHERE code ~ %s
+        """, (f'^TAX{year}([0-9]+)$', f'^TAX{year}[0-9]+$'))
+        last_number = self.env.cr.fetchone()[0]
+        if not last_number:
+            return
+        date_range = sequence._get_current_sequence()
+        if date_range.number_next_actual <= last_number:
+            date_range.number_next_actual = last_number + 1
     
     def compute_tax(self, base_amount, price_unit=0.0, quantity=1.0):
         """세금 계산"""
         self.ensure_one()
+        params = self._tax_params()
         
-        if self.amount_type == 'percent':
-            if self.calculation_method == 'exclusive':
+        if params.percent:
+            if not params.inclusive:
                 # 공급가액 기준
-                tax_amount = base_amount * (self.amount / 100.0)
+                tax_amount = base_amount * (params.rate / 100.0)
             else:
                 # 공급대가 기준
                 total_amount = base_amount
-                tax_amount = total_amount * (self.amount / (100.0 + self.amount))
+                tax_amount = total_amount * (params.rate / (100.0 + params.rate))
         else:
             # 고정 금액
-            tax_amount = self.amount * quantity
+            tax_amount = params.rate * quantity
             
         return round(tax_amount, 2)
     
     def compute_all(self, base_amount, price_unit=0.0, quantity=1.0):
         """전체 세금 계산 (공급가액, 세액, 공급대가)"""
         self.ensure_one()
+        params = self._tax_params()
         
-        if self.is_exempt:
+        if params.exempt:
             return {
                 'base': base_amount,
                 'tax': 0.0,
@@ -315,7 +360,7 @@ class CustomAccountTax(models.Model):
         
         tax_amount = self.compute_tax(base_amount, price_unit, quantity)
         
-        if self.calculation_method == 'exclusive':
+        if not params.inclusive:
             # 공급가액 기준
             return {
                 'base': base_amount,
@@ -329,5 +374,74 @@ class CustomAccountTax(models.Model):
                 'tax': tax_amount,
                 'total': base_amount,
             }
+    
+    def _tax_params(self):
+        """이 세금의 계산 파라미터 (저장된 세금은 프로세스 캐시 사용)"""
+        self.ensure_one()
+        if isinstance(self.id, int):
+            params = self._get_cached_tax_params(self.id)
+            if params is not None:
+                return params
+        return TaxParams(
+            percent=self.amount_type == 'percent',
+            rate=self.amount,
+            inclusive=self.calculation_method == 'inclusive',
+            exempt=self.is_exempt,
+        )
+    
+    @tools.ormcache('tax_id')
+    def _get_cached_tax_params(self, tax_id):
+        """세금 id 별 계산 파라미터 캐시 (없는 세금이면 None)
+
+        write/unlink 에서 registry.clear_cache() 로 무효화되며, 다른 워커에는
+        레지스트리 캐시 시퀀스를 통해 전파된다.
+        """
+        records = self.sudo().browse(tax_id).exists().read(list(TAX_PARAM_FIELDS))
+        if not records:
+            return None
+        record = records[0]
+        return TaxParams(
+            percent=record['amount_type'] == 'percent',
+            rate=record['amount'],
+            inclusive=record['calculation_method'] == 'inclusive',
+            exempt=record['is_exempt'],
+        )
+    
+    @api.model
+    def _get_tax_params(self, tax_ids):
+        """세금 계산용 파라미터 {세금 id: TaxParams} (캐시 사용, 없는 세금은 제외)"""
+        params = {}
+        for tax_id in set(tax_ids):
+            tax_params = self._get_cached_tax_params(tax_id)
+            if tax_params is not None:
+                params[tax_id] = tax_params
+        return params
+    
+    @api.model
+    def compute_all_batch(self, lines):
+        """여러 라인의 세금 일괄 계산 (compute_all 과 같은 규칙)
+
+        lines: [{'base_amount' (없으면 price_unit x quantity), 'quantity', 'tax_ids'}]
+        반환: {'lines': [{'base', 'tax', 'total'}], 'taxes': [{'tax_id', 'base', 'tax'}], 'totals'}
+        """
+        parsed = []
+        for line in lines:
+            # quantity 가 없거나 null 이면 1 (명시적인 0 은 그대로)
+            quantity = 1.0 if line.get('quantity') is None else float(line['quantity'])
+            if line.get('base_amount') is not None:
+                amount = float(line['base_amount'])
+            else:
+                amount = float(line.get('price_unit') or 0.0) * quantity
+            parsed.append((amount, quantity, [int(tax_id) for tax_id in line.get('tax_ids') or []]))
+        params = self._get_tax_params({tax_id for _amount, _quantity, tax_ids in parsed for tax_id in tax_ids})
+        results, subtotals = compute_lines(parsed, params)
+        return {
+            'lines': results,
+            'taxes': [{'tax_id': tax_id, **subtotal} for tax_id, subtotal in subtotals.items()],
+            'totals': {
+                key: round(sum(result[key] for result in results), 2)
+                for key in ('base', 'tax', 'total')
+            },
+        }
 
  
\ No newline at end of file
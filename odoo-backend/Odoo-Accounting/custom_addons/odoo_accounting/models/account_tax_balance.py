@@ -0,0 +1,235 @@
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools.sql import create_index
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# (세금, 라인) 쌍별 금액을 신고 금액 필드로 모으는 집계식
+TAX_AMOUNT_AGGREGATES = [
+    ('sale_vat_amount', "SUM(tax) FILTER (WHERE direction = 'sale' AND NOT is_exempt AND NOT is_withholding)"),
+    ('purchase_vat_amount', "SUM(tax) FILTER (WHERE direction = 'purchase' AND NOT is_withholding)"),
+    ('exempt_amount', "SUM(base) FILTER (WHERE direction = 'sale' AND is_exempt)"),
+    ('zero_rated_amount', "SUM(base) FILTER (WHERE direction = 'sale' AND NOT is_exempt AND is_zero_rated)"),
+    ('withholding_amount', "SUM(tax) FILTER (WHERE is_withholding AND NOT is_exempt)"),
+]
+
+TAX_AMOUNT_FIELDS = [name for name, _expression in TAX_AMOUNT_AGGREGATES]
+
+class CustomAccountTaxBalance(models.Model):
+    """세금별/월별 부가세 누계 (전기된 분개 라인 기준 사전 집계 테이블)
+
+    분개 전기/취소, 전기된 분개의 라인 수정, 라인/계정 세금 변경, 세금 설정
+    변경 시 해당 분의 기여분을 증감 행으로 추가한다 (_apply). 행을 갱신하지
+    않으므로 동시 전기끼리 (세금, 월) 행 잠금 경합이 없고, 주기 작업(_compact)이
+    키별 한 행으로 합친다. 세금 신고서는 월 단위 기간이면 이 테이블의 합계로 채운다.
+    """
+    _name = 'custom.account.tax.balance'
+    _description = 'Tax Amounts by Period'
+    _order = 'period desc, tax_id'
+
+    tax_id = fields.Many2one('custom.account.tax', string='Tax', required=True, ondelete='cascade', index=True)
+    period = fields.Date('Period', required=True, index=True, help='해당 월의 1일')
+    sale_vat_amount = fields.Float('매출 부가세', default=0.0)
+    purchase_vat_amount = fields.Float('매입 부가세', default=0.0)
+    exempt_amount = fields.Float('면세 공급가액', default=0.0)
+    zero_rated_amount = fields.Float('영세 공급가액', default=0.0)
+    withholding_amount = fields.Float('원천징수세액', default=0.0)
+    line_count = fields.Integer('Line Count', default=0)
+
+    def init(self):
+        super().init()
+        # 증감 행 방식으로 바뀌면서 키별 유일 제약 대신 일반 인덱스 사용
+        self.env.cr.execute(f'ALTER TABLE "{self._table}" DROP CONSTRAINT IF EXISTS "{self._table}_tax_period_uniq"')
+        create_index(self.env.cr, f'{self._table}_tax_period_index', self._table, ['tax_id', 'period'])
+        self.env.cr.execute(f'SELECT 1 FROM "{self._table}" LIMIT 1')
+        if not self.env.cr.fetchone():
+            self.rebuild()
+
+    def _flush_sources(self):
+        self.env['custom.account.move'].flush_model(['date', 'state'])
+        self.env['custom.account.move.line'].flush_model(['move_id', 'account_id', 'debit', 'credit', 'tax_ids'])
+        self.env['custom.account.account'].flush_model(['tax_ids'])
+        self.env['custom.account.tax'].flush_model()
+
+    @api.model
+    def _line_amounts_query(self, line_where, tax_where='TRUE'):
+        """(세금, 라인) 쌍별 금액 서브쿼리
+
+        라인 세금(없으면 계정 기본 세금)을 적용해 tax_id, period, direction,
+        is_exempt, is_zero_rated, is_withholding, base, tax 를 반환한다.
+        세액은 compute_tax 와 같이 라인 단위로 소수 둘째 자리에서 반올림한다.
+        공급/매입 겸용 세금은 라인 방향(대변이면 매출)으로 구분한다.
+        line_where 는 분개 라인(l)/분개(m), tax_where 는 세금(t) 조건이다.
+        """
+        return f"""
+            WITH scoped_lines AS (
+                SELECT l.id, l.account_id, l.debit, l.credit, date_trunc('month', m.date)::date AS period
+                  FROM custom_account_move_line l
+                  JOIN custom_account_move m ON m.id = l.move_id
+                 WHERE {line_where}
+            ),
+            line_taxes AS (
+                SELECT sl.period, sl.debit, sl.credit, lt.tax_id
+                  FROM scoped_lines sl
+                  JOIN custom_account_move_line_tax_rel lt ON lt.line_id = sl.id
+             UNION ALL
+                SELECT sl.period, sl.debit, sl.credit, at.tax_id
+                  FROM scoped_lines sl
+                  JOIN custom_account_account_tax_rel at ON at.account_id = sl.account_id
+                 WHERE NOT EXISTS (SELECT 1 FROM custom_account_move_line_tax_rel lt WHERE lt.line_id = sl.id)
+            )
+            SELECT t.id AS tax_id,
+                   lt.period,
+                   CASE
+                       WHEN t.type_tax_use = 'both' THEN
+                           CASE WHEN lt.credit >= lt.debit THEN 'sale' ELSE 'purchase' END
+                       ELSE t.type_tax_use
+                   END AS direction,
+                   COALESCE(t.is_exempt, FALSE) AS is_exempt,
+                   t.amount_type = 'percent' AND COALESCE(t.amount, 0) = 0 AS is_zero_rated,
+                   t.tax_category = 'withholding' AS is_withholding,
+                   ABS(lt.credit - lt.debit)::numeric AS base,
+                   ROUND(CASE
+                       WHEN t.amount_type <> 'percent' THEN COALESCE(t.amount, 0)::numeric
+                       WHEN t.calculation_method = 'exclusive' THEN
+                           ABS(lt.credit - lt.debit)::numeric * t.amount::numeric / 100
+                       ELSE ABS(lt.credit - lt.debit)::numeric * t.amount::numeric / (100 + t.amount::numeric)
+                   END, 2) AS tax
+              FROM line_taxes lt
+              JOIN custom_account_tax t ON t.id = lt.tax_id
+             WHERE t.type_tax_use IN ('sale', 'purchase', 'both')
+               AND {tax_where}
+        """
+
+    @api.model
+    def _apply(self, sign, line_ids=None, account_ids=None, tax_ids=None):
+        """전기된 분개 라인의 현재 DB 값을 누계에 sign(+1/-1) 만큼 증감 행으로 추가
+
+        line_ids/account_ids 로 라인 범위를, tax_ids 로 세금 범위를 제한한다.
+        """
+        line_where = ["m.state = 'posted'"]
+        tax_where = 'TRUE'
+        if line_ids is not None:
+            if not line_ids:
+                return
+            line_where.append('l.id = ANY(%(line_ids)s)')
+        if account_ids is not None:
+            if not account_ids:
+                return
+            line_where.append('l.account_id = ANY(%(account_ids)s)')
+        if tax_ids is not None:
+            if not tax_ids:
+                return
+            tax_where = 't.id = ANY(%(tax_ids)s)'
+        self._flush_sources()
+        self.env.cr.execute(f"""
+            INSERT INTO custom_account_tax_balance
+                   (tax_id, period, sale_vat_amount, purchase_vat_amount, exempt_amount, zero_rated_amount,
+                    withholding_amount, line_count, create_uid, create_date, write_uid, write_date)
+            SELECT tax_id, period,
+                   {', '.join(f'%(sign)s * COALESCE({expression}, 0)' for _name, expression in TAX_AMOUNT_AGGREGATES)},
+                   %(sign)s * COUNT(*),
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM ({self._line_amounts_query(' AND '.join(line_where), tax_where)}) amounts
+          GROUP BY tax_id, period
+        """, {
+            'sign': sign,
+            'uid': self.env.uid,
+            'line_ids': list(line_ids or []),
+            'account_ids': list(account_ids or []),
+            'tax_ids': list(tax_ids or []),
+        })
+        self.invalidate_model()
+
+    @api.model
+    def _compact(self):
+        """증감 행을 (세금, 월) 별 한 행으로 합치고 0 건 행 제거 (주기 작업)"""
+        self.flush_model()
+        self.env.cr.execute(f"""
+            WITH removed AS (
+                DELETE FROM custom_account_tax_balance
+                RETURNING tax_id, period, {', '.join(TAX_AMOUNT_FIELDS)}, line_count
+            )
+            INSERT INTO custom_account_tax_balance
+                   (tax_id, period, {', '.join(TAX_AMOUNT_FIELDS)}, line_count,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT tax_id, period, {', '.join(f'SUM({name})' for name in TAX_AMOUNT_FIELDS)}, SUM(line_count),
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM removed
+          GROUP BY tax_id, period
+            HAVING SUM(line_count) > 0
+        """, {'uid': self.env.uid})
+        self.invalidate_model()
+
+    @api.model
+    def rebuild(self):
+        """누계 테이블 전체 재집계"""
+        self.env.cr.execute("DELETE FROM custom_account_tax_balance")
+        self._apply(1)
+        _logger.info("Rebuilt tax balance table")
+        return True
+
+    @api.model
+    def get_totals(self, date_from, date_to, tax_ids=None):
+        """date_from ~ date_to 의 부가세 합계
+
+        기간 안의 온전한 달은 누계 행만 읽고, 월 중간에서 시작/끝나는
+        부분만 분개 라인에서 같은 규칙으로 집계해 더한다.
+        반환: {'sale_vat_amount', 'purchase_vat_amount', 'exempt_amount',
+        'zero_rated_amount', 'withholding_amount'}
+        """
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to)
+        # 누계 행으로 처리할 구간 [full_from, full_until)
+        full_from = date_from if date_from.day == 1 else (date_from.replace(day=28) + timedelta(days=4)).replace(day=1)
+        full_until = date_to + timedelta(days=1)
+        if full_until.day != 1:
+            full_until = date_to.replace(day=1)
+        if full_from >= full_until:
+            full_from = full_until = date_to + timedelta(days=1)
+        params = {
+            'date_from': date_from,
+            'date_to': date_to,
+            'full_from': full_from,
+            'full_until': full_until,
+            'tax_ids': list(tax_ids or []),
+        }
+        totals = dict.fromkeys(TAX_AMOUNT_FIELDS, 0.0)
+
+        if full_from < full_until:
+            self.flush_model()
+            self.env.cr.execute(f"""
+                SELECT {', '.join(f'COALESCE(SUM({name}), 0)' for name in TAX_AMOUNT_FIELDS)}
+                  FROM custom_account_tax_balance
+                 WHERE period >= %(full_from)s
+                   AND period < %(full_until)s
+                   {'AND tax_id = ANY(%(tax_ids)s)' if tax_ids else ''}
+            """, params)
+            for name, value in zip(TAX_AMOUNT_FIELDS, self.env.cr.fetchone()):
+                totals[name] += float(value)
+
+        if date_from < full_from or full_until <= date_to:
+            self._flush_sources()
+            self.env.cr.execute(f"""
+                SELECT {', '.join(f'COALESCE({expression}, 0)' for _name, expression in TAX_AMOUNT_AGGREGATES)}
+                  FROM ({self._line_amounts_query(
+                      "m.state = 'posted' AND m.date >= %(date_from)s AND m.date <= %(date_to)s"
+                      " AND (m.date < %(full_from)s OR m.date >= %(full_until)s)",
+                      't.id = ANY(%(tax_ids)s)' if tax_ids else 'TRUE')}) amounts
+            """, params)
+            for name, value in zip(TAX_AMOUNT_FIELDS, self.env.cr.fetchone()):
+                totals[name] += float(value)
+        return totals
+
+    @api.model
+    def get_quarter_to_date(self, as_of=None, tax_ids=None):
+        """as_of 가 속한 분기 시작일 ~ as_of 의 부가세 합계 (대시보드용)"""
+        as_of = fields.Date.to_date(as_of) if as_of else fields.Date.today()
+        date_from = as_of.replace(month=(as_of.month - 1) // 3 * 3 + 1, day=1)
+        return {
+            'date_from': fields.Date.to_string(date_from),
+            'date_to': fields.Date.to_string(as_of),
+            **self.get_totals(date_from, as_of, tax_ids),
+        }
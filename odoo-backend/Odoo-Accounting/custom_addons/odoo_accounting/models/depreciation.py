@@ -0,0 +1,159 @@
+"""감가상각 스케줄 계산 엔진
+
+자산 여러 건의 월별 감가상각액을 배열 단위로 한 번에 계산한다.
+NumPy 가 설치되어 있으면 (자산 x 월) 행렬 연산으로, 없으면 같은 계산을
+순수 파이썬으로 수행한다.
+
+- 정액법(linear): (취득가액 - 잔존가액) / 내용연수(월)
+- 정률법(degressive): 연 상각률 r = 1 - (잔존가액 / 취득가액) ^ (1 / 내용연수)
+  (잔존가액이 0 이면 이중체감법 r = 2 / 내용연수), 매년 기초 장부가액 x r 을
+  12개월로 나누어 상각하고 마지막 해에는 잔존가액까지 남은 금액을 상각한다.
+
+월별 금액은 원 단위 소수 둘째 자리로 반올림하고, 반올림 차이는 상각액이 있는
+마지막 달에 반영해 합계가 정확히 (취득가액 - 잔존가액) 이 되도록 한다.
+차이가 음수여도 상각액이 음수가 되는 회차는 만들지 않는다.
+감가상각은 취득월부터 시작하며 각 회차의 일자는 해당 월의 말일이다.
+"""
+import calendar
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 행렬 계산 시 한 번에 처리하는 자산 수 (메모리 사용량 제한)
+SCHEDULE_BATCH_SIZE = 2000
+
+
+def month_index(value):
+    """일자를 월 일련번호(year * 12 + month - 1)로 변환"""
+    return value.year * 12 + value.month - 1
+
+
+def month_end(index):
+    """월 일련번호의 말일"""
+    year, month = divmod(index, 12)
+    return date(year, month + 1, calendar.monthrange(year, month + 1)[1])
+
+
+def degressive_rate(value, residual_value, years):
+    """정률법 연 상각률"""
+    if value > 0 and 0 < residual_value < value:
+        return 1.0 - (residual_value / value) ** (1.0 / years)
+    return min(2.0 / years, 1.0)
+
+
+class Schedule:
+    """자산 한 건의 감가상각 스케줄 (start: 첫 회차 월 일련번호, amounts: 월별 상각액)"""
+    __slots__ = ('asset_id', 'start', 'amounts')
+
+    def __init__(self, asset_id, start, amounts):
+        self.asset_id = asset_id
+        self.start = start
+        self.amounts = amounts
+
+    def index_of(self, target_date):
+        """target_date 가 속한 회차 위치 (스케줄 범위를 벗어나면 -1 또는 len)"""
+        offset = month_index(target_date) - self.start
+        if offset < 0:
+            return -1
+        return min(offset, len(self.amounts))
+
+    def dates(self, start=0, stop=None):
+        stop = len(self.amounts) if stop is None else stop
+        return [month_end(self.start + offset) for offset in range(start, stop)]
+
+
+def _normalize(asset):
+    value = float(asset.get('value') or 0.0)
+    residual_value = min(float(asset.get('residual_value') or 0.0), value)
+    years = max(int(asset.get('useful_life') or 1), 1)
+    return value, residual_value, years
+
+
+def _settle(amounts, depreciable):
+    """반올림 차이를 상각액이 있는 마지막 회차에 반영 (음수가 되면 앞 회차로 넘김)"""
+    difference = round(depreciable - sum(amounts), 2)
+    if not difference:
+        return amounts
+    positions = [i for i in range(len(amounts) - 1, -1, -1) if amounts[i] > 0] or [len(amounts) - 1]
+    for i in positions:
+        adjusted = round(amounts[i] + difference, 2)
+        if adjusted >= 0:
+            amounts[i] = adjusted
+            break
+        amounts[i] = 0.0
+        difference = adjusted
+    return amounts
+
+
+def _compute_batch_numpy(assets):
+    count = len(assets)
+    values = np.empty(count)
+    residuals = np.empty(count)
+    years = np.empty(count, dtype=np.int64)
+    degressive = np.zeros(count, dtype=bool)
+    for i, asset in enumerate(assets):
+        values[i], residuals[i], years[i] = _normalize(asset)
+        degressive[i] = asset.get('depreciation_method') == 'degressive'
+    lives = years * 12
+    depreciable = values - residuals
+    months = np.arange(lives.max())[None, :]
+    active = months < lives[:, None]
+
+    # 정액법
+    amounts = np.where(active, (depreciable / lives)[:, None], 0.0)
+
+    # 정률법
+    if degressive.any():
+        rates = np.array([degressive_rate(values[i], residuals[i], years[i]) if degressive[i] else 0.0
+                          for i in range(count)])
+        year_of_month = months // 12
+        book_values = values[:, None] * (1.0 - rates[:, None]) ** year_of_month
+        declining = book_values * rates[:, None] / 12.0
+        last_year = year_of_month == (years - 1)[:, None]
+        declining = np.where(last_year, (book_values - residuals[:, None]) / 12.0, declining)
+        declining = np.where(active, np.clip(declining, 0.0, None), 0.0)
+        amounts = np.where(degressive[:, None], declining, amounts)
+
+    # np.round 는 .5 경계에서 파이썬 round 와 결과가 다를 수 있어 _compute_batch_python 과 같은 round 사용
+    return [
+        Schedule(asset['id'], month_index(asset['purchase_date']),
+                 _settle([round(amount, 2) for amount in amounts[i, :lives[i]].tolist()], depreciable[i].item()))
+        for i, asset in enumerate(assets)
+    ]
+
+
+def _compute_batch_python(assets):
+    schedules = []
+    for asset in assets:
+        value, residual_value, years = _normalize(asset)
+        life = years * 12
+        depreciable = value - residual_value
+        if asset.get('depreciation_method') == 'degressive':
+            rate = degressive_rate(value, residual_value, years)
+            amounts = []
+            for year in range(years):
+                book_value = value * (1.0 - rate) ** year
+                monthly = (book_value - residual_value) / 12.0 if year == years - 1 else book_value * rate / 12.0
+                amounts.extend([round(max(monthly, 0.0), 2)] * 12)
+        else:
+            amounts = [round(depreciable / life, 2)] * life
+        schedules.append(Schedule(asset['id'], month_index(asset['purchase_date']), _settle(amounts, depreciable)))
+    return schedules
+
+
+def compute_schedules(assets, batch_size=SCHEDULE_BATCH_SIZE):
+    """자산들의 전체 감가상각 스케줄 계산
+
+    assets: id, value, residual_value, useful_life, depreciation_method,
+    purchase_date 를 가진 dict 목록 (purchase_date 없는 자산은 제외)
+    반환: Schedule 리스트
+    """
+    assets = [asset for asset in assets if asset.get('purchase_date')]
+    compute = _compute_batch_numpy if np is not None else _compute_batch_python
+    schedules = []
+    for start in range(0, len(assets), batch_size):
+        schedules.extend(compute(assets[start:start + batch_size]))
+    return schedules
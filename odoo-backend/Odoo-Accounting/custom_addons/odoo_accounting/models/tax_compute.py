@@ -0,0 +1,114 @@
+"""세금 일괄 계산 엔진
+
+여러 라인(금액, 수량, 세금 목록)의 공급가액/세액/합계를 한 번에 계산한다.
+NumPy 가 설치되어 있으면 (라인, 세금) 쌍 단위 배열 연산으로, 없으면 같은
+계산을 순수 파이썬으로 수행한다.
+
+세금별 계산은 CustomAccountTax.compute_all 과 같다.
+- 정률(percent): 공급가액 기준이면 금액 x 세율 / 100,
+  공급대가 기준이면 금액 x 세율 / (100 + 세율)
+- 정액(fixed): 세율 x 수량
+- 세액은 세금별로 소수 둘째 자리에서 반올림하고, 면세 세금은 세액 0
+- 공급대가 기준 세금의 세액은 공급가액에서 차감된다
+
+라인에 세금이 여러 개면 각 세금을 라인 금액에 독립적으로 적용해 합산한다.
+"""
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 세금 계산에 필요한 값만 모은 불변 튜플
+TaxParams = namedtuple('TaxParams', ['percent', 'rate', 'inclusive', 'exempt'])
+
+
+def _compute_numpy(lines, params):
+    count = len(lines)
+    tax_ids = list(params)
+    position = {tax_id: i for i, tax_id in enumerate(tax_ids)}
+    rates = np.array([params[tax_id].rate for tax_id in tax_ids], dtype=float)
+    percent = np.array([params[tax_id].percent for tax_id in tax_ids], dtype=bool)
+    inclusive = np.array([params[tax_id].inclusive for tax_id in tax_ids], dtype=bool)
+    exempt = np.array([params[tax_id].exempt for tax_id in tax_ids], dtype=bool)
+
+    amounts = np.array([line[0] for line in lines], dtype=float)
+    quantities = np.array([line[1] for line in lines], dtype=float)
+    counts = np.array([len(line[2]) for line in lines], dtype=np.int64)
+    pair_line = np.repeat(np.arange(count), counts)
+    pair_tax = np.fromiter((position[tax_id] for line in lines for tax_id in line[2]),
+                           dtype=np.int64, count=int(counts.sum()))
+
+    pair_amount = amounts[pair_line]
+    pair_rate = rates[pair_tax]
+    pair_inclusive = inclusive[pair_tax]
+    taxes = np.where(
+        percent[pair_tax],
+        np.where(pair_inclusive, pair_amount * (pair_rate / (100.0 + pair_rate)), pair_amount * (pair_rate / 100.0)),
+        pair_rate * quantities[pair_line],
+    )
+    # np.round 는 .5 경계에서 파이썬 round 와 결과가 다를 수 있어 compute_tax 와 같은 round 사용
+    taxes = np.where(exempt[pair_tax], 0.0, np.array([round(tax, 2) for tax in taxes.tolist()], dtype=float))
+    deducted = np.where(pair_inclusive, taxes, 0.0)
+
+    line_tax = np.bincount(pair_line, weights=taxes, minlength=count)
+    line_base = amounts - np.bincount(pair_line, weights=deducted, minlength=count)
+    subtotal_base = np.bincount(pair_tax, weights=pair_amount - deducted, minlength=len(tax_ids))
+    subtotal_tax = np.bincount(pair_tax, weights=taxes, minlength=len(tax_ids))
+
+    results = [
+        {'base': base, 'tax': tax, 'total': total}
+        for base, tax, total in zip(np.round(line_base, 2).tolist(), np.round(line_tax, 2).tolist(),
+                                    np.round(line_base + line_tax, 2).tolist())
+    ]
+    subtotals = {
+        tax_id: {'base': base, 'tax': tax}
+        for tax_id, base, tax in zip(tax_ids, np.round(subtotal_base, 2).tolist(), np.round(subtotal_tax, 2).tolist())
+    }
+    return results, subtotals
+
+
+def _compute_python(lines, params):
+    results = []
+    subtotals = {tax_id: {'base': 0.0, 'tax': 0.0} for tax_id in params}
+    for amount, quantity, tax_ids in lines:
+        line_tax = 0.0
+        line_base = amount
+        for tax_id in tax_ids:
+            tax = params[tax_id]
+            if tax.exempt:
+                tax_amount = 0.0
+            elif not tax.percent:
+                tax_amount = round(tax.rate * quantity, 2)
+            elif tax.inclusive:
+                tax_amount = round(amount * (tax.rate / (100.0 + tax.rate)), 2)
+            else:
+                tax_amount = round(amount * (tax.rate / 100.0), 2)
+            deducted = tax_amount if tax.inclusive else 0.0
+            line_tax += tax_amount
+            line_base -= deducted
+            subtotals[tax_id]['base'] += amount - deducted
+            subtotals[tax_id]['tax'] += tax_amount
+        results.append({
+            'base': round(line_base, 2),
+            'tax': round(line_tax, 2),
+            'total': round(line_base + line_tax, 2),
+        })
+    for subtotal in subtotals.values():
+        subtotal['base'] = round(subtotal['base'], 2)
+        subtotal['tax'] = round(subtotal['tax'], 2)
+    return results, subtotals
+
+
+def compute_lines(lines, params):
+    """라인별 공급가액/세액/합계와 세금별 소계 계산
+
+    lines: (금액, 수량, 세금 id 목록) 튜플 리스트
+    params: {세금 id: TaxParams} (lines 에 쓰인 세금을 모두 포함해야 함)
+    반환: ([{'base', 'tax', 'total'}, ...], {세금 id: {'base', 'tax'}})
+    """
+    if not lines:
+        return [], {tax_id: {'base': 0.0, 'tax': 0.0} for tax_id in params}
+    compute = _compute_numpy if np is not None and params else _compute_python
+    return compute(lines, params)
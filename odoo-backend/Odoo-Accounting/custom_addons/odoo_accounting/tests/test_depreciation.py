@@ -0,0 +1,54 @@
+import random
+import unittest
+from datetime import date
+
+from odoo.tests.common import BaseCase
+
+from ..models import depreciation
+
+
+@unittest.skipIf(depreciation.np is None, "NumPy 가 설치되어 있지 않음")
+class TestDepreciationEngines(BaseCase):
+    """NumPy 경로와 순수 파이썬 경로가 같은 스케줄을 만드는지 확인"""
+
+    def _asset(self, asset_id, value, residual_value, useful_life, method):
+        return {
+            'id': asset_id,
+            'value': value,
+            'residual_value': residual_value,
+            'useful_life': useful_life,
+            'depreciation_method': method,
+            'purchase_date': date(2024, 1, 1),
+        }
+
+    def _both(self, assets):
+        numpy_schedules = depreciation._compute_batch_numpy(assets)
+        python_schedules = depreciation._compute_batch_python(assets)
+        for numpy_schedule, python_schedule in zip(numpy_schedules, python_schedules):
+            self.assertEqual(numpy_schedule.amounts, python_schedule.amounts, numpy_schedule.asset_id)
+        return python_schedules
+
+    def test_parity_random(self):
+        rng = random.Random(17)
+        assets = []
+        for asset_id in range(2000):
+            value = round(rng.uniform(0, 10000000), 2)
+            residual_value = rng.choice([0.0, round(rng.uniform(0, value), 2)])
+            assets.append(self._asset(asset_id, value, residual_value, rng.randint(1, 10),
+                                      rng.choice(['linear', 'degressive'])))
+        for asset, schedule in zip(assets, self._both(assets)):
+            self.assertAlmostEqual(sum(schedule.amounts), asset['value'] - asset['residual_value'], places=2)
+            self.assertGreaterEqual(min(schedule.amounts), 0.0)
+
+    def test_half_cent_boundary(self):
+        # 4453871.94 / 84 = 53022.285 (np.round 은 53022.28)
+        schedule, = self._both([self._asset(1, 4453871.94, 0.0, 7, 'linear')])
+        self.assertEqual(schedule.amounts[0], 53022.29)
+
+    def test_short_life_degressive_non_negative(self):
+        # 내용연수 2년 이하 이중체감법은 마지막 해 상각액이 0
+        assets = [self._asset(asset_id, value, 0.0, years, 'degressive')
+                  for asset_id, (value, years) in enumerate([(1000.55, 2), (999.99, 1), (12345.67, 2)])]
+        for asset, schedule in zip(assets, self._both(assets)):
+            self.assertGreaterEqual(min(schedule.amounts), 0.0)
+            self.assertAlmostEqual(sum(schedule.amounts), asset['value'], places=2)
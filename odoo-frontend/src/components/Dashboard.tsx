@@ -8,13 +8,7 @@ import {
   ArrowTrendingUpIcon,
   ArrowTrendingDownIcon
 } from '@heroicons/react/24/outline';
-import { 
-  getAccounts, 
-  getJournalEntries, 
-  getPartners, 
-  getAssets, 
-  getBudgets 
-} from '../services/api.ts';
+import { getDashboardSummary } from '../services/api.ts';
 
 interface DashboardStats {
   accounts: number;
@@ -24,6 +18,10 @@ interface DashboardStats {
   budgets: number;
   totalAssets: number;
   totalLiabilities: number;
+  monthDebit: number;
+  monthCredit: number;
+  assetBookValue: number;
+  budgetUtilisation: number;
 }
 
 const Dashboard: React.FC = () => {
@@ -35,36 +33,35 @@ const Dashboard: React.FC = () => {
     budgets: 0,
     totalAssets: 0,
     totalLiabilities: 0,
+    monthDebit: 0,
+    monthCredit: 0,
+    assetBookValue: 0,
+    budgetUtilisation: 0,
   });
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchDashboardData = async () => {
       try {
-        const [accountsRes, journalRes, partnersRes, assetsRes, budgetsRes] = await Promise.all([
-          getAccounts(),
-          getJournalEntries(),
-          getPartners(),
-          getAssets(),
-          getBudgets(),
-        ]);
-
-        const accounts = accountsRes.data || [];
-        const totalAssets = accounts
-          .filter(acc => acc.type === 'asset')
-          .reduce((sum, acc) => sum + (acc.id || 0), 0);
-        const totalLiabilities = accounts
-          .filter(acc => acc.type === 'liability')
-          .reduce((sum, acc) => sum + (acc.id || 0), 0);
+        // 건수/합계는 서버에서 집계한 요약 한 번으로 조회
+        const summaryRes = await getDashboardSummary();
+        const summary = summaryRes.data;
+        if (!summaryRes.success || !summary) {
+          throw new Error(summaryRes.error || summaryRes.message);
+        }
 
         setStats({
-          accounts: accounts.length,
-          journalEntries: (journalRes.data || []).length,
-          partners: (partnersRes.data || []).length,
-          assets: (assetsRes.data || []).length,
-          budgets: (budgetsRes.data || []).length,
-          totalAssets,
-          totalLiabilities,
+          accounts: summary.counts.accounts,
+          journalEntries: summary.counts.journal_entries,
+          partners: summary.counts.partners,
+          assets: summary.counts.assets,
+          budgets: summary.counts.budgets,
+          totalAssets: summary.balances.total_assets,
+          totalLiabilities: summary.balances.total_liabilities,
+          monthDebit: summary.this_month.debit,
+          monthCredit: summary.this_month.credit,
+          assetBookValue: summary.assets.book_value,
+          budgetUtilisation: summary.budget.utilisation,
         });
       } catch (error) {
         console.error('대시보드 데이터 로딩 실패:', error);
@@ -200,6 +197,28 @@ const Dashboard: React.FC = () => {
                 </div>
               </div>
             </div>
+            <div className="bg-gray-50 rounded-lg p-4">
+              <div className="flex items-center">
+                <DocumentTextIcon className="h-8 w-8 text-blue-500" />
+                <div className="ml-4">
+                  <p className="text-sm font-medium text-gray-500">이번 달 차변 / 대변</p>
+                  <p className="text-2xl font-semibold text-gray-900">
+                    ₩{stats.monthDebit.toLocaleString()} / ₩{stats.monthCredit.toLocaleString()}
+                  </p>
+                </div>
+              </div>
+            </div>
+            <div className="bg-gray-50 rounded-lg p-4">
+              <div className="flex items-center">
+                <BuildingOfficeIcon className="h-8 w-8 text-yellow-500" />
+                <div className="ml-4">
+                  <p className="text-sm font-medium text-gray-500">고정자산 장부가액 · 예산 집행률</p>
+                  <p className="text-2xl font-semibold text-gray-900">
+                    ₩{stats.assetBookValue.toLocaleString()} · {stats.budgetUtilisation.toLocaleString()}%
+                  </p>
+                </div>
+              </div>
+            </div>
           </div>
         </div>
       </div>
@@ -55,6 +55,8 @@ const JournalEntries: React.FC = () => {
   const [partnerSearchModes, setPartnerSearchModes] = useState<boolean[]>([false]);
   const [startDate, setStartDate] = useState('');
   const [endDate, setEndDate] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchData();
@@ -90,6 +92,7 @@ const JournalEntries: React.FC = () => {
 
       if (entriesResponse.success) {
         setEntries(entriesResponse.data || []);
+        setNextCursor(entriesResponse.next_cursor || null);
       }
 
       if (accountsResponse.success) {
@@ -105,6 +108,23 @@ const JournalEntries: React.FC = () => {
     }
   };
 
+  // 다음 페이지(next_cursor) 분개장을 이어서 조회
+  const loadMoreEntries = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const response = await getJournalEntries({ cursor: nextCursor });
+      if (response.success) {
+        setEntries(prev => [...prev, ...(response.data || [])]);
+        setNextCursor(response.next_cursor || null);
+      }
+    } catch (error) {
+      console.error('분개장 추가 조회 실패:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const resetForm = () => {
     setFormData({
       name: '',
@@ -493,6 +513,18 @@ const JournalEntries: React.FC = () => {
             </tbody>
           </table>
         </div>
+        {nextCursor && (
+          <div className="flex justify-center py-4 border-t border-gray-200">
+            <button
+              type="button"
+              onClick={loadMoreEntries}
+              disabled={loadingMore}
+              className="px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50"
+            >
+              {loadingMore ? '불러오는 중...' : '더 보기'}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* 분개장 생성/수정 모달 */}
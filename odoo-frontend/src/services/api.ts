@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { ApiResponse, Account, JournalEntry, Partner, Asset, Budget, Currency, Tax, TaxCalculation, TaxReport } from '../types';
+import { ApiResponse, Account, AccountTreeNode, JournalEntry, Partner, Asset, Budget, Currency, Tax, TaxCalculation, TaxReport, Job, JobAccepted, DashboardSummary } from '../types';
 
 const API_BASE_URL = '/api/accounting';
 
@@ -74,6 +74,18 @@ export const getAccounts = async (): Promise<ApiResponse<Account[]>> => {
   }
 };
 
+export const getAccountTree = async (rootId?: number): Promise<ApiResponse<AccountTreeNode[]>> => {
+  try {
+    console.log('API 호출 - getAccountTree: GET /accounts/tree', rootId);
+    const response = await api.get('/accounts/tree', { params: rootId ? { root_id: rootId } : undefined });
+    console.log('API 응답 - getAccountTree:', response.data);
+    return response.data;
+  } catch (error) {
+    console.error('getAccountTree 에러:', error);
+    return { success: false, message: '계정과목 계층 구조 조회 실패' };
+  }
+};
+
 export const createAccount = async (account: Partial<Account>): Promise<ApiResponse<Account>> => {
   try {
     console.log('API 호출 - createAccount: POST /accounts', account);
@@ -111,10 +123,10 @@ export const deleteAccount = async (id: number): Promise<ApiResponse> => {
 };
 
 // 분개장 API
-export const getJournalEntries = async (): Promise<ApiResponse<JournalEntry[]>> => {
+export const getJournalEntries = async (params?: { limit?: number; cursor?: string }): Promise<ApiResponse<JournalEntry[]>> => {
   try {
-    console.log('API 호출 - getJournalEntries: GET /journal-entries');
-    const response = await api.get('/journal-entries');
+    console.log('API 호출 - getJournalEntries: GET /journal-entries', params);
+    const response = await api.get('/journal-entries', { params });
     console.log('API 응답 - getJournalEntries:', response.data);
     return response.data;
   } catch (error) {
@@ -172,6 +184,26 @@ export const getPartners = async (): Promise<ApiResponse<Partner[]>> => {
   }
 };
 
+export const searchPartners = async (
+  query: string,
+  options: { type?: Partner['type'][]; includeInactive?: boolean; limit?: number } = {}
+): Promise<ApiResponse<Partner[]>> => {
+  try {
+    const response = await api.get('/partners/search', {
+      params: {
+        q: query,
+        type: options.type?.join(','),
+        include_inactive: options.includeInactive ? 'true' : undefined,
+        limit: options.limit,
+      },
+    });
+    return response.data;
+  } catch (error) {
+    console.error('searchPartners 에러:', error);
+    return { success: false, message: '거래처 검색 실패' };
+  }
+};
+
 export const createPartner = async (partner: Partial<Partner>): Promise<ApiResponse<Partner>> => {
   try {
     console.log('API 호출 - createPartner: POST /partners', partner);
@@ -386,10 +418,14 @@ export const deleteTaxReport = async (id: number): Promise<ApiResponse> => {
   }
 };
 
-export const generateTaxReportData = async (id: number): Promise<ApiResponse<TaxReport>> => {
+// 신고서 데이터 생성은 백그라운드 작업으로 접수되므로 완료될 때까지 기다림
+export const generateTaxReportData = async (id: number): Promise<ApiResponse<Job>> => {
   try {
     const response = await api.post(`/tax-reports/${id}/generate`);
-    return response.data;
+    if (!response.data?.success) {
+      return response.data;
+    }
+    return await waitForJob(response.data.data.job_id);
   } catch (error) {
     return { success: false, message: '신고서 데이터 생성 실패' };
   }
@@ -405,6 +441,17 @@ export const getBudgets = async (): Promise<ApiResponse<Budget[]>> => {
   }
 };
 
+// 대시보드 API
+export const getDashboardSummary = async (): Promise<ApiResponse<DashboardSummary>> => {
+  try {
+    const response = await api.get('/dashboard/summary');
+    return response.data;
+  } catch (error) {
+    console.error('getDashboardSummary 에러:', error);
+    return { success: false, message: '대시보드 요약 조회 실패' };
+  }
+};
+
 // 통화 API
 export const getCurrencies = async (): Promise<ApiResponse<Currency[]>> => {
   try {
@@ -415,6 +462,47 @@ export const getCurrencies = async (): Promise<ApiResponse<Currency[]>> => {
   }
 };
 
+// 백그라운드 작업 API
+export const getJob = async (id: number): Promise<ApiResponse<Job>> => {
+  try {
+    const response = await api.get(`/jobs/${id}`);
+    return response.data;
+  } catch (error) {
+    return { success: false, message: '작업 조회 실패' };
+  }
+};
+
+export const createJob = async (jobType: Job['job_type'], params: Record<string, any> = {}): Promise<ApiResponse<JobAccepted>> => {
+  try {
+    const response = await api.post('/jobs', { job_type: jobType, params });
+    return response.data;
+  } catch (error) {
+    return { success: false, message: '작업 등록 실패' };
+  }
+};
+
+// 작업이 끝날 때까지 주기적으로 상태 조회 (onProgress 로 진행률 전달)
+export const waitForJob = async (
+  id: number,
+  onProgress?: (job: Job) => void,
+  intervalMs = 1000,
+): Promise<ApiResponse<Job>> => {
+  for (;;) {
+    const res = await getJob(id);
+    if (!res.success || !res.data) {
+      return res;
+    }
+    onProgress?.(res.data);
+    if (res.data.state === 'done') {
+      return res;
+    }
+    if (res.data.state === 'failed') {
+      return { success: false, data: res.data, message: res.data.error || '작업 실패' };
+    }
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+};
+
 export const runAutoJournalEntries = async (rules: any[]): Promise<ApiResponse<any[]>> => {
   try {
     const response = await api.post('/auto-journal-entries', { rules });
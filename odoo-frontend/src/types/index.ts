@@ -4,6 +4,7 @@ export interface ApiResponse<T = any> {
   data?: T;
   error?: string;
   message?: string;
+  next_cursor?: string | null;
 }
 
 // 계정과목 타입
@@ -16,6 +17,16 @@ export interface Account {
   parent_name?: string;
 }
 
+// 계정과목 계층 구조 노드
+export interface AccountTreeNode {
+  id: number;
+  code: string;
+  name: string;
+  type: Account['type'];
+  parent_id: number | null;
+  children: AccountTreeNode[];
+}
+
 // 분개장 타입
 export interface JournalEntry {
   id: number;
@@ -50,6 +61,7 @@ export interface Partner {
   type: 'customer' | 'supplier' | 'both';
   email?: string;
   phone?: string;
+  vat?: string;
   active: boolean;
 }
 
@@ -143,4 +155,68 @@ export interface TaxReportDetail {
   amount: number;
   tax_amount: number;
   description?: string;
-} 
\ No newline at end of file
+}
+
+// 백그라운드 작업 타입
+export interface Job {
+  id: number;
+  name: string;
+  job_type: 'depreciation_run' | 'tax_report_generate' | 'import' | 'balance_rebuild' | 'tax_balance_rebuild';
+  state: 'queued' | 'running' | 'done' | 'failed';
+  progress: number; // 진행률 (%)
+  result?: any;
+  error?: string | null;
+  created_at?: string | null;
+  started_at?: string | null;
+  finished_at?: string | null;
+}
+
+// 작업 접수 응답 (202)
+export interface JobAccepted {
+  job_id: number;
+  state: string;
+  status_url: string;
+}
+
+// 대시보드 요약 타입
+export interface DashboardSummary {
+  as_of: string;
+  counts: {
+    accounts: number;
+    journal_entries: number;
+    partners: number;
+    assets: number;
+    budgets: number;
+  };
+  journal_entries: {
+    posted_count: number;
+    posted_amount: number;
+    draft_count: number;
+    draft_amount: number;
+  };
+  this_month: {
+    period: string;
+    debit: number;
+    credit: number;
+  };
+  balances: {
+    total_assets: number;
+    total_liabilities: number;
+  };
+  assets: {
+    value: number;
+    book_value: number;
+  };
+  budget: {
+    active_count: number;
+    amount: number;
+    spent: number;
+    utilisation: number; // 집행률 (%)
+  };
+  vat_quarter_to_date: {
+    date_from: string;
+    sale_vat_amount: number;
+    purchase_vat_amount: number;
+    vat_payable: number;
+  };
+}